@@ -11,9 +11,35 @@ import logging
 import os
 from typing import List, Optional
 
+try:
+    # Optional: encodes and decodes JSON in C, several times faster than the
+    # json module's indented writer
+    import msgspec
+except ImportError:
+    msgspec = None
+
 logger = logging.getLogger(__name__)
 
 
+def _write_json(data, path):
+    """Write data to path as UTF-8 JSON indented by two spaces."""
+    if msgspec is not None:
+        with open(path, 'wb') as f:
+            f.write(msgspec.json.format(msgspec.json.encode(data), indent=2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _read_json(path):
+    """Read a UTF-8 JSON file."""
+    if msgspec is not None:
+        with open(path, 'rb') as f:
+            return msgspec.json.decode(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class AnnotationExporter:
     """Handles exporting and importing annotations with 3D model files."""
     
@@ -53,8 +79,7 @@ class AnnotationExporter:
                 'annotations': annotations,
             }
             
-            with open(annotation_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_json(data, annotation_path)
             
             logger.info(f"Saved {len(annotations)} annotations to {annotation_path}")
             return True, annotation_path
@@ -79,8 +104,7 @@ class AnnotationExporter:
             return None, "No annotation file found"
         
         try:
-            with open(annotation_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(annotation_path)
             
             annotations = data.get('annotations', [])
             logger.info(f"Loaded {len(annotations)} annotations from {annotation_path}")
@@ -114,11 +114,10 @@ class IgesLoader:
                 if len(points_list) > 0:
                     # Add points
                     all_points.extend(points_list)
-                    # Add faces with global point offset
-                    for face in faces_list:
-                        # Create new face array with offset indices
-                        offset_face = [face[0], face[1] + point_offset, face[2] + point_offset, face[3] + point_offset]
-                        all_faces.append(offset_face)
+                    # Add faces with global point offset, shifting all indices at once
+                    offset_faces = np.array(faces_list, dtype=np.int64).reshape(-1, 4)
+                    offset_faces[:, 1:] += point_offset
+                    all_faces.append(offset_faces)
                     point_offset += len(points_list)
                     logger.debug(f"IgesLoader: Extracted {len(points_list)} points, {len(faces_list)} faces from shape {i}")
             
@@ -127,8 +126,8 @@ class IgesLoader:
                 return None
             
             # Create PyVista mesh
-            points_array = np.array(all_points, dtype=np.float64)
-            faces_array = np.array(all_faces, dtype=np.int32)
+            points_array = np.array(all_points, dtype=np.float32)
+            faces_array = np.concatenate(all_faces).astype(np.int32)
             
             pv_mesh = pv.PolyData(points_array, faces_array)
             
@@ -1,12 +1,170 @@
 """
 Mesh analysis and calculation utilities.
 """
+import functools
+import itertools
 import logging
+import multiprocessing
+import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pyvista as pv
 
 logger = logging.getLogger(__name__)
 
+# get_mesh_data results keyed by id() of live meshes
+_mesh_data_cache = {}
+
+
+def _make_tetrahedron_sum(loop_range):
+    """
+    Build the signed tetrahedron volume sum as a scalar loop for Numba.
+    
+    Each triple product stays in registers, so unlike the NumPy version no
+    (n, 3) temporaries are allocated. The loop runs over loop_range: range
+    for the plain Python function, numba.prange for the parallel kernel.
+    
+    Returns:
+        callable: tetrahedron_sum(points, triangles) -> signed volume
+    """
+    def tetrahedron_sum(points, triangles):
+        total = 0.0
+        for i in loop_range(triangles.shape[0]):
+            a = triangles[i, 0]
+            b = triangles[i, 1]
+            c = triangles[i, 2]
+            ax, ay, az = points[a, 0], points[a, 1], points[a, 2]
+            bx, by, bz = points[b, 0], points[b, 1], points[b, 2]
+            cx, cy, cz = points[c, 0], points[c, 1], points[c, 2]
+            total += (ax * (by * cz - bz * cy)
+                      + ay * (bz * cx - bx * cz)
+                      + az * (bx * cy - by * cx))
+        return total / 6.0
+    
+    return tetrahedron_sum
+
+
+# Interpreted reference for the Numba kernel; far slower than NumPy
+_signed_tetrahedron_sum = _make_tetrahedron_sum(range)
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_tetrahedron_kernel():
+    """
+    Compile the tetrahedron sum with Numba, if it is installed.
+    
+    Numba is only imported on the first call, keeping it out of application
+    start-up. The loop is built with numba.prange so it runs in parallel, and
+    the compiled code is cached on disk between runs.
+    
+    Returns:
+        callable: kernel(points, triangles) -> signed volume, or None if
+            Numba is not available
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    
+    try:
+        return numba.njit(parallel=True, fastmath=True, cache=True)(
+            _make_tetrahedron_sum(numba.prange)
+        )
+    except Exception as e:
+        # e.g. no writable cache location in a bundled build
+        logger.debug(f"Numba tetrahedron kernel unavailable: {e}")
+        return None
+
+
+def _triangle_mesh_stats(mesh):
+    """
+    Measure an all-triangle surface mesh in one vectorized pass.
+    
+    Bounds come from the points, area from the triangle cross products and
+    volume from the signed tetrahedra those triangles form with the origin,
+    so the triangle array is gathered once instead of once per property.
+    
+    Args:
+        mesh: PyVista mesh object
+        
+    Returns:
+        tuple: ((width, height, depth), volume_mm3, surface_area_mm2), or None
+            if the mesh is not a PolyData made only of triangles
+    """
+    if not isinstance(mesh, pv.PolyData) or mesh.n_points == 0 or len(mesh.faces) == 0:
+        return None
+    if not mesh.is_all_triangles:
+        return None
+    
+    points = np.asarray(mesh.points, dtype=np.float64)
+    triangles = points[mesh.faces.reshape(-1, 4)[:, 1:]]  # (n_triangles, 3, 3)
+    v0, v1, v2 = triangles[:, 0], triangles[:, 1], triangles[:, 2]
+    
+    extent = points.max(axis=0) - points.min(axis=0)
+    surface_area = 0.5 * np.linalg.norm(np.cross(v1 - v0, v2 - v0), axis=1).sum()
+    volume = abs(np.einsum('ij,ij->i', v0, np.cross(v1, v2)).sum()) / 6.0
+    
+    return (float(extent[0]), float(extent[1]), float(extent[2])), float(volume), float(surface_area)
+
+
+def _pyvista_volume(mesh):
+    """PyVista's own volume, letting errors reach the caller."""
+    return mesh.volume
+
+
+def _run_volume_method(mesh, method, target_volume, corners=None):
+    """
+    Run one entry of MeshCalculator._volume_methods on a mesh.
+    
+    corners, if given, is MeshCalculator.triangle_corners(mesh) and is passed
+    on to the methods that accept it.
+    
+    Returns:
+        tuple: (result key, result dict as described in
+            calculate_volume_multiple_methods)
+    """
+    key, name, func, kwargs, takes_corners = method
+    if takes_corners and corners is not None:
+        kwargs = dict(kwargs, corners=corners)
+    try:
+        vol = func(mesh, **kwargs)
+        return key, {
+            'volume': vol,
+            'method': name,
+            'diff_from_target': abs(vol - target_volume) if target_volume else None
+        }
+    except Exception as e:
+        return key, {
+            'volume': 0.0,
+            'method': name,
+            'error': str(e),
+            'diff_from_target': None
+        }
+
+
+# Mesh rebuilt once per worker process by _init_volume_worker, and its
+# triangle corners once the worker first runs a method that uses them
+_worker_mesh = None
+_worker_corners = None
+
+
+def _init_volume_worker(points, faces):
+    """ProcessPoolExecutor initializer: build the mesh the worker measures."""
+    global _worker_mesh
+    _worker_mesh = pv.PolyData(points, faces)
+
+
+def _run_volume_method_in_worker(method, target_volume):
+    """Run a volume method on this worker's mesh."""
+    global _worker_corners
+    if method[4] and _worker_corners is None:
+        try:
+            _worker_corners = MeshCalculator.triangle_corners(_worker_mesh)
+        except Exception as e:
+            logger.warning(f"Could not gather triangle corners: {e}")
+    return _run_volume_method(_worker_mesh, method, target_volume, _worker_corners)
+
 
 class MeshCalculator:
     """Handles mesh analysis and calculations."""
@@ -51,7 +209,8 @@ class MeshCalculator:
         Returns:
             float: Volume in mm³, or 0.0 if calculation fails
         """
-        if mesh is None:
+        # Look the property up on the class: hasattr(mesh, ...) would compute it
+        if mesh is None or not hasattr(type(mesh), 'volume'):
             return 0.0
         
         try:
@@ -72,7 +231,8 @@ class MeshCalculator:
         Returns:
             dict: Dictionary with 'mm2' and 'cm2' surface area values
         """
-        if mesh is None:
+        # Look the property up on the class: hasattr(mesh, ...) would compute it
+        if mesh is None or not hasattr(type(mesh), 'area'):
             return {
                 'mm2': 0.0,
                 'cm2': 0.0
@@ -116,17 +276,49 @@ class MeshCalculator:
         # Calculate weight: weight = volume * density
         weight_grams = volume_cm3 * density_g_per_cm3
         
-        # Format display string
-        if weight_grams >= 1000:
-            display = f"{weight_grams / 1000:.3f} kg"
-        else:
-            display = f"{weight_grams:.2f} g"
-        
         return {
             'grams': weight_grams,
-            'display': display
+            'display': MeshCalculator.format_weight(weight_grams)
         }
     
+    @staticmethod
+    def estimate_weights(volume_mm3, densities_g_per_cm3):
+        """
+        Estimate weight for several material densities in one pass.
+        
+        Args:
+            volume_mm3: Volume in mm³
+            densities_g_per_cm3: Array-like of material densities in g/cm³
+            
+        Returns:
+            numpy.ndarray: Weight in grams per density, 0.0 where the volume
+                or density is not positive
+        """
+        densities = np.asarray(densities_g_per_cm3, dtype=np.float64)
+        if volume_mm3 <= 0:
+            return np.zeros_like(densities)
+        
+        weights = densities * (volume_mm3 / 1000.0)
+        weights[densities <= 0] = 0.0
+        return weights
+    
+    @staticmethod
+    def format_weight(weight_grams):
+        """
+        Format a weight for display.
+        
+        Args:
+            weight_grams: Weight in grams
+            
+        Returns:
+            str: Weight in g, or kg from 1000 g up; '--' if not positive
+        """
+        if weight_grams <= 0:
+            return '--'
+        if weight_grams >= 1000:
+            return f"{weight_grams / 1000:.3f} kg"
+        return f"{weight_grams:.2f} g"
+    
     @staticmethod
     def calculate_volume_convex_hull(mesh):
         """
@@ -151,8 +343,8 @@ class MeshCalculator:
                 if convex_mesh.n_cells > 0:
                     volume = convex_mesh.volume
                     return volume
-            except:
-                pass
+            except Exception as e:
+                logger.debug(f"Delaunay 3D triangulation failed: {e}")
             
             # Fallback: use bounding box as upper bound estimate
             bounds = mesh.bounds
@@ -166,23 +358,106 @@ class MeshCalculator:
             return 0.0
     
     @staticmethod
-    def calculate_volume_voxel(mesh, density=100):
+    def calculate_volume_voxel(mesh, density=100, corners=None):
         """
-        Calculate volume using voxel-based discretization (simplified Monte Carlo approach).
-        Note: Full voxelization requires mesh.contains() which PyVista PolyData doesn't have.
-        This method is a placeholder - returns 0.0 to indicate not implemented.
+        Calculate volume by casting one vertical ray through each voxel column.
+        
+        The XY extent of the mesh is divided into square columns, `density` of
+        them along the longer side. Each triangle is only tested against the
+        columns its XY bounding box covers, so crossings are found without
+        testing every column against every triangle. Sorted by height, the
+        crossings in a column alternate between entering and leaving the
+        solid, which gives the filled length of the column. Assumes a closed
+        surface; columns with an odd number of crossings are skipped.
         
         Args:
             mesh: PyVista mesh object
-            density: Voxel grid density (points per unit) - unused for now
+            density: Number of voxel columns along the longer XY side
+            corners: Optional result of triangle_corners(mesh), to share it
+                between calls on the same mesh
             
         Returns:
-            float: Volume in mm³, or 0.0 if calculation fails/not implemented
+            float: Volume in mm³, or 0.0 if calculation fails
         """
-        # PyVista PolyData doesn't have easy voxelization or contains() method
-        # For proper voxelization, would need trimesh or other library
-        # Returning 0.0 as placeholder - will be skipped in comparison
-        return 0.0
+        if mesh is None or mesh.n_points == 0 or len(mesh.faces) == 0:
+            return 0.0
+        
+        try:
+            triangles = MeshCalculator.triangle_corners(mesh) if corners is None else corners
+            if len(triangles) == 0:
+                return 0.0
+            
+            xmin, ymin = triangles[:, :, 0].min(), triangles[:, :, 1].min()
+            x_extent = triangles[:, :, 0].max() - xmin
+            y_extent = triangles[:, :, 1].max() - ymin
+            cell = max(x_extent, y_extent) / density
+            if cell <= 0:
+                return 0.0
+            nx = max(int(np.ceil(x_extent / cell)), 1)
+            ny = max(int(np.ceil(y_extent / cell)), 1)
+            
+            # First column centre, nudged off the exact half cell so rays rarely
+            # run precisely through the shared edges and vertices of triangles
+            x0 = xmin + cell * (0.5 + 1e-4)
+            y0 = ymin + cell * (0.5 + 2e-4)
+            
+            hit_columns = []
+            hit_heights = []
+            batch_size = 65536
+            for start in range(0, len(triangles), batch_size):
+                tri = triangles[start:start + batch_size]
+                
+                # Range of column indices whose centres lie in each triangle's XY box
+                i0 = np.clip(np.ceil((tri[:, :, 0].min(axis=1) - x0) / cell), 0, nx).astype(np.int64)
+                i1 = np.clip(np.floor((tri[:, :, 0].max(axis=1) - x0) / cell), -1, nx - 1).astype(np.int64)
+                j0 = np.clip(np.ceil((tri[:, :, 1].min(axis=1) - y0) / cell), 0, ny).astype(np.int64)
+                j1 = np.clip(np.floor((tri[:, :, 1].max(axis=1) - y0) / cell), -1, ny - 1).astype(np.int64)
+                ci = np.maximum(i1 - i0 + 1, 0)
+                cj = np.maximum(j1 - j0 + 1, 0)
+                counts = ci * cj
+                if counts.sum() == 0:
+                    continue
+                
+                # One (triangle, column) candidate pair per covered column
+                pair_tri = np.repeat(np.arange(len(tri)), counts)
+                local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                pair_ci = ci[pair_tri]
+                col_i = i0[pair_tri] + local % pair_ci
+                col_j = j0[pair_tri] + local // pair_ci
+                px = x0 + col_i * cell
+                py = y0 + col_j * cell
+                
+                # Barycentric coordinates of the column centre in the projected triangle
+                a, b, c = tri[pair_tri, 0], tri[pair_tri, 1], tri[pair_tri, 2]
+                denom = (b[:, 1] - c[:, 1]) * (a[:, 0] - c[:, 0]) + (c[:, 0] - b[:, 0]) * (a[:, 1] - c[:, 1])
+                vertical = denom == 0
+                denom[vertical] = 1.0
+                w0 = ((b[:, 1] - c[:, 1]) * (px - c[:, 0]) + (c[:, 0] - b[:, 0]) * (py - c[:, 1])) / denom
+                w1 = ((c[:, 1] - a[:, 1]) * (px - c[:, 0]) + (a[:, 0] - c[:, 0]) * (py - c[:, 1])) / denom
+                w2 = 1.0 - w0 - w1
+                hit = ~vertical & (w0 >= 0) & (w1 >= 0) & (w2 >= 0)
+                
+                hit_columns.append((col_j * nx + col_i)[hit])
+                hit_heights.append((w0 * a[:, 2] + w1 * b[:, 2] + w2 * c[:, 2])[hit])
+            
+            if not hit_columns:
+                return 0.0
+            columns = np.concatenate(hit_columns)
+            heights = np.concatenate(hit_heights)
+            
+            # Sort crossings by column, then height; alternate exit minus entry
+            order = np.lexsort((heights, columns))
+            columns = columns[order]
+            heights = heights[order]
+            _, first, count = np.unique(columns, return_index=True, return_counts=True)
+            rank = np.arange(len(columns)) - np.repeat(first, count)
+            signed = np.where(rank % 2 == 1, heights, -heights)
+            even = np.repeat(count % 2 == 0, count)
+            
+            return float(signed[even].sum()) * cell * cell
+        except Exception as e:
+            logger.warning(f"Failed to calculate voxel volume: {e}")
+            return 0.0
     
     @staticmethod
     def calculate_volume_repair(mesh, hole_size=None):
@@ -223,13 +498,99 @@ class MeshCalculator:
             return 0.0
     
     @staticmethod
-    def calculate_volume_manual_tetrahedron(mesh, reference_point='origin'):
+    def triangle_corners(mesh):
+        """
+        Gather the corner positions of every triangle of a mesh.
+        
+        Methods that work on whole triangles can be handed this array instead
+        of each gathering it from the point and face arrays again.
+        
+        Args:
+            mesh: PyVista mesh object; other polygons are triangulated first
+            
+        Returns:
+            numpy.ndarray: (n_triangles, 3, 3) float64 array, empty if the
+                mesh has no faces
+        """
+        if mesh is None or mesh.n_points == 0 or len(mesh.faces) == 0:
+            return np.empty((0, 3, 3))
+        surface = mesh if mesh.is_all_triangles else mesh.triangulate()
+        points = np.asarray(surface.points, dtype=np.float64)
+        return points[surface.faces.reshape(-1, 4)[:, 1:]]
+    
+    @staticmethod
+    def signed_tetrahedron_volume(points, triangles, reference=None):
+        """
+        Sum the signed volumes of the tetrahedra the triangles form with a point.
+        
+        For a closed, consistently oriented surface the sum is the enclosed
+        volume (negative if the triangles face inwards). All triangles are
+        handled at once with NumPy instead of one at a time.
+        
+        Args:
+            points: (n_points, 3) array of vertex positions
+            triangles: (n_triangles, 3) array of point indices
+            reference: Optional apex point shared by all tetrahedra (origin if None)
+            
+        Returns:
+            float: Signed volume in mm³
+        """
+        points = np.asarray(points, dtype=np.float64)
+        return MeshCalculator.signed_corner_volume(points[triangles], reference)
+    
+    @staticmethod
+    def signed_corner_volume(corners, reference=None):
+        """
+        Signed tetrahedron volume sum from per-triangle corner positions.
+        
+        Args:
+            corners: (n_triangles, 3, 3) array, as returned by triangle_corners
+            reference: Optional apex point shared by all tetrahedra (origin if None)
+            
+        Returns:
+            float: Signed volume in mm³
+        """
+        corners = np.asarray(corners, dtype=np.float64)
+        if reference is not None:
+            corners = corners - np.asarray(reference, dtype=np.float64)
+        v0, v1, v2 = corners[:, 0], corners[:, 1], corners[:, 2]
+        # Scalar triple product v0 . (v1 x v2) per triangle
+        return float(np.einsum('ij,ij->i', v0, np.cross(v1, v2)).sum()) / 6.0
+    
+    @staticmethod
+    def calculate_volume_tetrahedron_numba(mesh):
+        """
+        Calculate volume with the Numba-compiled signed tetrahedron kernel.
+        
+        Args:
+            mesh: PyVista mesh object made of triangles
+            
+        Returns:
+            float: Volume in mm³, or 0.0 if the mesh is empty
+            
+        Raises:
+            RuntimeError: If Numba is not installed
+        """
+        kernel = _numba_tetrahedron_kernel()
+        if kernel is None:
+            raise RuntimeError("numba is not installed")
+        if mesh is None or len(mesh.faces) == 0:
+            return 0.0
+        
+        points = np.ascontiguousarray(mesh.points, dtype=np.float64)
+        triangles = np.ascontiguousarray(mesh.faces.reshape(-1, 4)[:, 1:4], dtype=np.int64)
+        return abs(kernel(points, triangles))
+    
+    @staticmethod
+    def calculate_volume_manual_tetrahedron(mesh, reference_point='origin', corners=None):
         """
         Calculate volume using manual signed tetrahedron method.
         
         Args:
             mesh: PyVista mesh object
             reference_point: 'origin' (0,0,0), 'centroid' (mesh center), or custom point
+            corners: Optional result of triangle_corners(mesh), used instead of
+                the mesh's point and face arrays
             
         Returns:
             float: Volume in mm³, or 0.0 if calculation fails
@@ -240,48 +601,103 @@ class MeshCalculator:
         try:
             # Get reference point
             if reference_point == 'origin':
-                ref = np.array([0.0, 0.0, 0.0])
+                ref = None
             elif reference_point == 'centroid':
                 ref = np.array(mesh.center)
             else:
                 ref = np.array(reference_point)
             
-            # Get mesh points and faces
-            points = np.array(mesh.points)
-            faces = mesh.faces
+            if corners is not None:
+                return abs(MeshCalculator.signed_corner_volume(corners, ref))
             
             # Extract triangles from face array
             # PyVista faces format: [n, v1, v2, v3, n, v1, v2, v3, ...]
+            faces = mesh.faces
             if len(faces) == 0:
                 return 0.0
             
             # Reshape faces array (assuming triangular faces)
-            num_faces = len(faces) // 4
-            if num_faces == 0:
-                return 0.0
-            
             triangles = faces.reshape(-1, 4)[:, 1:4]  # Skip first element (n), get v1,v2,v3
             
-            total_volume = 0.0
-            for triangle in triangles:
-                v1 = points[triangle[0]]
-                v2 = points[triangle[1]]
-                v3 = points[triangle[2]]
-                
-                # Signed volume of tetrahedron: (1/6) * |det([v1-ref, v2-ref, v3-ref])|
-                # Using scalar triple product: (1/6) * dot(v1-ref, cross(v2-ref, v3-ref))
-                v1_ref = v1 - ref
-                v2_ref = v2 - ref
-                v3_ref = v3 - ref
-                
-                vol = np.dot(v1_ref, np.cross(v2_ref, v3_ref)) / 6.0
-                total_volume += vol
-            
-            return abs(total_volume)
+            return abs(MeshCalculator.signed_tetrahedron_volume(mesh.points, triangles, ref))
         except Exception as e:
             logger.warning(f"Failed to calculate manual tetrahedron volume: {e}")
             return 0.0
     
+    @staticmethod
+    def partition_triangles(points, triangles, nx=4, ny=4):
+        """
+        Split a triangle mesh into an nx × ny grid of tiles in the XY plane.
+        
+        Each triangle goes to the tile containing its centroid, so every
+        triangle lands in exactly one tile. Tiles are sorted out with one
+        argsort, and each one only carries the points its triangles use.
+        
+        Args:
+            points: (n_points, 3) array of vertex positions
+            triangles: (n_triangles, 3) array of point indices
+            nx, ny: Number of tiles along X and Y
+            
+        Yields:
+            tuple: (tile_points, tile_triangles) for each non-empty tile, with
+                tile_triangles indexing into tile_points
+        """
+        points = np.asarray(points)
+        triangles = np.asarray(triangles)
+        if len(triangles) == 0:
+            return
+        
+        lo = points[:, :2].min(axis=0)
+        size = np.maximum(points[:, :2].max(axis=0) - lo, 1e-12)
+        # Centroid x and y only; the mean of each triangle's corners
+        cx = points[triangles, 0].mean(axis=1)
+        cy = points[triangles, 1].mean(axis=1)
+        ix = np.clip(((cx - lo[0]) / size[0] * nx).astype(np.int64), 0, nx - 1)
+        iy = np.clip(((cy - lo[1]) / size[1] * ny).astype(np.int64), 0, ny - 1)
+        tile = ix * ny + iy
+        
+        order = np.argsort(tile, kind='stable')
+        starts = np.searchsorted(tile[order], np.arange(nx * ny + 1))
+        for start, stop in zip(starts[:-1], starts[1:]):
+            if start == stop:
+                continue
+            tile_triangles = triangles[order[start:stop]]
+            used, local = np.unique(tile_triangles.ravel(), return_inverse=True)
+            yield points[used], local.reshape(-1, 3)
+    
+    @staticmethod
+    def calculate_volume_tiled(mesh, nx=4, ny=4, progress=None):
+        """
+        Calculate the signed tetrahedron volume one XY tile at a time.
+        
+        The signed volume is a sum over triangles, so the per-tile sums add up
+        to the same total as the whole-mesh method, while each pass only works
+        on a tile's share of the points and triangles.
+        
+        Args:
+            mesh: PyVista mesh object made of triangles
+            nx, ny: Number of tiles along X and Y (see partition_triangles)
+            progress: Optional callable(done, total) called after each tile
+                with the number of triangles handled so far and in total
+            
+        Returns:
+            float: Volume in mm³, or 0.0 if the mesh is empty
+        """
+        if mesh is None or len(mesh.faces) == 0:
+            return 0.0
+        
+        triangles = mesh.faces.reshape(-1, 4)[:, 1:4]
+        total = 0.0
+        done = 0
+        for tile_points, tile_triangles in MeshCalculator.partition_triangles(
+            mesh.points, triangles, nx, ny
+        ):
+            total += MeshCalculator.signed_tetrahedron_volume(tile_points, tile_triangles)
+            done += len(tile_triangles)
+            if progress is not None:
+                progress(done, len(triangles))
+        return abs(total)
+    
     @staticmethod
     def calculate_volume_bounding_box(mesh):
         """
@@ -339,13 +755,15 @@ class MeshCalculator:
             return 0.0
     
     @staticmethod
-    def calculate_volume_multiple_methods(mesh, target_volume=None):
+    def calculate_volume_multiple_methods(mesh, target_volume=None, max_workers=None):
         """
         Try multiple volume calculation methods and return results.
         
         Args:
             mesh: PyVista mesh object
             target_volume: Optional target volume for comparison (in mm³)
+            max_workers: Run the methods in up to this many processes at once;
+                None or 1 runs them one after another in this process
             
         Returns:
             dict: Dictionary with method names and results containing:
@@ -357,124 +775,73 @@ class MeshCalculator:
         if mesh is None:
             return {}
         
-        results = {}
+        methods = MeshCalculator._volume_methods()
         
-        # Method 1: Standard PyVista volume
-        try:
-            vol = mesh.volume
-            results['pyvista_standard'] = {
-                'volume': vol,
-                'method': 'PyVista Standard',
-                'diff_from_target': abs(vol - target_volume) if target_volume else None
-            }
-        except Exception as e:
-            results['pyvista_standard'] = {
-                'volume': 0.0,
-                'method': 'PyVista Standard',
-                'error': str(e),
-                'diff_from_target': None
-            }
-        
-        # Method 2: Convex hull
-        try:
-            vol = MeshCalculator.calculate_volume_convex_hull(mesh)
-            results['convex_hull'] = {
-                'volume': vol,
-                'method': 'Convex Hull',
-                'diff_from_target': abs(vol - target_volume) if target_volume else None
-            }
-        except Exception as e:
-            results['convex_hull'] = {
-                'volume': 0.0,
-                'method': 'Convex Hull',
-                'error': str(e),
-                'diff_from_target': None
-            }
-        
-        # Method 3: Voxel-based (different densities)
-        for density in [50, 100, 200]:
+        if max_workers and max_workers > 1:
+            # The methods are independent, so run them in worker processes and
+            # wait only for the slowest. Workers get the raw point and face
+            # arrays (inherited copy-on-write where fork is used) rather than
+            # a pickled mesh, and rebuild the PolyData once each.
             try:
-                vol = MeshCalculator.calculate_volume_voxel(mesh, density=density)
-                results[f'voxel_d{density}'] = {
-                    'volume': vol,
-                    'method': f'Voxel (density={density})',
-                    'diff_from_target': abs(vol - target_volume) if target_volume else None
-                }
+                points = np.asarray(mesh.points)
+                faces = np.asarray(mesh.faces)
+                # Fork is only used on Linux; macOS system frameworks are not
+                # fork-safe, which is why Python defaults to spawn there
+                context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+                with ProcessPoolExecutor(
+                    max_workers=min(max_workers, len(methods)),
+                    mp_context=context,
+                    initializer=_init_volume_worker,
+                    initargs=(points, faces)
+                ) as executor:
+                    return dict(executor.map(
+                        _run_volume_method_in_worker, methods, itertools.repeat(target_volume)
+                    ))
             except Exception as e:
-                results[f'voxel_d{density}'] = {
-                    'volume': 0.0,
-                    'method': f'Voxel (density={density})',
-                    'error': str(e),
-                    'diff_from_target': None
-                }
-        
-        # Method 4: Mesh repair
-        try:
-            vol = MeshCalculator.calculate_volume_repair(mesh)
-            results['mesh_repair'] = {
-                'volume': vol,
-                'method': 'Mesh Repair + Volume',
-                'diff_from_target': abs(vol - target_volume) if target_volume else None
-            }
-        except Exception as e:
-            results['mesh_repair'] = {
-                'volume': 0.0,
-                'method': 'Mesh Repair + Volume',
-                'error': str(e),
-                'diff_from_target': None
-            }
+                logger.warning(f"Parallel volume comparison failed, running methods in turn: {e}")
         
-        # Method 5: Manual tetrahedron (different reference points)
-        for ref_point in ['origin', 'centroid']:
-            try:
-                vol = MeshCalculator.calculate_volume_manual_tetrahedron(mesh, ref_point)
-                results[f'manual_tetra_{ref_point}'] = {
-                    'volume': vol,
-                    'method': f'Manual Tetrahedron ({ref_point})',
-                    'diff_from_target': abs(vol - target_volume) if target_volume else None
-                }
-            except Exception as e:
-                results[f'manual_tetra_{ref_point}'] = {
-                    'volume': 0.0,
-                    'method': f'Manual Tetrahedron ({ref_point})',
-                    'error': str(e),
-                    'diff_from_target': None
-                }
-        
-        # Method 6: Bounding box
+        # Gather the triangle corners once for the methods that share them
         try:
-            vol = MeshCalculator.calculate_volume_bounding_box(mesh)
-            results['bounding_box'] = {
-                'volume': vol,
-                'method': 'Bounding Box',
-                'diff_from_target': abs(vol - target_volume) if target_volume else None
-            }
+            corners = MeshCalculator.triangle_corners(mesh)
         except Exception as e:
-            results['bounding_box'] = {
-                'volume': 0.0,
-                'method': 'Bounding Box',
-                'error': str(e),
-                'diff_from_target': None
-            }
+            logger.warning(f"Could not gather triangle corners, methods will gather their own: {e}")
+            corners = None
+        return dict(_run_volume_method(mesh, method, target_volume, corners) for method in methods)
+    
+    @staticmethod
+    def _volume_methods():
+        """
+        List the methods compared by calculate_volume_multiple_methods.
         
-        # Method 7: PyVista with preprocessing
+        Returns:
+            list: (result key, display name, function, keyword arguments,
+                takes corners) tuples; the functions are module-level so they
+                can be sent to worker processes. Functions that take corners
+                accept the shared triangle_corners array as `corners`.
+        """
+        methods = [
+            ('pyvista_standard', 'PyVista Standard', _pyvista_volume, {}, False),
+            ('convex_hull', 'Convex Hull', MeshCalculator.calculate_volume_convex_hull, {}, False),
+        ]
+        for density in [50, 100, 200]:
+            methods.append((f'voxel_d{density}', f'Voxel (density={density})',
+                            MeshCalculator.calculate_volume_voxel, {'density': density}, True))
+        methods.append(('mesh_repair', 'Mesh Repair + Volume', MeshCalculator.calculate_volume_repair, {}, False))
+        for ref_point in ['origin', 'centroid']:
+            methods.append((f'manual_tetra_{ref_point}', f'Manual Tetrahedron ({ref_point})',
+                            MeshCalculator.calculate_volume_manual_tetrahedron,
+                            {'reference_point': ref_point}, True))
+        methods.append(('signed_tet_tiled', 'Signed Tetrahedron (4×4 tiles)',
+                        MeshCalculator.calculate_volume_tiled, {}, False))
+        # Numba-compiled tetrahedron kernel (only when Numba is installed)
+        if _numba_tetrahedron_kernel() is not None:
+            methods.append(('signed_tet_numba', 'Signed Tetrahedron (Numba)',
+                            MeshCalculator.calculate_volume_tetrahedron_numba, {}, False))
+        methods.append(('bounding_box', 'Bounding Box', MeshCalculator.calculate_volume_bounding_box, {}, False))
         for prep in ['triangulate', 'smooth']:
-            try:
-                vol = MeshCalculator.calculate_volume_with_preprocessing(mesh, preprocessing=prep)
-                results[f'pyvista_{prep}'] = {
-                    'volume': vol,
-                    'method': f'PyVista + {prep.capitalize()}',
-                    'diff_from_target': abs(vol - target_volume) if target_volume else None
-                }
-            except Exception as e:
-                results[f'pyvista_{prep}'] = {
-                    'volume': 0.0,
-                    'method': f'PyVista + {prep.capitalize()}',
-                    'error': str(e),
-                    'diff_from_target': None
-                }
-        
-        return results
+            methods.append((f'pyvista_{prep}', f'PyVista + {prep.capitalize()}',
+                            MeshCalculator.calculate_volume_with_preprocessing, {'preprocessing': prep}, False))
+        return methods
     
     @staticmethod
     def calculate_scale_for_target_weight(current_weight_grams, target_weight_grams):
@@ -616,16 +983,43 @@ class MeshCalculator:
                 'surface_area_cm2': 0.0
             }
         
-        dimensions = MeshCalculator.calculate_dimensions(mesh)
-        volume_mm3 = MeshCalculator.calculate_volume(mesh)
-        surface_area = MeshCalculator.calculate_surface_area(mesh)
+        # Volume and area each walk every triangle, so reuse the result for a
+        # mesh that was already measured (e.g. by the sidebar before a PDF export)
+        key = id(mesh)
+        cached = _mesh_data_cache.get(key)
+        if cached is not None:
+            return dict(cached)
         
-        return {
-            'width': dimensions['width'],
-            'height': dimensions['height'],
-            'depth': dimensions['depth'],
+        try:
+            stats = _triangle_mesh_stats(mesh)
+        except Exception as e:
+            logger.warning(f"Failed to measure triangle mesh in one pass: {e}")
+            stats = None
+        
+        if stats is not None:
+            (width, height, depth), volume_mm3, surface_area_mm2 = stats
+        else:
+            # Mixed or non-triangle cells: fall back to the per-property VTK filters
+            dimensions = MeshCalculator.calculate_dimensions(mesh)
+            width, height, depth = dimensions['width'], dimensions['height'], dimensions['depth']
+            volume_mm3 = MeshCalculator.calculate_volume(mesh)
+            surface_area_mm2 = MeshCalculator.calculate_surface_area(mesh)['mm2']
+        
+        mesh_data = {
+            'width': width,
+            'height': height,
+            'depth': depth,
             'volume_mm3': volume_mm3,
             'volume_cm3': volume_mm3 / 1000.0,
-            'surface_area_mm2': surface_area['mm2'],
-            'surface_area_cm2': surface_area['cm2']
+            'surface_area_mm2': surface_area_mm2,
+            'surface_area_cm2': surface_area_mm2 / 100.0
         }
+        
+        # Drop the entry when the mesh is garbage collected so ids are never reused;
+        # objects that cannot be weakly referenced are simply not cached
+        try:
+            weakref.finalize(mesh, _mesh_data_cache.pop, key, None)
+            _mesh_data_cache[key] = mesh_data
+        except TypeError:
+            pass
+        return dict(mesh_data)
@@ -0,0 +1,192 @@
+"""
+Format-independent mesh loading for the 3D viewers.
+Detects the file type from its extension and dispatches to the matching loader.
+"""
+import logging
+import pyvista as pv
+
+logger = logging.getLogger(__name__)
+
+
+class MeshLoader:
+    """Reads STL, STEP, 3DM, OBJ and IGES files into PyVista meshes."""
+    
+    @staticmethod
+    def load_mesh(file_path):
+        """
+        Read a supported 3D file into a mesh without touching any plotter.
+        
+        This does no rendering, so it is safe to call from a worker thread.
+        
+        Args:
+            file_path (str): Path to the 3D file
+            
+        Returns:
+            pyvista.PolyData: Loaded mesh with at least one point
+            
+        Raises:
+            ValueError: If the file contains no usable geometry
+        """
+        # Detect file format and load accordingly
+        file_ext = file_path.lower()
+        if file_ext.endswith('.step') or file_ext.endswith('.stp'):
+            logger.info("load_mesh: Detected STEP file, loading with StepLoader...")
+            from core.step_loader import StepLoader
+            try:
+                mesh = StepLoader.load_step(file_path)
+                logger.info(f"load_mesh: STEP file loaded successfully. Mesh info: {mesh}")
+            except Exception as e:
+                logger.error(f"load_mesh: Failed to load STEP file: {e}", exc_info=True)
+                raise
+        elif file_ext.endswith('.3dm'):
+            logger.info("load_mesh: Detected 3DM file, loading with Rhino3dmLoader...")
+            from core.rhino3dm_loader import Rhino3dmLoader
+            try:
+                mesh = Rhino3dmLoader.load_3dm(file_path)
+                logger.info(f"load_mesh: 3DM file loaded successfully. Mesh info: {mesh}")
+            except Exception as e:
+                logger.error(f"load_mesh: Failed to load 3DM file: {e}", exc_info=True)
+                raise
+        elif file_ext.endswith('.obj'):
+            logger.info("load_mesh: Detected OBJ file, attempting to load...")
+            mesh = None
+            load_error = None
+        
+            # Try PyVista first (fastest)
+            try:
+                logger.info("load_mesh: Trying PyVista OBJ reader...")
+                mesh = pv.read(file_path)
+                logger.info(f"load_mesh: PyVista read completed. Mesh info: {mesh}")
+        
+                # Check if mesh is valid
+                if mesh is not None and mesh.n_points > 0:
+                    logger.info("load_mesh: PyVista successfully loaded OBJ file")
+                else:
+                    logger.warning("load_mesh: PyVista loaded empty mesh, trying meshio fallback...")
+                    mesh = None  # Will trigger fallback
+            except Exception as e:
+                logger.warning(f"load_mesh: PyVista failed to load OBJ: {e}, trying meshio fallback...")
+                load_error = str(e)
+                mesh = None
+        
+            # Fallback to meshio if PyVista failed or produced empty mesh
+            meshio_error = None
+            if mesh is None or mesh.n_points == 0:
+                try:
+                    logger.info("load_mesh: Trying meshio OBJ reader...")
+                    import meshio
+                    meshio_mesh = meshio.read(file_path)
+                    logger.info(f"load_mesh: meshio read completed. Points: {len(meshio_mesh.points)}, Cells: {len(meshio_mesh.cells)}")
+        
+                    # Convert meshio mesh to PyVista
+                    if len(meshio_mesh.points) == 0:
+                        raise ValueError("meshio loaded OBJ but found no points")
+        
+                    points = meshio_mesh.points
+        
+                    # Find triangle cells (most common for OBJ)
+                    cells = None
+                    cell_type = None
+                    for cell_block in meshio_mesh.cells:
+                        if cell_block.type == "triangle":
+                            cells = cell_block.data
+                            cell_type = "triangle"
+                            break
+        
+                    # If no triangles, try other cell types
+                    if cells is None:
+                        if len(meshio_mesh.cells) > 0:
+                            cell_block = meshio_mesh.cells[0]
+                            cells = cell_block.data
+                            cell_type = cell_block.type
+                            logger.warning(f"load_mesh: Using cell type {cell_type} (not triangles)")
+                        else:
+                            raise ValueError("meshio loaded OBJ but found no cells")
+        
+                    # Create PyVista mesh
+                    if cell_type == "triangle":
+                        mesh = pv.PolyData(points, cells)
+                    else:
+                        # For other cell types, create UnstructuredGrid and extract surface
+                        unstructured = pv.UnstructuredGrid(cells, cell_type, points)
+                        mesh = unstructured.extract_surface()
+        
+                    logger.info(f"load_mesh: Converted meshio mesh to PyVista. Points: {mesh.n_points}, Cells: {mesh.n_cells}")
+                except ImportError:
+                    meshio_error = "meshio is not available"
+                    logger.warning(f"load_mesh: {meshio_error}, will try custom parser...")
+                except ValueError as e:
+                    error_str = str(e)
+                    # Check if this is a texture coordinate mismatch error
+                    if "len(points)" in error_str and "point_data" in error_str:
+                        meshio_error = f"meshio texture coordinate mismatch: {error_str}"
+                        logger.warning(f"load_mesh: {meshio_error}, will try custom parser...")
+                    else:
+                        # Other ValueError from meshio - re-raise
+                        meshio_error = error_str
+                        raise
+                except Exception as e:
+                    meshio_error = str(e)
+                    logger.warning(f"load_mesh: meshio failed: {meshio_error}, will try custom parser...")
+        
+            # Third fallback: custom OBJ parser for files with texture coordinate mismatches
+            if (mesh is None or mesh.n_points == 0) and meshio_error:
+                try:
+                    logger.info("load_mesh: Trying custom OBJ parser (handles texture coordinate mismatches)...")
+                    from core.obj_loader import ObjLoader
+                    mesh = ObjLoader.load_obj(file_path)
+                    logger.info(f"load_mesh: Custom OBJ parser successfully loaded file. Points: {mesh.n_points}, Cells: {mesh.n_cells}")
+                except ImportError:
+                    error_msg = "OBJ file could not be loaded. All loaders failed (PyVista, meshio, and custom parser unavailable)."
+                    if load_error:
+                        error_msg += f" PyVista error: {load_error}."
+                    if meshio_error:
+                        error_msg += f" meshio error: {meshio_error}."
+                    logger.error(f"load_mesh: {error_msg}")
+                    raise ValueError(error_msg)
+                except Exception as e:
+                    error_msg = "OBJ file could not be loaded with any available method (PyVista, meshio, or custom parser)."
+                    if load_error:
+                        error_msg += f" PyVista error: {load_error}."
+                    if meshio_error:
+                        error_msg += f" meshio error: {meshio_error}."
+                    error_msg += f" Custom parser error: {str(e)}"
+                    logger.error(f"load_mesh: {error_msg}")
+                    raise ValueError(error_msg)
+        
+            # Final validation
+            if mesh is None or mesh.n_points == 0:
+                error_msg = "OBJ file loaded but contains no geometry (zero points). The file may be corrupted or in an unsupported format."
+                if load_error:
+                    error_msg += f" Reader error: {load_error}"
+                logger.error(f"load_mesh: {error_msg}")
+                raise ValueError(error_msg)
+        elif file_ext.endswith('.iges') or file_ext.endswith('.igs'):
+            logger.info("load_mesh: Detected IGES file, loading with IgesLoader...")
+            from core.iges_loader import IgesLoader
+            try:
+                mesh = IgesLoader.load_iges(file_path)
+                logger.info(f"load_mesh: IGES file loaded successfully. Mesh info: {mesh}")
+            except Exception as e:
+                logger.error(f"load_mesh: Failed to load IGES file: {e}", exc_info=True)
+                raise
+        else:
+            logger.info("load_mesh: Reading STL file with StlLoader...")
+            from core.stl_loader import StlLoader
+            mesh = StlLoader.load_stl(file_path)
+            logger.info(f"load_mesh: STL file read successfully. Mesh info: {mesh}")
+        
+        # Validate mesh is not empty before proceeding
+        if mesh is None:
+            error_msg = "Failed to load mesh: file returned None. The file may be corrupted or in an unsupported format."
+            logger.error(f"load_mesh: {error_msg}")
+            raise ValueError(error_msg)
+        
+        if mesh.n_points == 0:
+            error_msg = f"Loaded mesh contains no geometry (zero points). The file may be corrupted, empty, or in an unsupported format."
+            logger.error(f"load_mesh: {error_msg}")
+            raise ValueError(error_msg)
+        
+        logger.info(f"load_mesh: Mesh validated - {mesh.n_points} points, {mesh.n_cells} cells")
+        
+        return mesh
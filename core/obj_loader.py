@@ -137,17 +137,18 @@ class ObjLoader:
         
         # Convert to numpy arrays
         try:
-            points = np.array(vertices, dtype=np.float64)
+            # Single precision, as PyVista's STL reader stores points; the
+            # volume and area sums in MeshCalculator are done in float64
+            points = np.array(vertices, dtype=np.float32)
             
             # PyVista expects cells in a specific format:
             # For triangles: [3, i1, i2, i3, 3, i4, i5, i6, ...]
-            # Where the first number is the number of vertices in the cell
-            cells = []
-            for face in faces:
-                cells.append(3)  # Triangle has 3 vertices
-                cells.extend(face)
-            
-            cells = np.array(cells, dtype=np.int32)
+            # Where the first number is the number of vertices in the cell.
+            # Fill an (n, 4) array column-wise and flatten it
+            cells = np.empty((len(faces), 4), dtype=np.int32)
+            cells[:, 0] = 3  # Triangle has 3 vertices
+            cells[:, 1:] = faces
+            cells = cells.ravel()
             
             # Create PyVista PolyData
             mesh = pv.PolyData(points, cells)
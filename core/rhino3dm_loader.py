@@ -355,7 +355,7 @@ class Rhino3dmLoader:
                 return None
             
             # Convert to numpy arrays
-            points_array = np.array(all_points, dtype=np.float64)
+            points_array = np.array(all_points, dtype=np.float32)
             faces_array = np.array(all_faces, dtype=np.int32)
             
             # Create PyVista mesh
@@ -0,0 +1,97 @@
+"""
+STL file loader that parses binary STL files directly with NumPy.
+ASCII STL files are passed on to PyVista's reader.
+"""
+import logging
+import os
+import numpy as np
+import pyvista as pv
+
+logger = logging.getLogger(__name__)
+
+# Binary STL layout: 80-byte header, little-endian uint32 triangle count, then
+# one packed 50-byte record per triangle
+_HEADER_SIZE = 84
+_TRIANGLE_DTYPE = np.dtype([
+    ('normal', '<f4', (3,)),
+    ('vertices', '<f4', (3, 3)),
+    ('attribute', '<u2'),
+])
+# A single xyz point as one record, for deduplicating whole points
+_POINT_DTYPE = np.dtype([('x', '<f4'), ('y', '<f4'), ('z', '<f4')])
+
+
+class StlLoader:
+    """Handles loading STL files, reading binary triangle data in one pass."""
+    
+    @staticmethod
+    def load_stl(file_path, dedup=True):
+        """
+        Load an STL file into a PyVista mesh.
+        
+        A file whose size matches the triangle count in its header is read as
+        binary STL: the file is memory-mapped and the triangle block is cast to
+        a structured array without parsing individual values. Anything else
+        (ASCII STL, or binary files with trailing data) is read by PyVista.
+        
+        Args:
+            file_path (str): Path to the STL file
+            dedup (bool): Merge corners shared by neighbouring triangles into
+                one point, as PyVista's reader does. Without it every triangle
+                keeps three points of its own.
+        
+        Returns:
+            pyvista.PolyData: Triangle mesh
+        """
+        file_size = os.path.getsize(file_path)
+        
+        if file_size >= _HEADER_SIZE:
+            # Map the file rather than reading it into a bytes object: pages are
+            # faulted in while the points are copied out, and the mapping is
+            # released once the returned mesh no longer needs it
+            data = np.memmap(file_path, dtype=np.uint8, mode='r')
+            n_triangles = int(data[80:84].view('<u4')[0])
+            if file_size == _HEADER_SIZE + n_triangles * _TRIANGLE_DTYPE.itemsize:
+                logger.info(f"StlLoader: Reading binary STL with {n_triangles} triangles")
+                triangles = np.frombuffer(
+                    data, dtype=_TRIANGLE_DTYPE, count=n_triangles, offset=_HEADER_SIZE
+                )
+                return StlLoader._triangles_to_mesh(triangles['vertices'], dedup)
+            del data
+        
+        logger.info("StlLoader: Not a binary STL, reading with PyVista...")
+        return pv.read(file_path)
+    
+    @staticmethod
+    def _triangles_to_mesh(vertices, dedup=True):
+        """
+        Build a PolyData from an (n, 3, 3) array of triangle corner positions.
+        
+        Args:
+            vertices: Array of shape (n, 3, 3), three corners per triangle
+            dedup (bool): Merge corners with identical coordinates
+        
+        Returns:
+            pyvista.PolyData: Triangle mesh
+        """
+        n_triangles = len(vertices)
+        if n_triangles == 0:
+            return pv.PolyData()
+        
+        # One contiguous copy out of the 50-byte records
+        points = np.array(vertices, dtype=np.float32).reshape(-1, 3)
+        
+        if dedup:
+            # View each xyz row as one 12-byte record so np.unique compares
+            # whole points; the inverse maps every corner to its unique point
+            records = points.view(_POINT_DTYPE).reshape(-1)
+            unique_points, corner_ids = np.unique(records, return_inverse=True)
+            points = unique_points.view(np.float32).reshape(-1, 3)
+        else:
+            corner_ids = np.arange(3 * n_triangles)
+        
+        faces = np.empty((n_triangles, 4), dtype=np.int64)
+        faces[:, 0] = 3
+        faces[:, 1:] = corner_ids.reshape(n_triangles, 3)
+        
+        return pv.PolyData(points, faces.ravel())
@@ -12,15 +12,24 @@ os.environ.setdefault('MESA_GL_VERSION_OVERRIDE', '3.3')
 os.environ.setdefault('VTK_USE_OSMESA', '0')  # Try hardware rendering first
 # Uncomment below if hardware rendering fails:
 # os.environ['VTK_USE_OSMESA'] = '1'  # Force software rendering
+# PyVista imports matplotlib for colormaps when the 3D viewer is first
+# created; the Agg backend skips matplotlib's GUI toolkit probing
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+# Set ECTOFORM_DEBUG=1 for debug-level logging and a verbose console
+DEBUG = bool(os.environ.get('ECTOFORM_DEBUG'))
 
 # Configure logging FIRST, before any other imports
 log_file = os.path.join(os.path.dirname(__file__), 'app_debug.log')
+console_handler = logging.StreamHandler(sys.stdout)
+# Outside debug mode only warnings reach the console; the log file keeps INFO
+console_handler.setLevel(logging.DEBUG if DEBUG else logging.WARNING)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.DEBUG if DEBUG else logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stdout)
+        console_handler
     ],
     force=True  # Override any existing configuration
 )
@@ -45,47 +54,32 @@ print("=" * 50, file=sys.stderr)
 safe_flush(sys.stderr)
 
 from PyQt5.QtWidgets import QApplication, QMessageBox, QDialog, QSplashScreen
-from PyQt5.QtCore import QTimer, Qt as QtCore, Qt
+from PyQt5.QtCore import Qt as QtCore, Qt
 from PyQt5.QtGui import QPixmap, QColor
 from stl_viewer import STLViewerWindow
 from core.license_validator import is_license_valid_stored
 from ui.license_dialog import LicenseDialog
-from ui.styles import get_global_stylesheet
+from ui.styles import GLOBAL_STYLESHEET
 
 
 def main():
     """Initialize and run the ECTOFORM application."""
-    print("=" * 50, file=sys.stderr)
-    print("Starting ECTOFORM Application", file=sys.stderr)
-    print("=" * 50, file=sys.stderr)
-    safe_flush(sys.stderr)
-    
     logger.info("=" * 50)
     logger.info("Starting ECTOFORM Application")
     logger.info("=" * 50)
     
     try:
-        print("Step 1: Creating QApplication...", file=sys.stderr)
-        safe_flush(sys.stderr)
         logger.info("Step 1: Creating QApplication...")
         app = QApplication(sys.argv)
-        print("✓ QApplication created successfully", file=sys.stderr)
-        safe_flush(sys.stderr)
         logger.info("✓ QApplication created successfully")
         
         # Apply global stylesheet early to ensure QMessageBox dialogs are styled
-        app.setStyleSheet(get_global_stylesheet())
-        print("✓ Global stylesheet applied", file=sys.stderr)
-        safe_flush(sys.stderr)
+        app.setStyleSheet(GLOBAL_STYLESHEET)
         logger.info("✓ Global stylesheet applied")
         
-        print("Step 2: Setting application properties...", file=sys.stderr)
-        safe_flush(sys.stderr)
         logger.info("Step 2: Setting application properties...")
         app.setApplicationName("ECTOFORM")
         app.setOrganizationName("ECTOFORM")
-        print("✓ Application properties set", file=sys.stderr)
-        safe_flush(sys.stderr)
         logger.info("✓ Application properties set")
         
         # Create splash screen
@@ -137,8 +131,6 @@ def main():
         app.processEvents()
         
         # Step 2.5: Check license
-        print("Step 2.5: Checking license...", file=sys.stderr)
-        safe_flush(sys.stderr)
         logger.info("Step 2.5: Checking license...")
         
         if not is_license_valid_stored():
@@ -147,8 +139,6 @@ def main():
                               QColor("#5294E2"))
             app.processEvents()
             
-            print("License not valid, showing license dialog...", file=sys.stderr)
-            safe_flush(sys.stderr)
             logger.info("License not valid, showing license dialog...")
             
             # Temporarily remove WindowStaysOnTopHint from splash so license dialog appears on top
@@ -170,8 +160,6 @@ def main():
                 splash.setWindowFlags(original_flags)
                 splash.show()
                 app.processEvents()
-                print("License dialog cancelled, exiting application", file=sys.stderr)
-                safe_flush(sys.stderr)
                 logger.info("License dialog cancelled, exiting application")
                 splash.finish(None)
                 QMessageBox.information(
@@ -192,12 +180,8 @@ def main():
                               QColor("#5294E2"))
             app.processEvents()
             
-            print("✓ License validated successfully", file=sys.stderr)
-            safe_flush(sys.stderr)
             logger.info("✓ License validated successfully")
         else:
-            print("✓ Valid license found in cache", file=sys.stderr)
-            safe_flush(sys.stderr)
             logger.info("✓ Valid license found in cache")
         
         splash.showMessage("Loading application...", 
@@ -205,16 +189,10 @@ def main():
                           QColor("#5294E2"))
         app.processEvents()
         
-        print("Step 3: Creating main window...", file=sys.stderr)
-        safe_flush(sys.stderr)
         logger.info("Step 3: Creating main window...")
         window = STLViewerWindow()
-        print("✓ Main window created successfully", file=sys.stderr)
-        safe_flush(sys.stderr)
         logger.info("✓ Main window created successfully")
         
-        print("Step 4: Showing window...", file=sys.stderr)
-        safe_flush(sys.stderr)
         logger.info("Step 4: Showing window...")
         window.show()
         
@@ -226,8 +204,6 @@ def main():
         window.activateWindow()
         app.processEvents()
         
-        print(f"✓ Window shown - Position: {window.pos()}, Size: {window.size()}, Visible: {window.isVisible()}", file=sys.stderr)
-        safe_flush(sys.stderr)
         logger.info(f"✓ Window shown - Position: {window.pos()}, Size: {window.size()}, Visible: {window.isVisible()}")
         
         # Give QtInteractor time to initialize (it will be triggered by showEvent)
@@ -236,8 +212,6 @@ def main():
         # Finish splash screen
         splash.finish(window)
         
-        print("Step 5: Starting event loop...", file=sys.stderr)
-        safe_flush(sys.stderr)
         logger.info("Step 5: Starting event loop...")
         # Run application event loop
         sys.exit(app.exec())
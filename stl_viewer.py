@@ -1,59 +1,158 @@
 """
 Main ECTOFORM Window with minimalistic UI.
 """
-import sys
 import logging
+import functools
+import os
 from pathlib import Path
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QFileDialog,
-    QMessageBox, QSplitter, QFrame, QApplication
+    QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
+    QMessageBox, QSplitter, QApplication, QProgressDialog
 )
-from PyQt5.QtCore import Qt
-# Try QtInteractor first, fallback to offscreen if it fails
-try:
-    from viewer_widget import STLViewerWidget
-    USE_OFFSCREEN = False
-except Exception as e:
-    print(f"Warning: Could not import QtInteractor viewer, using offscreen fallback: {e}", file=sys.stderr)
-    from viewer_widget_offscreen import STLViewerWidgetOffscreen as STLViewerWidget
-    USE_OFFSCREEN = True
+from PyQt5.QtCore import Qt, QSettings, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 
 from ui.sidebar_panel import SidebarPanel
 from ui.toolbar import ViewControlsToolbar
 from ui.ruler_toolbar import RulerToolbar
 from ui.annotation_panel import AnnotationPanel
-from ui.styles import get_global_stylesheet, default_theme
-from core.mesh_calculator import MeshCalculator
+from ui.drop_zone_overlay import DropZoneOverlay
+from ui.styles import GLOBAL_STYLESHEET
 
 logger = logging.getLogger(__name__)
 
+# Supported file extensions mapped to the format name shown in error messages
+FILE_TYPES = {
+    '.stl': "STL",
+    '.step': "STEP",
+    '.stp': "STEP",
+    '.3dm': "3DM",
+    '.obj': "OBJ",
+    '.iges': "IGES",
+    '.igs': "IGES",
+}
 
-def safe_flush(stream):
-    """Safely flush a stream, handling None (common in PyInstaller Windows builds)."""
-    if stream is not None:
+# Use Qt's own file dialog: the native one can stall for seconds while the
+# platform enumerates drives, mounts and icon themes. Setting
+# ECTOFORM_NATIVE_DIALOG (e.g. on Linux desktops with a working portal)
+# switches back to the native dialog.
+USE_NATIVE_DIALOG = bool(os.environ.get('ECTOFORM_NATIVE_DIALOG'))
+
+# Annotation marker colours, matching the read indicator in the annotation panel
+MARKER_COLOR_READ = '#10B981'
+MARKER_COLOR_UNREAD = '#3B82F6'
+
+
+def _safe_slot(action):
+    """
+    Decorate a view slot so a plotter error is logged instead of propagating.
+    
+    Slots check their preconditions (viewer, plotter, actor) up front, so this
+    only catches genuinely unexpected VTK failures; an exception escaping a
+    PyQt slot would otherwise abort the application.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                logger.warning(f"Could not {action}: {e}")
+        return wrapper
+    return decorator
+
+
+class MeshLoadSignals(QObject):
+    """Signals emitted by MeshLoadWorker."""
+    
+    # Emitted with (file_path, mesh, mesh_data, error message); mesh and
+    # mesh_data are None on failure
+    finished = pyqtSignal(str, object, object, str)
+
+
+class MeshLoadWorker(QRunnable):
+    """Reads a 3D file into a mesh on a thread pool thread."""
+    
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = MeshLoadSignals()
+    
+    def run(self):
+        """Read the file, measure it and report the result."""
         try:
-            stream.flush()
-        except (AttributeError, OSError):
-            pass  # Stream may not support flush or may be closed
+            from core.mesh_loader import MeshLoader
+            from core.mesh_calculator import MeshCalculator
+            mesh = MeshLoader.load_mesh(self.file_path)
+            # Bounds, volume and area walk every triangle; measure here rather
+            # than on the GUI thread once the mesh is displayed
+            mesh_data = MeshCalculator.get_mesh_data(mesh)
+        except Exception as e:
+            logger.error(f"MeshLoadWorker: Failed to load {self.file_path}: {e}", exc_info=True)
+            self.signals.finished.emit(self.file_path, None, None, str(e))
+            return
+        self.signals.finished.emit(self.file_path, mesh, mesh_data, "")
 
 
-# Print to stderr for immediate visibility
-def debug_print(msg):
-    print(f"[DEBUG] {msg}", file=sys.stderr)
-    safe_flush(sys.stderr)
+class MeshExportSignals(QObject):
+    """Signals emitted by MeshExportWorker."""
+    
+    # Emitted with (file_path, error message); the message is empty on success
+    finished = pyqtSignal(str, str)
+
+
+class MeshExportWorker(QRunnable):
+    """Scales a mesh and writes it as STL on a thread pool thread."""
+    
+    def __init__(self, mesh, file_path, scale_factor):
+        super().__init__()
+        self.mesh = mesh
+        self.file_path = file_path
+        self.scale_factor = scale_factor
+        self.signals = MeshExportSignals()
+    
+    def run(self):
+        """Scale and export the mesh and report the result."""
+        try:
+            from core.mesh_calculator import MeshCalculator
+            
+            scaled_mesh = MeshCalculator.scale_mesh(self.mesh, self.scale_factor)
+            if scaled_mesh is None:
+                logger.error("export_scaled_stl: Failed to scale mesh")
+                self.signals.finished.emit(self.file_path, "Failed to scale the mesh. Please try again.")
+                return
+            
+            if not MeshCalculator.export_stl(scaled_mesh, self.file_path):
+                logger.error(f"export_scaled_stl: Failed to export to {self.file_path}")
+                self.signals.finished.emit(self.file_path, f"Failed to export STL file to:\n{self.file_path}")
+                return
+        except Exception as e:
+            logger.error(f"export_scaled_stl: Error during export: {e}", exc_info=True)
+            self.signals.finished.emit(self.file_path, f"Error during export:\n{str(e)}")
+            return
+        self.signals.finished.emit(self.file_path, "")
 
 
 class STLViewerWindow(QMainWindow):
     """Main window for STL file viewer application."""
     
     def __init__(self):
-        debug_print("STLViewerWindow: Initializing...")
         logger.info("STLViewerWindow: Initializing...")
         super().__init__()
-        debug_print("STLViewerWindow: Parent initialized")
         logger.info("STLViewerWindow: Parent initialized")
+        # Remember the last directory used in the open dialog across sessions
+        self.settings = QSettings("ECTOFORM", "Viewer")
+        self._last_dir: str = self.settings.value("last_dir", "", type=str)
+        if self._last_dir and not Path(self._last_dir).is_dir():
+            # Folder was removed or its drive unmounted; don't make the dialog resolve it
+            self._last_dir = ""
+        # Background load/export currently running, if any
+        self._worker = None
+        self._progress = None
+        # Loaded mesh waiting for a newly created viewer's plotter, if any
+        self._pending_load = None
+        # Open dialog, built on first use and reused so its file system model stays warm
+        self._file_dialog = None
         self.init_ui()
-        debug_print("STLViewerWindow: Initialization complete")
         logger.info("STLViewerWindow: Initialization complete")
     
     def init_ui(self):
@@ -63,19 +162,28 @@ class STLViewerWindow(QMainWindow):
         logger.info("init_ui: Setting window title and size...")
         self.setWindowTitle("ECTOFORM")
         self.setMinimumSize(1200, 800)
+        # Centered on its screen by _center_window when first shown
         self.resize(1200, 800)
-        
-        # Center window on screen
-        screen = QApplication.primaryScreen().geometry()
-        window_geometry = self.frameGeometry()
-        window_geometry.moveCenter(screen.center())
-        self.move(window_geometry.topLeft())
+        self._centered = False
         
         logger.info("init_ui: Creating central widget...")
         central_widget = QWidget()
-        central_widget.setStyleSheet(f"background-color: {default_theme.background};")
+        central_widget.setObjectName("centralWidget")
         self.setCentralWidget(central_widget)
         
+        # Build every panel with updates off so the layout settles once at the end
+        central_widget.setUpdatesEnabled(False)
+        try:
+            self._build_panels(central_widget)
+        finally:
+            central_widget.setUpdatesEnabled(True)
+        
+        logger.info("init_ui: Applying styling...")
+        self.apply_styling()
+        logger.info("init_ui: UI initialization complete")
+    
+    def _build_panels(self, central_widget):
+        """Create the sidebar, toolbars and viewer area inside central_widget."""
         logger.info("init_ui: Creating main layout...")
         main_layout = QHBoxLayout(central_widget)
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -83,7 +191,7 @@ class STLViewerWindow(QMainWindow):
         
         logger.info("init_ui: Creating splitter...")
         splitter = QSplitter(Qt.Horizontal)
-        splitter.setStyleSheet(f"background-color: {default_theme.background};")
+        splitter.setObjectName("mainSplitter")
         main_layout.addWidget(splitter)
         
         logger.info("init_ui: Creating sidebar panel...")
@@ -114,48 +222,21 @@ class STLViewerWindow(QMainWindow):
         right_layout.addWidget(self.ruler_toolbar)
         logger.info("init_ui: Ruler toolbar created")
         
-        debug_print("init_ui: Creating 3D viewer widget (this may take a moment)...")
-        logger.info("init_ui: Creating 3D viewer widget (this may take a moment)...")
-        
         # Create horizontal layout for viewer + annotation panel
         viewer_h_layout = QHBoxLayout()
         viewer_h_layout.setContentsMargins(0, 0, 0, 0)
         viewer_h_layout.setSpacing(0)
+        self.viewer_h_layout = viewer_h_layout
         
-        try:
-            # Try QtInteractor first
-            if not USE_OFFSCREEN:
-                self.viewer_widget = STLViewerWidget()
-                debug_print("init_ui: 3D viewer widget (QtInteractor) created successfully")
-                logger.info("init_ui: 3D viewer widget (QtInteractor) created successfully")
-            else:
-                # Use offscreen renderer
-                from viewer_widget_offscreen import STLViewerWidgetOffscreen
-                self.viewer_widget = STLViewerWidgetOffscreen()
-                debug_print("init_ui: 3D viewer widget (Offscreen) created successfully")
-                logger.info("init_ui: 3D viewer widget (Offscreen) created successfully")
-            
-            # Connect drag-and-drop signals
-            self._connect_viewer_signals()
-            
-            viewer_h_layout.addWidget(self.viewer_widget, 1)  # Add with stretch factor
-        except Exception as e:
-            debug_print(f"init_ui: ERROR creating viewer widget: {e}")
-            logger.error(f"init_ui: Error creating viewer widget: {e}", exc_info=True)
-            # Try offscreen as fallback
-            try:
-                debug_print("init_ui: Trying offscreen renderer as fallback...")
-                logger.info("init_ui: Trying offscreen renderer as fallback...")
-                from viewer_widget_offscreen import STLViewerWidgetOffscreen
-                self.viewer_widget = STLViewerWidgetOffscreen()
-                self._connect_viewer_signals()
-                viewer_h_layout.addWidget(self.viewer_widget, 1)
-                debug_print("init_ui: Offscreen renderer fallback successful")
-                logger.info("init_ui: Offscreen renderer fallback successful")
-            except Exception as e2:
-                debug_print(f"init_ui: Offscreen fallback also failed: {e2}")
-                logger.error(f"init_ui: Offscreen fallback also failed: {e2}", exc_info=True)
-                raise
+        # The 3D viewer (and the VTK stack behind it) is only created by
+        # _ensure_viewer when the first file is loaded. Until then a bare drop
+        # zone holds its slot and accepts drops and clicks like the viewer does.
+        self.viewer_widget = None
+        self._viewer_placeholder = DropZoneOverlay()
+        self._viewer_placeholder.file_dropped.connect(self._load_dropped_file)
+        self._viewer_placeholder.click_to_upload.connect(self.upload_stl_file)
+        self._viewer_placeholder.error_occurred.connect(self._show_drop_error)
+        viewer_h_layout.addWidget(self._viewer_placeholder, 1)  # Add with stretch factor
         
         # Create annotation panel (hidden by default)
         logger.info("init_ui: Creating annotation panel...")
@@ -174,43 +255,90 @@ class STLViewerWindow(QMainWindow):
         splitter.addWidget(right_container)
         
         logger.info("init_ui: Configuring splitter...")
-        splitter.setSizes([200, 1000])
+        # Stretch factors first, initial sizes last
         splitter.setStretchFactor(0, 0)
         splitter.setStretchFactor(1, 1)
+        splitter.setSizes([200, 1000])
+    
+    def showEvent(self, event):
+        """Center the window on its screen the first time it is shown."""
+        super().showEvent(event)
+        if not self._centered:
+            self._centered = True
+            self._center_window()
+    
+    def _center_window(self):
+        """Center the window in the usable area of its screen."""
+        # Uses the client rect rather than frameGeometry(): the frame extents
+        # need a window manager round trip on X11, and the title bar only
+        # shifts the result by a few pixels
+        available = self.screen().availableGeometry()
+        self.move(available.center() - self.rect().center())
+    
+    def _ensure_viewer(self):
+        """Import and create the 3D viewer widget if it does not exist yet."""
+        if self.viewer_widget is not None:
+            return self.viewer_widget
         
-        logger.info("init_ui: Applying styling...")
-        self.apply_styling()
-        logger.info("init_ui: UI initialization complete")
+        logger.info("_ensure_viewer: Creating 3D viewer widget (this may take a moment)...")
+        try:
+            # Try QtInteractor first
+            from viewer_widget import STLViewerWidget
+            viewer = STLViewerWidget()
+            logger.info("_ensure_viewer: 3D viewer widget (QtInteractor) created successfully")
+        except Exception as e:
+            logger.error(f"_ensure_viewer: Error creating viewer widget: {e}", exc_info=True)
+            # Try offscreen as fallback; if this fails too the error propagates
+            logger.info("_ensure_viewer: Trying offscreen renderer as fallback...")
+            from viewer_widget_offscreen import STLViewerWidgetOffscreen
+            viewer = STLViewerWidgetOffscreen()
+            logger.info("_ensure_viewer: Offscreen renderer fallback successful")
+        
+        # Swap the placeholder for the real viewer, keeping its stretch factor
+        self.viewer_h_layout.replaceWidget(self._viewer_placeholder, viewer)
+        self._viewer_placeholder.deleteLater()
+        self._viewer_placeholder = None
+        self.viewer_widget = viewer
+        
+        # Connect drag-and-drop signals
+        self._connect_viewer_signals()
+        return viewer
     
     def apply_styling(self):
         """Apply minimalistic styling with floating card design."""
-        self.setStyleSheet(get_global_stylesheet())
+        # The global stylesheet is installed once on the QApplication by main();
+        # only install it here if the window is created without it
+        app = QApplication.instance()
+        existing = app.styleSheet() or ""
+        if GLOBAL_STYLESHEET not in existing:
+            app.setStyleSheet(GLOBAL_STYLESHEET + existing)
     
     def _connect_toolbar_signals(self):
         """Connect toolbar signals to handler methods."""
-        self.toolbar.toggle_grid.connect(self._toggle_grid)
-        self.toolbar.toggle_theme.connect(self._toggle_theme)
-        self.toolbar.toggle_wireframe.connect(self._toggle_wireframe)
-        self.toolbar.reset_rotation.connect(self._reset_rotation)
-        self.toolbar.view_front.connect(self._view_front)
-        self.toolbar.view_side.connect(self._view_side)
-        self.toolbar.view_top.connect(self._view_top)
-        self.toolbar.toggle_fullscreen.connect(self._toggle_fullscreen)
-        self.toolbar.toggle_ruler.connect(self._toggle_ruler_mode)
-        self.toolbar.toggle_annotation.connect(self._toggle_annotation_mode)
-        self.toolbar.load_file.connect(self.upload_stl_file)
-        self.toolbar.clear_model.connect(self._clear_current_model)
+        # Toolbars and window all live on the GUI thread, so connect directly
+        self.toolbar.toggle_grid.connect(self._toggle_grid, Qt.DirectConnection)
+        self.toolbar.toggle_theme.connect(self._toggle_theme, Qt.DirectConnection)
+        self.toolbar.toggle_wireframe.connect(self._toggle_wireframe, Qt.DirectConnection)
+        self.toolbar.reset_rotation.connect(self._reset_rotation, Qt.DirectConnection)
+        self.toolbar.view_front.connect(self._view_front, Qt.DirectConnection)
+        self.toolbar.view_side.connect(self._view_side, Qt.DirectConnection)
+        self.toolbar.view_top.connect(self._view_top, Qt.DirectConnection)
+        self.toolbar.toggle_fullscreen.connect(self._toggle_fullscreen, Qt.DirectConnection)
+        self.toolbar.toggle_ruler.connect(self._toggle_ruler_mode, Qt.DirectConnection)
+        self.toolbar.toggle_annotation.connect(self._toggle_annotation_mode, Qt.DirectConnection)
+        self.toolbar.load_file.connect(self.upload_stl_file, Qt.DirectConnection)
+        self.toolbar.clear_model.connect(self._clear_current_model, Qt.DirectConnection)
     
     def _connect_ruler_toolbar_signals(self):
         """Connect ruler toolbar signals to handler methods."""
-        self.ruler_toolbar.view_front.connect(self._ruler_view_front)
-        self.ruler_toolbar.view_left.connect(self._ruler_view_left)
-        self.ruler_toolbar.view_right.connect(self._ruler_view_right)
-        self.ruler_toolbar.view_top.connect(self._ruler_view_top)
-        self.ruler_toolbar.view_bottom.connect(self._ruler_view_bottom)
-        self.ruler_toolbar.view_rear.connect(self._ruler_view_rear)
-        self.ruler_toolbar.clear_measurements.connect(self._clear_measurements)
-        self.ruler_toolbar.exit_ruler.connect(self._exit_ruler_mode)
+        self.ruler_toolbar.view_front.connect(self._ruler_view_front, Qt.DirectConnection)
+        self.ruler_toolbar.view_left.connect(self._ruler_view_left, Qt.DirectConnection)
+        self.ruler_toolbar.view_right.connect(self._ruler_view_right, Qt.DirectConnection)
+        self.ruler_toolbar.view_top.connect(self._ruler_view_top, Qt.DirectConnection)
+        self.ruler_toolbar.view_bottom.connect(self._ruler_view_bottom, Qt.DirectConnection)
+        self.ruler_toolbar.view_rear.connect(self._ruler_view_rear, Qt.DirectConnection)
+        self.ruler_toolbar.clear_measurements.connect(self._clear_measurements, Qt.DirectConnection)
+        self.ruler_toolbar.exit_ruler.connect(self._exit_ruler_mode, Qt.DirectConnection)
     
     def _clear_current_model(self):
         """Clear the current model from the viewer."""
@@ -232,14 +360,16 @@ class STLViewerWindow(QMainWindow):
             self.viewer_widget.click_to_upload.connect(self.upload_stl_file)
         if hasattr(self.viewer_widget, 'drop_error'):
             self.viewer_widget.drop_error.connect(self._show_drop_error)
+        if hasattr(self.viewer_widget, 'plotter_ready'):
+            self.viewer_widget.plotter_ready.connect(self._on_viewer_ready)
     
     def _load_dropped_file(self, file_path):
         """Load a file that was dropped on the viewer."""
         logger.info(f"_load_dropped_file: Loading dropped file: {file_path}")
         
         # Validate file extension
-        file_ext = file_path.lower()
-        if not (file_ext.endswith('.stl') or file_ext.endswith('.step') or file_ext.endswith('.stp') or file_ext.endswith('.3dm') or file_ext.endswith('.obj') or file_ext.endswith('.iges') or file_ext.endswith('.igs')):
+        path = Path(file_path)
+        if path.suffix.lower() not in FILE_TYPES:
             QMessageBox.warning(
                 self,
                 "Invalid File",
@@ -247,114 +377,180 @@ class STLViewerWindow(QMainWindow):
             )
             return
         
-        # Load and display the STL file
-        success = self.viewer_widget.load_stl(file_path)
+        self._load_file(path)
+    
+    def _load_file(self, path):
+        """Read a 3D file on the thread pool; it is displayed by _on_mesh_loaded."""
+        if self._worker is not None:
+            logger.warning(f"_load_file: Another operation is still running, ignoring {path}")
+            return
+        logger.info(f"_load_file: Loading {path} in the background...")
+        worker = MeshLoadWorker(str(path))
+        worker.signals.finished.connect(self._on_mesh_loaded)
+        self._run_worker(worker, f"Loading {path.name}...")
+        if self.viewer_widget is None:
+            # Build the viewer once the busy dialog has painted, so VTK start-up
+            # overlaps with the worker reading the file
+            QTimer.singleShot(0, self._prepare_viewer)
+    
+    def _prepare_viewer(self):
+        """Create the viewer and start its plotter without waiting for the show delay."""
+        viewer = self._ensure_viewer()
+        if hasattr(viewer, 'initialize_soon'):
+            viewer.initialize_soon()
+    
+    def _run_worker(self, worker, label):
+        """Run worker on the global thread pool behind a modal busy dialog."""
+        self._progress = QProgressDialog(label, None, 0, 0, self)
+        self._progress.setWindowTitle("ECTOFORM")
+        self._progress.setCancelButton(None)
+        self._progress.setWindowModality(Qt.WindowModal)
+        self._progress.setMinimumDuration(0)
+        self._progress.show()
+        
+        # The window owns the worker (and its signals object) until it reports back
+        worker.setAutoDelete(False)
+        self._worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _finish_worker(self):
+        """Close the busy dialog and release the finished worker."""
+        if self._progress is not None:
+            self._progress.close()
+            self._progress.deleteLater()
+            self._progress = None
+        self._worker = None
+    
+    def _on_mesh_loaded(self, file_path, mesh, mesh_data, error):
+        """Display a mesh read by MeshLoadWorker and refresh the UI."""
+        if mesh is not None and getattr(self._ensure_viewer(), 'initialization_pending', False):
+            # The viewer was created for this load and its plotter is not set
+            # up yet; keep the busy dialog open until _on_viewer_ready
+            logger.info("_on_mesh_loaded: Waiting for the 3D viewer before displaying the mesh")
+            self._pending_load = (file_path, mesh, mesh_data, error)
+            return
+        
+        self._finish_worker()
+        path = Path(file_path)
+        file_type = FILE_TYPES.get(path.suffix.lower(), "STL")
+        
+        # Adding the mesh to the plotter must happen on the GUI thread
+        success = mesh is not None and self._ensure_viewer().load_stl(file_path, mesh)
         
         if not success:
-            file_ext = file_path.lower()
-            if file_ext.endswith('.step') or file_ext.endswith('.stp'):
-                file_type = "STEP"
-            elif file_ext.endswith('.3dm'):
-                file_type = "3DM"
-            elif file_ext.endswith('.obj'):
-                file_type = "OBJ"
-            elif file_ext.endswith('.iges') or file_ext.endswith('.igs'):
-                file_type = "IGES"
-            else:
-                file_type = "STL"
+            logger.error(f"_on_mesh_loaded: Failed to load file: {file_path}")
             QMessageBox.critical(
                 self,
                 "Error",
                 f"Failed to load {file_type} file:\n{file_path}\n\nPlease ensure the file is a valid {file_type} format."
             )
-        else:
+            return
+        
+        logger.info(f"_on_mesh_loaded: File loaded successfully: {file_path}")
+        # Refresh the title, toolbar and panels with updates suspended so the
+        # window repaints once instead of once per changed widget
+        self.setUpdatesEnabled(False)
+        try:
             # Update window title with filename
-            filename = Path(file_path).name
+            filename = path.name
             self.setWindowTitle(f"ECTOFORM - {filename}")
             # Update toolbar load button to show filename
             self.toolbar.set_loaded_filename(filename)
             # Enable toolbar controls
             self.toolbar.set_stl_loaded(True)
-            # Update dimensions display
-            if hasattr(self.viewer_widget, 'current_mesh'):
-                mesh = self.viewer_widget.current_mesh
-                if mesh is not None:
-                    mesh_data = MeshCalculator.get_mesh_data(mesh)
-                    self.sidebar_panel.update_dimensions(mesh_data, file_path)
+            # Update dimensions display with the measurements taken by the worker;
+            # the viewer displays a copy of the same geometry
+            self.sidebar_panel.update_dimensions(mesh_data, file_path)
             
             # Load any existing annotations for this file
             self._load_annotations_for_file(file_path)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _on_viewer_ready(self, success):
+        """Display a mesh that finished loading before the viewer was ready."""
+        pending, self._pending_load = self._pending_load, None
+        if pending is not None:
+            self._on_mesh_loaded(*pending)
     
     def _show_drop_error(self, error_msg):
         """Show an error message from drag-and-drop."""
         QMessageBox.warning(self, "Upload Error", error_msg)
     
+    @property
+    def current_mesh(self):
+        """Return the mesh shown in the viewer, or None if nothing is loaded."""
+        # Both viewer classes set current_mesh in __init__, so only the
+        # not-yet-created viewer needs checking
+        viewer = self.viewer_widget
+        return None if viewer is None else viewer.current_mesh
+    
+    @property
+    def _plotter(self):
+        """Return the viewer's plotter, or None until the viewer has created it."""
+        return getattr(self.viewer_widget, 'plotter', None)
+    
+    @_safe_slot("toggle grid")
     def _toggle_grid(self):
         """Toggle the background grid."""
-        if hasattr(self.viewer_widget, 'plotter') and self.viewer_widget.plotter is not None:
-            try:
-                if self.toolbar.grid_enabled:
-                    self.viewer_widget.plotter.show_grid()
-                else:
-                    self.viewer_widget.plotter.remove_bounds_axes()
-            except Exception as e:
-                logger.warning(f"Could not toggle grid: {e}")
+        plotter = self._plotter
+        if plotter is None:
+            return
+        if self.toolbar.grid_enabled:
+            plotter.show_grid()
+        else:
+            plotter.remove_bounds_axes()
     
+    @_safe_slot("toggle theme")
     def _toggle_theme(self):
         """Toggle between light and dark viewer theme."""
-        if hasattr(self.viewer_widget, 'plotter') and self.viewer_widget.plotter is not None:
-            try:
-                if self.toolbar.dark_theme:
-                    self.viewer_widget.plotter.background_color = '#1a1a2e'
-                else:
-                    self.viewer_widget.plotter.background_color = 'white'
-            except Exception as e:
-                logger.warning(f"Could not toggle theme: {e}")
+        plotter = self._plotter
+        if plotter is None:
+            return
+        plotter.background_color = '#1a1a2e' if self.toolbar.dark_theme else 'white'
     
+    @_safe_slot("toggle wireframe")
     def _toggle_wireframe(self):
         """Toggle wireframe display mode."""
-        if hasattr(self.viewer_widget, 'current_actor') and self.viewer_widget.current_actor is not None:
-            try:
-                if self.toolbar.wireframe_enabled:
-                    self.viewer_widget.current_actor.GetProperty().SetRepresentationToWireframe()
-                else:
-                    self.viewer_widget.current_actor.GetProperty().SetRepresentationToSurface()
-                self.viewer_widget.plotter.render()
-            except Exception as e:
-                logger.warning(f"Could not toggle wireframe: {e}")
+        actor = getattr(self.viewer_widget, 'current_actor', None)
+        plotter = self._plotter
+        if actor is None or plotter is None:
+            return
+        if self.toolbar.wireframe_enabled:
+            actor.GetProperty().SetRepresentationToWireframe()
+        else:
+            actor.GetProperty().SetRepresentationToSurface()
+        plotter.render()
     
+    @_safe_slot("reset rotation")
     def _reset_rotation(self):
         """Reset view to default isometric rotation."""
-        if hasattr(self.viewer_widget, 'plotter') and self.viewer_widget.plotter is not None:
-            try:
-                self.viewer_widget.plotter.reset_camera()
-                self.viewer_widget.plotter.view_isometric()
-            except Exception as e:
-                logger.warning(f"Could not reset rotation: {e}")
+        plotter = self._plotter
+        if plotter is None:
+            return
+        plotter.reset_camera()
+        plotter.view_isometric()
     
+    @_safe_slot("set front view")
     def _view_front(self):
         """Set camera to front view."""
-        if hasattr(self.viewer_widget, 'plotter') and self.viewer_widget.plotter is not None:
-            try:
-                self.viewer_widget.plotter.view_yz()
-            except Exception as e:
-                logger.warning(f"Could not set front view: {e}")
+        plotter = self._plotter
+        if plotter is not None:
+            plotter.view_yz()
     
+    @_safe_slot("set side view")
     def _view_side(self):
         """Set camera to side view."""
-        if hasattr(self.viewer_widget, 'plotter') and self.viewer_widget.plotter is not None:
-            try:
-                self.viewer_widget.plotter.view_xz()
-            except Exception as e:
-                logger.warning(f"Could not set side view: {e}")
+        plotter = self._plotter
+        if plotter is not None:
+            plotter.view_xz()
     
+    @_safe_slot("set top view")
     def _view_top(self):
         """Set camera to top view."""
-        if hasattr(self.viewer_widget, 'plotter') and self.viewer_widget.plotter is not None:
-            try:
-                self.viewer_widget.plotter.view_xy()
-            except Exception as e:
-                logger.warning(f"Could not set top view: {e}")
+        plotter = self._plotter
+        if plotter is not None:
+            plotter.view_xy()
     
     # ========== Ruler Mode Methods ==========
     
@@ -431,6 +627,7 @@ class STLViewerWindow(QMainWindow):
         self.annotation_panel.annotation_added.connect(self._on_annotation_added)
         self.annotation_panel.annotation_deleted.connect(self._on_annotation_deleted)
         self.annotation_panel.annotation_read_changed.connect(self._on_annotation_read_changed)
+        self.annotation_panel.annotations_marked_read.connect(self._on_annotations_marked_read)
         self.annotation_panel.focus_annotation.connect(self._on_focus_annotation)
         self.annotation_panel.exit_annotation_mode.connect(self._exit_annotation_mode)
         self.annotation_panel.clear_all_requested.connect(self._clear_all_annotations)
@@ -474,7 +671,7 @@ class STLViewerWindow(QMainWindow):
         
         # Add visual marker to the viewer
         if hasattr(self.viewer_widget, 'add_annotation_marker'):
-            self.viewer_widget.add_annotation_marker(annotation.id, point, '#3B82F6')
+            self.viewer_widget.add_annotation_marker(annotation.id, point, MARKER_COLOR_UNREAD)
     
     def _on_annotation_added(self, annotation):
         """Handle annotation added event."""
@@ -501,10 +698,21 @@ class STLViewerWindow(QMainWindow):
     def _on_annotation_read_changed(self, annotation_id: int, is_read: bool):
         """Handle annotation read status change - update marker color."""
         if hasattr(self.viewer_widget, 'update_annotation_marker_color'):
-            color = '#10B981' if is_read else '#3B82F6'  # Green if read, blue if unread
+            color = MARKER_COLOR_READ if is_read else MARKER_COLOR_UNREAD
             self.viewer_widget.update_annotation_marker_color(annotation_id, color)
         logger.info(f"_on_annotation_read_changed: Annotation {annotation_id} is_read={is_read}")
     
+    def _on_annotations_marked_read(self, annotation_ids: list):
+        """Turn the markers of annotations read by Collapse All green, rendering once."""
+        if not hasattr(self.viewer_widget, 'update_annotation_marker_color'):
+            return
+        for annotation_id in annotation_ids:
+            self.viewer_widget.update_annotation_marker_color(annotation_id, MARKER_COLOR_READ, render=False)
+        plotter = self._plotter
+        if plotter is not None:
+            plotter.render()
+        logger.info(f"_on_annotations_marked_read: {len(annotation_ids)} annotations marked read")
+    
     def _toggle_fullscreen(self):
         """Toggle fullscreen mode."""
         if self.toolbar.is_fullscreen:
@@ -521,21 +729,41 @@ class STLViewerWindow(QMainWindow):
             super().keyPressEvent(event)
 
     
+    def _get_file_dialog(self):
+        """Return the open dialog, creating it on first use."""
+        if self._file_dialog is None:
+            from PyQt5.QtWidgets import QFileDialog
+            
+            dialog = QFileDialog(self, "Select 3D File", self._last_dir)
+            dialog.setFileMode(QFileDialog.ExistingFile)
+            dialog.setNameFilters([
+                "3D Files (*.stl *.step *.stp *.3dm *.obj *.iges *.igs)",
+                "STL Files (*.stl)",
+                "STEP Files (*.step *.stp)",
+                "3DM Files (*.3dm)",
+                "OBJ Files (*.obj)",
+                "IGES Files (*.iges *.igs)",
+                "All Files (*)",
+            ])
+            # Skip per-entry icon and symlink lookups, which stall the dialog
+            # on large or network-mounted directories
+            dialog.setOption(QFileDialog.DontUseCustomDirectoryIcons, True)
+            dialog.setOption(QFileDialog.DontResolveSymlinks, True)
+            dialog.setOption(QFileDialog.DontUseNativeDialog, not USE_NATIVE_DIALOG)
+            self._file_dialog = dialog
+        return self._file_dialog
+    
     def upload_stl_file(self):
         """Open file dialog and load selected STL or STEP file."""
         logger.info("upload_stl_file: Opening file dialog...")
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            "Select 3D File",
-            "",
-            "3D Files (*.stl *.step *.stp *.3dm *.obj *.iges *.igs);;STL Files (*.stl);;STEP Files (*.step *.stp);;3DM Files (*.3dm);;OBJ Files (*.obj);;IGES Files (*.iges *.igs);;All Files (*)"
-        )
+        dialog = self._get_file_dialog()
+        file_path = dialog.selectedFiles()[0] if dialog.exec_() else ""
         
         if file_path:
             logger.info(f"upload_stl_file: File selected: {file_path}")
             # Validate file extension
-            file_ext = file_path.lower()
-            if not (file_ext.endswith('.stl') or file_ext.endswith('.step') or file_ext.endswith('.stp') or file_ext.endswith('.3dm') or file_ext.endswith('.obj') or file_ext.endswith('.iges') or file_ext.endswith('.igs')):
+            path = Path(file_path)
+            if path.suffix.lower() not in FILE_TYPES:
                 logger.warning(f"upload_stl_file: Invalid file extension: {file_path}")
                 QMessageBox.warning(
                     self,
@@ -544,43 +772,12 @@ class STLViewerWindow(QMainWindow):
                 )
                 return
             
-            # Load and display the STL file
-            logger.info("upload_stl_file: Loading STL file into viewer...")
-            success = self.viewer_widget.load_stl(file_path)
+            # Remember the directory for the next time the dialog is opened
+            self._last_dir = str(path.parent)
+            self.settings.setValue("last_dir", self._last_dir)
             
-            if not success:
-                logger.error(f"upload_stl_file: Failed to load file: {file_path}")
-                file_ext = file_path.lower()
-                if file_ext.endswith('.step') or file_ext.endswith('.stp'):
-                    file_type = "STEP"
-                elif file_ext.endswith('.3dm'):
-                    file_type = "3DM"
-                elif file_ext.endswith('.obj'):
-                    file_type = "OBJ"
-                elif file_ext.endswith('.iges') or file_ext.endswith('.igs'):
-                    file_type = "IGES"
-                else:
-                    file_type = "STL"
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    f"Failed to load {file_type} file:\n{file_path}\n\nPlease ensure the file is a valid {file_type} format."
-                )
-            else:
-                logger.info(f"upload_stl_file: STL file loaded successfully: {file_path}")
-                # Update window title with filename
-                filename = Path(file_path).name
-                self.setWindowTitle(f"ECTOFORM - {filename}")
-                # Update toolbar load button to show filename
-                self.toolbar.set_loaded_filename(filename)
-                # Enable toolbar controls
-                self.toolbar.set_stl_loaded(True)
-                # Update dimensions display
-                if hasattr(self.viewer_widget, 'current_mesh'):
-                    mesh = self.viewer_widget.current_mesh
-                    if mesh is not None:
-                        mesh_data = MeshCalculator.get_mesh_data(mesh)
-                        self.sidebar_panel.update_dimensions(mesh_data, file_path)
+            # Load and display the file
+            self._load_file(path)
         else:
             logger.info("upload_stl_file: File selection cancelled")
     
@@ -588,7 +785,8 @@ class STLViewerWindow(QMainWindow):
         """Export the current mesh scaled by the given factor."""
         logger.info(f"export_scaled_stl: Exporting scaled STL to {file_path} with scale {scale_factor}")
         
-        if not hasattr(self.viewer_widget, 'current_mesh') or self.viewer_widget.current_mesh is None:
+        mesh = self.current_mesh
+        if mesh is None:
             logger.error("export_scaled_stl: No mesh loaded")
             QMessageBox.warning(
                 self,
@@ -597,41 +795,36 @@ class STLViewerWindow(QMainWindow):
             )
             return
         
+        if self._worker is not None:
+            logger.warning("export_scaled_stl: Another operation is still running")
+            return
+        
+        # Scale and export the mesh in the background
+        worker = MeshExportWorker(mesh, file_path, scale_factor)
+        worker.signals.finished.connect(self._on_export_finished)
+        self._run_worker(worker, "Exporting scaled STL...")
+    
+    def _on_export_finished(self, file_path, error):
+        """Report the result of MeshExportWorker and save annotations alongside."""
+        self._finish_worker()
+        
+        if error:
+            QMessageBox.critical(self, "Export Error", error)
+            return
+        
         try:
-            # Scale and export the mesh
-            scaled_mesh = MeshCalculator.scale_mesh(self.viewer_widget.current_mesh, scale_factor)
-            
-            if scaled_mesh is None:
-                logger.error("export_scaled_stl: Failed to scale mesh")
-                QMessageBox.critical(
-                    self,
-                    "Export Error",
-                    "Failed to scale the mesh. Please try again."
-                )
-                return
-            
-            success = MeshCalculator.export_stl(scaled_mesh, file_path)
+            # Also save annotations if any
+            annotations = self.annotation_panel.export_annotations()
+            if annotations:
+                from core.annotation_exporter import AnnotationExporter
+                AnnotationExporter.save_annotations(annotations, file_path)
+                logger.info(f"export_scaled_stl: Saved {len(annotations)} annotations")
             
-            if success:
-                # Also save annotations if any
-                annotations = self.annotation_panel.export_annotations()
-                if annotations:
-                    from core.annotation_exporter import AnnotationExporter
-                    AnnotationExporter.save_annotations(annotations, file_path)
-                    logger.info(f"export_scaled_stl: Saved {len(annotations)} annotations")
-                
-                logger.info(f"export_scaled_stl: Successfully exported to {file_path}")
-                msg = f"Scaled STL file exported successfully to:\n{file_path}"
-                if annotations:
-                    msg += f"\n\n{len(annotations)} annotations saved."
-                QMessageBox.information(self, "Export Successful", msg)
-            else:
-                logger.error(f"export_scaled_stl: Failed to export to {file_path}")
-                QMessageBox.critical(
-                    self,
-                    "Export Error",
-                    f"Failed to export STL file to:\n{file_path}"
-                )
+            logger.info(f"export_scaled_stl: Successfully exported to {file_path}")
+            msg = f"Scaled STL file exported successfully to:\n{file_path}"
+            if annotations:
+                msg += f"\n\n{len(annotations)} annotations saved."
+            QMessageBox.information(self, "Export Successful", msg)
         except Exception as e:
             logger.error(f"export_scaled_stl: Error during export: {e}", exc_info=True)
             QMessageBox.critical(
@@ -662,7 +855,7 @@ class STLViewerWindow(QMainWindow):
                     ann_id = ann_data['id']
                     point = tuple(ann_data['point'])
                     is_read = ann_data.get('is_read', False)
-                    color = '#10B981' if is_read else '#3B82F6'
+                    color = MARKER_COLOR_READ if is_read else MARKER_COLOR_UNREAD
                     
                     if hasattr(self.viewer_widget, 'add_annotation_marker'):
                         self.viewer_widget.add_annotation_marker(ann_id, point, color)
@@ -685,17 +878,3 @@ class STLViewerWindow(QMainWindow):
         # annotations will be saved on next export
         logger.info("save_current_annotations: Annotations will be saved on export")
         return True
-
-
-def main():
-    """Main function to run the application."""
-    from PyQt5.QtWidgets import QApplication
-    
-    app = QApplication(sys.argv)
-    window = STLViewerWindow()
-    window.show()
-    sys.exit(app.exec())
-
-
-if __name__ == "__main__":
-    main()
@@ -43,6 +43,14 @@ for src_path, dst_path in splash_image_paths:
 
 print(f"[PyInstaller] Final datas list has {len(datas)} items")
 
+# Bundle bytecode compiled ahead of time at optimization level 1 (asserts
+# stripped) instead of the interpreter's default level. PyInstaller accepts
+# the optimize option from 6.6 on; older versions keep their default.
+import PyInstaller
+analysis_options = {}
+if tuple(int(part) for part in PyInstaller.__version__.split('.')[:2]) >= (6, 6):
+    analysis_options['optimize'] = 1
+
 a = Analysis(
     ['main.py'],
     pathex=[],
@@ -118,6 +126,7 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    **analysis_options,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
@@ -59,6 +59,14 @@ except Exception as e:
     print(f"[PyInstaller] Warning: Could not collect casadi DLLs: {e}")
     print("[PyInstaller] casadi DLLs may need to be manually added")
 
+# Bundle bytecode compiled ahead of time at optimization level 1 (asserts
+# stripped) instead of the interpreter's default level. PyInstaller accepts
+# the optimize option from 6.6 on; older versions keep their default.
+import PyInstaller
+analysis_options = {}
+if tuple(int(part) for part in PyInstaller.__version__.split('.')[:2]) >= (6, 6):
+    analysis_options['optimize'] = 1
+
 a = Analysis(
     ['main.py'],
     pathex=[],
@@ -138,6 +146,7 @@ a = Analysis(
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=True,  # Faster imports - files extracted individually instead of from archive
+    **analysis_options,
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
@@ -3,16 +3,28 @@
 Test script to compare different volume calculation methods.
 
 Usage:
-    python test_volume_methods.py <path_to_stl_file> [target_volume]
+    python test_volume_methods.py <path_to_stl_file> [target_volume] [--fast]
+    
+    --fast skips the watertight check.
+    
+    Parsed meshes are cached as .npz files in ~/.cache/ectoform, one per STL
+    file; delete the directory to reclaim the space.
     
 Example:
     python test_volume_methods.py test_file.stl 30182.05
 """
+import hashlib
+import os
 import sys
 import time
 from pathlib import Path
+import numpy as np
 import pyvista as pv
 from core.mesh_calculator import MeshCalculator
+from core.stl_loader import StlLoader
+
+# Parsed meshes are kept here so repeated runs on the same file skip the parse
+CACHE_DIR = Path.home() / ".cache" / "ectoform"
 
 def print_separator():
     """Print a separator line."""
@@ -32,14 +44,65 @@ def format_diff(diff, target):
         return f"{diff:+.2f} ⭐"
     return f"{diff:+.2f}"
 
+def diff_or_inf(result):
+    """Sort key: a result's difference from the target, failures last."""
+    diff = result.get('diff_from_target')
+    return float('inf') if diff is None else diff
+
+def is_watertight(mesh):
+    """Check that every edge of a triangle mesh is shared by exactly two triangles.
+    
+    Counts edges from the face array directly, instead of running VTK's
+    manifold and watertight edge passes over the whole mesh.
+    
+    Returns:
+        bool, or None if the mesh is not made only of triangles
+    """
+    if mesh.n_cells == 0 or not mesh.is_all_triangles:
+        return None
+    triangles = np.asarray(mesh.faces).reshape(-1, 4)[:, 1:]
+    edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    return bool((counts == 2).all())
+
+def load_mesh_cached(stl_file):
+    """Load an STL file, reusing a .npz copy of its arrays from an earlier run.
+    
+    The cache file name includes the file's path, size and modification time,
+    so editing or replacing the STL makes the old entry unused; it is deleted
+    when the new one is written.
+    """
+    stat = stl_file.stat()
+    path_hash = hashlib.sha1(str(stl_file.resolve()).encode("utf-8")).hexdigest()[:12]
+    prefix = f"{stl_file.stem}-{path_hash}-"
+    cache_file = CACHE_DIR / f"{prefix}{stat.st_mtime_ns}-{stat.st_size}.npz"
+    
+    if cache_file.exists():
+        with np.load(cache_file) as data:
+            return pv.PolyData(data["points"], data["faces"]), True
+    
+    mesh = StlLoader.load_stl(str(stl_file))
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for old_file in CACHE_DIR.iterdir():
+            if old_file.name.startswith(prefix) and old_file.suffix == ".npz":
+                old_file.unlink()
+        np.savez(cache_file, points=np.asarray(mesh.points), faces=np.asarray(mesh.faces))
+    except OSError as e:
+        print(f"  (could not write mesh cache: {e})")
+    return mesh, False
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python test_volume_methods.py <stl_file> [target_volume]")
+    args = [arg for arg in sys.argv[1:] if arg != "--fast"]
+    fast = len(args) < len(sys.argv) - 1
+    if not args:
+        print("Usage: python test_volume_methods.py <stl_file> [target_volume] [--fast]")
         print("Example: python test_volume_methods.py test.stl 30182.05")
+        print(f"Parsed meshes are cached in {CACHE_DIR}")
         sys.exit(1)
     
-    stl_file = Path(sys.argv[1])
-    target_volume = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    stl_file = Path(args[0])
+    target_volume = float(args[1]) if len(args) > 1 else None
     
     if not stl_file.exists():
         print(f"Error: File not found: {stl_file}")
@@ -56,8 +119,8 @@ def main():
     # Load mesh
     print("Loading mesh...")
     try:
-        mesh = pv.read(str(stl_file))
-        print(f"✓ Mesh loaded successfully")
+        mesh, from_cache = load_mesh_cached(stl_file)
+        print(f"✓ Mesh loaded successfully{' (from cache)' if from_cache else ''}")
     except Exception as e:
         print(f"✗ Error loading mesh: {e}")
         sys.exit(1)
@@ -66,19 +129,9 @@ def main():
     print("\nMesh Properties:")
     print(f"  Number of points: {mesh.n_points:,}")
     print(f"  Number of cells: {mesh.n_cells:,}")
-    try:
-        is_watertight = mesh.is_manifold and mesh.is_watertight if hasattr(mesh, 'is_manifold') else None
-        if is_watertight is not None:
-            print(f"  Is watertight: {is_watertight}")
-        else:
-            # Try to get watertight status
-            try:
-                test_vol = mesh.volume
-                print(f"  Is watertight: Unknown (volume calculation succeeded)")
-            except:
-                print(f"  Is watertight: Likely False (volume calculation failed)")
-    except:
-        pass
+    if not fast:
+        watertight = is_watertight(mesh)
+        print(f"  Is watertight: {'Unknown (not all triangles)' if watertight is None else watertight}")
     
     bounds = mesh.bounds
     dimensions = MeshCalculator.calculate_dimensions(mesh)
@@ -90,15 +143,17 @@ def main():
     # Calculate volumes using all methods
     print("Calculating volumes using multiple methods...\n")
     start_time = time.time()
-    results = MeshCalculator.calculate_volume_multiple_methods(mesh, target_volume=target_volume)
+    # Methods run side by side in worker processes, so the time below is the
+    # slowest method's rather than the sum of all of them
+    results = MeshCalculator.calculate_volume_multiple_methods(
+        mesh, target_volume=target_volume, max_workers=os.cpu_count()
+    )
     total_time = time.time() - start_time
     
-    # Sort results by difference from target (if available), or by volume
+    # Sort results by difference from target (if available), or by volume;
+    # with a target the first row is also the best match
     if target_volume:
-        sorted_results = sorted(
-            results.items(),
-            key=lambda x: x[1].get('diff_from_target', float('inf')) if x[1].get('diff_from_target') is not None else float('inf')
-        )
+        sorted_results = sorted(results.items(), key=lambda x: diff_or_inf(x[1]))
     else:
         sorted_results = sorted(results.items(), key=lambda x: x[1].get('volume', 0))
     
@@ -130,21 +185,14 @@ def main():
     print_separator()
     print(f"Total calculation time: {total_time:.3f} seconds")
     
-    # Find best match
-    if target_volume:
-        best_match = None
-        best_diff = float('inf')
-        for key, result in results.items():
-            diff = result.get('diff_from_target')
-            if diff is not None and diff < best_diff:
-                best_diff = diff
-                best_match = result
-        
-        if best_match:
-            print(f"\n🏆 Best Match:")
-            print(f"   Method: {best_match['method']}")
-            print(f"   Volume: {best_match['volume']:.2f} mm³")
-            print(f"   Difference: {best_diff:+.2f} mm³ ({100 * best_diff / target_volume:.3f}%)")
+    # Best match is the first row of the table sorted by difference
+    best_match = sorted_results[0][1] if target_volume and sorted_results else None
+    if best_match and best_match.get('diff_from_target') is not None:
+        best_diff = best_match['diff_from_target']
+        print(f"\n🏆 Best Match:")
+        print(f"   Method: {best_match['method']}")
+        print(f"   Volume: {best_match['volume']:.2f} mm³")
+        print(f"   Difference: {best_diff:+.2f} mm³ ({100 * best_diff / target_volume:.3f}%)")
     
     print_separator()
     
@@ -152,12 +200,13 @@ def main():
     successful = [r for r in results.values() if r.get('volume', 0) > 0 and 'error' not in r]
     if successful:
         volumes = [r['volume'] for r in successful]
+        min_volume, max_volume = min(volumes), max(volumes)
         print(f"\nSummary Statistics (successful methods only):")
         print(f"  Number of successful methods: {len(successful)}")
         print(f"  Average volume: {sum(volumes) / len(volumes):.2f} mm³")
-        print(f"  Min volume: {min(volumes):.2f} mm³")
-        print(f"  Max volume: {max(volumes):.2f} mm³")
-        print(f"  Range: {max(volumes) - min(volumes):.2f} mm³")
+        print(f"  Min volume: {min_volume:.2f} mm³")
+        print(f"  Max volume: {max_volume:.2f} mm³")
+        print(f"  Range: {max_volume - min_volume:.2f} mm³")
         if target_volume:
             print(f"  Target: {target_volume:.2f} mm³")
     
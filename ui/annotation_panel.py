@@ -1,21 +1,124 @@
 """
 Annotation Panel UI for displaying and managing 3D model annotations.
 """
+import collections
+import functools
 import logging
+import sys
 from dataclasses import dataclass, field
 from typing import List, Optional, Callable
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QScrollArea, QFrame, QTextEdit, QSizePolicy, QGraphicsDropShadowEffect
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal, pyqtSlot, QPropertyAnimation, QEasingCurve
+from PyQt5.QtGui import QColor
+from ui.components import _get_font
 from ui.styles import default_theme
 
 logger = logging.getLogger(__name__)
 
+# AnnotationCard stylesheets, built once at import instead of per card
+_TITLE_QSS = f"color: {default_theme.text_primary};"
+_COORD_QSS = f"color: {default_theme.text_secondary}; font-size: 9px;"
+_TOGGLE_BTN_QSS = f"""
+    QPushButton {{
+        color: {default_theme.text_secondary};
+        border: none;
+        background: transparent;
+        font-size: 10px;
+    }}
+    QPushButton:hover {{
+        color: {default_theme.text_primary};
+    }}
+"""
+_TEXT_EDIT_QSS = f"""
+    QTextEdit {{
+        background-color: {default_theme.input_bg};
+        border: 1px solid {default_theme.input_border};
+        border-radius: 6px;
+        padding: 6px;
+        font-size: 11px;
+        color: {default_theme.text_primary};
+    }}
+    QTextEdit:focus {{
+        border: 2px solid {default_theme.button_primary};
+    }}
+"""
+_FOCUS_BTN_QSS = f"""
+    QPushButton {{
+        background-color: {default_theme.row_bg_standard};
+        border: 1px solid {default_theme.border_light};
+        border-radius: 4px;
+        padding: 4px 10px;
+        font-size: 10px;
+        color: {default_theme.text_primary};
+    }}
+    QPushButton:hover {{
+        background-color: {default_theme.row_bg_hover};
+    }}
+"""
+_DELETE_BTN_QSS = """
+    QPushButton {
+        background-color: #FEE2E2;
+        border: 1px solid #FECACA;
+        border-radius: 4px;
+        padding: 4px 10px;
+        font-size: 10px;
+        color: #DC2626;
+    }
+    QPushButton:hover {
+        background-color: #FECACA;
+    }
+"""
+_HEADER_QSS = """
+    QFrame#annotationHeader {
+        background-color: transparent;
+        border: none;
+    }
+"""
+
+# Card frame and point indicator colours: green once read, blue while unread.
+# The card and its indicator carry the dynamic property read=true/false, so
+# one stylesheet covers both states.
+_CARD_QSS = """
+    QFrame#annotationCard {
+        border-radius: 8px;
+    }
+    QFrame#annotationCard[read="true"] {
+        background-color: #ECFDF5;
+        border: 1px solid #A7F3D0;
+    }
+    QFrame#annotationCard[read="false"] {
+        background-color: #EFF6FF;
+        border: 1px solid #BFDBFE;
+    }
+    QLabel#pointIndicator {
+        font-size: 14px;
+    }
+    QLabel#pointIndicator[read="true"] {
+        color: #10B981;
+    }
+    QLabel#pointIndicator[read="false"] {
+        color: #3B82F6;
+    }
+"""
+
+# Removed cards kept hidden for reuse, so adding points after deleting some
+# rebinds an existing card instead of building a new widget tree
+_CARD_POOL_SIZE = 16
 
-@dataclass
+# Loaded annotations get cards in batches of this many, the next batch being
+# built as the list is scrolled to its end
+_CARD_BATCH_SIZE = 25
+
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10; older
+# interpreters get a regular dataclass
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Annotation:
     """Data class for a 3D annotation."""
     id: int
@@ -44,6 +147,17 @@ class Annotation:
         )
 
 
+class _ClickableHeader(QFrame):
+    """Card header frame that reports mouse presses as a clicked signal."""
+    
+    clicked = pyqtSignal()
+    
+    def mousePressEvent(self, event):
+        """Emit clicked instead of passing the press on to the card."""
+        self.clicked.emit()
+        event.accept()
+
+
 class AnnotationCard(QFrame):
     """A collapsible card for a single annotation."""
     
@@ -59,6 +173,20 @@ class AnnotationCard(QFrame):
         self.annotation = annotation
         self.is_expanded = annotation.is_expanded
         self.setObjectName("annotationCard")
+        
+        # text_changed is emitted once typing pauses, not on every keystroke;
+        # annotation.text itself is always up to date
+        self._text_timer = QTimer(self)
+        self._text_timer.setSingleShot(True)
+        self._text_timer.setInterval(150)
+        self._text_timer.timeout.connect(self._emit_text_changed)
+        
+        # Visual updates requested while the card is hidden (pooled, or the
+        # panel is closed) are applied once, when it is next shown
+        self._style_dirty = False
+        self._expanded_dirty = False
+        
+        self.setStyleSheet(_CARD_QSS)
         self.init_ui()
         self._update_style()
     
@@ -72,34 +200,33 @@ class AnnotationCard(QFrame):
         main_layout.setSpacing(0)
         
         # Header (always visible)
-        self.header = QFrame()
+        self.header = _ClickableHeader()
         self.header.setObjectName("annotationHeader")
         self.header.setCursor(Qt.PointingHandCursor)
+        self.header.setStyleSheet(_HEADER_QSS)
+        self.header.clicked.connect(self._toggle_expanded)
         header_layout = QHBoxLayout(self.header)
         header_layout.setContentsMargins(10, 8, 10, 8)
         header_layout.setSpacing(8)
         
         # Point indicator (colored dot)
         self.point_indicator = QLabel("●")
+        self.point_indicator.setObjectName("pointIndicator")
         self.point_indicator.setFixedWidth(16)
         self.point_indicator.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(self.point_indicator)
         
         # Title
         self.title_label = QLabel(f"Point {self.annotation.id}")
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(11)
-        self.title_label.setFont(title_font)
-        self.title_label.setStyleSheet(f"color: {default_theme.text_primary};")
+        self.title_label.setFont(_get_font(11, bold=True))
+        self.title_label.setStyleSheet(_TITLE_QSS)
         header_layout.addWidget(self.title_label)
         
         header_layout.addStretch()
         
         # Coordinates (small text)
-        coord_text = f"({self.annotation.point[0]:.1f}, {self.annotation.point[1]:.1f}, {self.annotation.point[2]:.1f})"
-        self.coord_label = QLabel(coord_text)
-        self.coord_label.setStyleSheet(f"color: {default_theme.text_secondary}; font-size: 9px;")
+        self.coord_label = QLabel("(%.1f, %.1f, %.1f)" % tuple(self.annotation.point))
+        self.coord_label.setStyleSheet(_COORD_QSS)
         header_layout.addWidget(self.coord_label)
         
         # Expand/collapse button
@@ -107,23 +234,20 @@ class AnnotationCard(QFrame):
         self.toggle_btn.setFixedSize(24, 24)
         self.toggle_btn.setFlat(True)
         self.toggle_btn.setCursor(Qt.PointingHandCursor)
-        self.toggle_btn.setStyleSheet(f"""
-            QPushButton {{
-                color: {default_theme.text_secondary};
-                border: none;
-                background: transparent;
-                font-size: 10px;
-            }}
-            QPushButton:hover {{
-                color: {default_theme.text_primary};
-            }}
-        """)
+        self.toggle_btn.setStyleSheet(_TOGGLE_BTN_QSS)
         self.toggle_btn.clicked.connect(self._toggle_expanded)
         header_layout.addWidget(self.toggle_btn)
         
         main_layout.addWidget(self.header)
         
-        # Content (collapsible)
+        # Content (collapsible), built the first time the card is expanded so
+        # collapsed cards never create their text edit and buttons
+        self.content = None
+        if self.is_expanded:
+            self._build_content()
+    
+    def _build_content(self):
+        """Create the text edit and action buttons below the header."""
         self.content = QFrame()
         self.content.setObjectName("annotationContent")
         content_layout = QVBoxLayout(self.content)
@@ -136,19 +260,7 @@ class AnnotationCard(QFrame):
         self.text_edit.setText(self.annotation.text)
         self.text_edit.setMinimumHeight(60)
         self.text_edit.setMaximumHeight(100)
-        self.text_edit.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {default_theme.input_bg};
-                border: 1px solid {default_theme.input_border};
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 11px;
-                color: {default_theme.text_primary};
-            }}
-            QTextEdit:focus {{
-                border: 2px solid {default_theme.button_primary};
-            }}
-        """)
+        self.text_edit.setStyleSheet(_TEXT_EDIT_QSS)
         self.text_edit.textChanged.connect(self._on_text_changed)
         content_layout.addWidget(self.text_edit)
         
@@ -159,20 +271,8 @@ class AnnotationCard(QFrame):
         self.focus_btn = QPushButton("🎯 Focus")
         self.focus_btn.setFixedHeight(28)
         self.focus_btn.setCursor(Qt.PointingHandCursor)
-        self.focus_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {default_theme.row_bg_standard};
-                border: 1px solid {default_theme.border_light};
-                border-radius: 4px;
-                padding: 4px 10px;
-                font-size: 10px;
-                color: {default_theme.text_primary};
-            }}
-            QPushButton:hover {{
-                background-color: {default_theme.row_bg_hover};
-            }}
-        """)
-        self.focus_btn.clicked.connect(lambda: self.focus_requested.emit(self.annotation.id))
+        self.focus_btn.setStyleSheet(_FOCUS_BTN_QSS)
+        self.focus_btn.clicked.connect(self._emit_focus)
         btn_layout.addWidget(self.focus_btn)
         
         btn_layout.addStretch()
@@ -180,89 +280,134 @@ class AnnotationCard(QFrame):
         self.delete_btn = QPushButton("🗑 Delete")
         self.delete_btn.setFixedHeight(28)
         self.delete_btn.setCursor(Qt.PointingHandCursor)
-        self.delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #FEE2E2;
-                border: 1px solid #FECACA;
-                border-radius: 4px;
-                padding: 4px 10px;
-                font-size: 10px;
-                color: #DC2626;
-            }}
-            QPushButton:hover {{
-                background-color: #FECACA;
-            }}
-        """)
-        self.delete_btn.clicked.connect(lambda: self.delete_requested.emit(self.annotation.id))
+        self.delete_btn.setStyleSheet(_DELETE_BTN_QSS)
+        self.delete_btn.clicked.connect(self._emit_delete)
         btn_layout.addWidget(self.delete_btn)
         
         content_layout.addLayout(btn_layout)
         
-        main_layout.addWidget(self.content)
-        
-        # Set initial visibility
-        self.content.setVisible(self.is_expanded)
-        
-        # Make header clickable
-        self.header.mousePressEvent = lambda e: self._toggle_expanded()
+        self.layout().addWidget(self.content)
     
+    @pyqtSlot()
     def _toggle_expanded(self):
         """Toggle the expanded state."""
-        self.is_expanded = not self.is_expanded
-        self.annotation.is_expanded = self.is_expanded
-        self.content.setVisible(self.is_expanded)
-        self.toggle_btn.setText("▼" if self.is_expanded else "▶")
+        self._set_expanded(not self.is_expanded)
+    
+    def _set_expanded(self, expanded: bool, notify: bool = True) -> bool:
+        """
+        Expand or collapse the card; collapsing marks the annotation as read.
+        
+        With notify=False no signals are emitted, for callers that report
+        the change for many cards at once.
+        
+        Returns:
+            bool: True if the annotation was newly marked as read
+        """
+        self.is_expanded = expanded
+        self.annotation.is_expanded = expanded
+        self._apply_expanded()
         
         # Mark as read when collapsed
-        if not self.is_expanded and not self.annotation.is_read:
+        marked_read = not expanded and not self.annotation.is_read
+        if marked_read:
             self.annotation.is_read = True
             self._update_style()
-            self.read_status_changed.emit(self.annotation.id, True)
         
-        self.expanded_changed.emit(self.annotation.id, self.is_expanded)
+        if notify:
+            if marked_read:
+                self.read_status_changed.emit(self.annotation.id, True)
+            self.expanded_changed.emit(self.annotation.id, expanded)
+        return marked_read
+    
+    def _apply_expanded(self):
+        """Show or hide the content and set the arrow to match is_expanded."""
+        if not self.isVisible():
+            self._expanded_dirty = True
+            return
+        self._expanded_dirty = False
+        if self.content is not None:
+            self.content.setVisible(self.is_expanded)
+        elif self.is_expanded:
+            self._build_content()
+        self.toggle_btn.setText("▼" if self.is_expanded else "▶")
     
+    def showEvent(self, event):
+        """Apply visual updates deferred while the card was hidden."""
+        if self._expanded_dirty:
+            self._apply_expanded()
+        if self._style_dirty:
+            self._update_style()
+        super().showEvent(event)
+    
+    @pyqtSlot()
+    def _emit_focus(self):
+        """Ask for the view to focus on this card's point."""
+        self.focus_requested.emit(self.annotation.id)
+    
+    @pyqtSlot()
+    def _emit_delete(self):
+        """Ask for this card's annotation to be deleted."""
+        self.delete_requested.emit(self.annotation.id)
+    
+    @pyqtSlot()
     def _on_text_changed(self):
         """Handle text changes."""
         self.annotation.text = self.text_edit.toPlainText()
+        self._text_timer.start()
+    
+    @pyqtSlot()
+    def _emit_text_changed(self):
+        """Report the text once typing has paused."""
         self.text_changed.emit(self.annotation.id, self.annotation.text)
     
     def _update_style(self):
         """Update the card style based on read status."""
-        if self.annotation.is_read:
-            # Green for read
-            indicator_color = "#10B981"
-            bg_color = "#ECFDF5"
-            border_color = "#A7F3D0"
-        else:
-            # Blue for unread
-            indicator_color = "#3B82F6"
-            bg_color = "#EFF6FF"
-            border_color = "#BFDBFE"
-        
-        self.point_indicator.setStyleSheet(f"color: {indicator_color}; font-size: 14px;")
-        self.setStyleSheet(f"""
-            QFrame#annotationCard {{
-                background-color: {bg_color};
-                border: 1px solid {border_color};
-                border-radius: 8px;
-            }}
-        """)
-        self.header.setStyleSheet(f"""
-            QFrame#annotationHeader {{
-                background-color: transparent;
-                border: none;
-            }}
-        """)
+        if not self.isVisible():
+            self._style_dirty = True
+            return
+        self._style_dirty = False
+        is_read = self.annotation.is_read
+        # Re-evaluate the [read] selectors; polishing the card does not reach
+        # its children, so the indicator is polished as well
+        style = self.style()
+        for widget in (self, self.point_indicator):
+            widget.setProperty("read", is_read)
+            style.unpolish(widget)
+            style.polish(widget)
     
     def set_read(self, is_read: bool):
         """Set the read status."""
         self.annotation.is_read = is_read
         self._update_style()
     
-    def collapse(self):
-        """Collapse the card (marks as read)."""
-        if self.is_expanded:
-            self._toggle_expanded()
+    def collapse(self, notify: bool = True) -> bool:
+        """
+        Collapse the card (marks as read).
+        
+        Returns:
+            bool: True if the annotation was newly marked as read
+        """
+        if not self.is_expanded:
+            return False
+        return self._set_expanded(False, notify)
+    
+    def rebind(self, annotation: Annotation):
+        """Show a different annotation in this card, reusing its widgets."""
+        self._text_timer.stop()
+        self.annotation = annotation
+        self.is_expanded = annotation.is_expanded
+        
+        self.title_label.setText(f"Point {annotation.id}")
+        self.coord_label.setText("(%.1f, %.1f, %.1f)" % tuple(annotation.point))
+        
+        if self.content is not None:
+            # Setting the text is not an edit, so keep text_changed quiet
+            self.text_edit.blockSignals(True)
+            self.text_edit.setText(annotation.text)
+            self.text_edit.blockSignals(False)
+        
+        self._apply_expanded()
+        self._update_style()
 
 
 class AnnotationPanel(QWidget):
@@ -276,11 +421,14 @@ class AnnotationPanel(QWidget):
     focus_annotation = pyqtSignal(int)     # annotation_id
     exit_annotation_mode = pyqtSignal()
     clear_all_requested = pyqtSignal()
+    annotations_marked_read = pyqtSignal(list)  # ids marked read by Collapse All
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.annotations: List[Annotation] = []
+        self.annotations: dict = {}  # id -> Annotation, in creation order
         self.annotation_cards: dict = {}  # id -> AnnotationCard
+        self._card_pool: list = []  # hidden AnnotationCards ready for reuse
+        self._pending_annotations = collections.deque()  # loaded, no card yet
         self._next_id = 1
         self.init_ui()
     
@@ -309,10 +457,7 @@ class AnnotationPanel(QWidget):
         # Title row
         title_row = QHBoxLayout()
         title_label = QLabel("📝 Annotations")
-        title_font = QFont()
-        title_font.setBold(True)
-        title_font.setPointSize(12)
-        title_label.setFont(title_font)
+        title_label.setFont(_get_font(12, bold=True))
         title_label.setStyleSheet(f"color: {default_theme.text_title};")
         title_row.addWidget(title_label)
         title_row.addStretch()
@@ -375,6 +520,10 @@ class AnnotationPanel(QWidget):
         
         scroll_area.setWidget(self.content_widget)
         main_layout.addWidget(scroll_area, 1)
+        self.scroll_area = scroll_area
+        scroll_bar = scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._load_more_if_needed)
+        scroll_bar.rangeChanged.connect(self._load_more_if_needed)
         
         # Action buttons
         btn_frame = QFrame()
@@ -444,22 +593,14 @@ class AnnotationPanel(QWidget):
             is_expanded=True,
         )
         self._next_id += 1
-        self.annotations.append(annotation)
-        
-        # Create card
-        card = AnnotationCard(annotation)
-        card.text_changed.connect(self._on_text_changed)
-        card.delete_requested.connect(self._on_delete_requested)
-        card.focus_requested.connect(self._on_focus_requested)
-        card.read_status_changed.connect(self._on_read_status_changed)
-        
-        self.annotation_cards[annotation.id] = card
-        self.content_layout.addWidget(card)
-        
-        # Update UI state
-        self.empty_label.hide()
-        self.clear_btn.setEnabled(True)
-        self.collapse_all_btn.setEnabled(True)
+        self.annotations[annotation.id] = annotation
+        # The new card goes at the end of the list, so any loaded annotations
+        # still waiting for cards get theirs first
+        self._add_pending_cards(len(self._pending_annotations))
+        card = self._add_card(annotation)
+        # Scroll to the card once the list has been laid out with it
+        QTimer.singleShot(0, functools.partial(self.scroll_area.ensureWidgetVisible, card))
+        self._update_ui_state()
         
         self.annotation_added.emit(annotation)
         logger.info(f"Annotation added: id={annotation.id}, point={point}")
@@ -468,91 +609,192 @@ class AnnotationPanel(QWidget):
     
     def remove_annotation(self, annotation_id: int):
         """Remove an annotation by ID."""
-        # Find and remove from list
-        self.annotations = [a for a in self.annotations if a.id != annotation_id]
+        annotation = self.annotations.pop(annotation_id, None)
         
         # Remove card
         if annotation_id in self.annotation_cards:
-            card = self.annotation_cards.pop(annotation_id)
-            self.content_layout.removeWidget(card)
-            card.deleteLater()
+            self._release_card(self.annotation_cards.pop(annotation_id))
+        elif annotation in self._pending_annotations:
+            self._pending_annotations.remove(annotation)
         
-        # Update UI state
-        if not self.annotations:
-            self.empty_label.show()
-            self.clear_btn.setEnabled(False)
-            self.collapse_all_btn.setEnabled(False)
+        self._update_ui_state()
         
         self.annotation_deleted.emit(annotation_id)
         logger.info(f"Annotation removed: id={annotation_id}")
     
     def clear_all(self):
         """Remove all annotations."""
-        for annotation_id in list(self.annotation_cards.keys()):
-            self.remove_annotation(annotation_id)
+        # Remove every card with updates off, so the list is laid out once
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            self._remove_all_cards()
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+        self._update_ui_state()
+    
+    def _add_card(self, annotation: Annotation):
+        """Append a card for an annotation, reusing a pooled one if available, and return it."""
+        if self._card_pool:
+            card = self._card_pool.pop()
+            card.rebind(annotation)
+        else:
+            card = AnnotationCard(annotation)
+            card.text_changed.connect(self._on_text_changed)
+            card.delete_requested.connect(self._on_delete_requested)
+            card.focus_requested.connect(self._on_focus_requested)
+            card.read_status_changed.connect(self._on_read_status_changed)
+        
+        self.annotation_cards[annotation.id] = card
+        self.content_layout.addWidget(card)
+        card.show()
+        return card
+    
+    def _release_card(self, card: AnnotationCard):
+        """Take a card out of the list, keeping it for reuse while the pool has room."""
+        if len(self._card_pool) < _CARD_POOL_SIZE:
+            self.content_layout.removeWidget(card)
+            card.hide()
+            self._card_pool.append(card)
+        else:
+            # Unparenting already takes the card out of the layout; a separate
+            # removeWidget would only invalidate it a second time
+            card.setParent(None)
+            card.deleteLater()
+    
+    def _add_pending_cards(self, count: int):
+        """Build cards for the next count loaded annotations that have none."""
+        count = min(count, len(self._pending_annotations))
+        if not count:
+            return
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            for _ in range(count):
+                self._add_card(self._pending_annotations.popleft())
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+    
+    @pyqtSlot()
+    def _load_more_if_needed(self):
+        """Build the next batch of cards once the list is scrolled near its end."""
+        if not self._pending_annotations or not self.isVisible():
+            return
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        if scroll_bar.value() < scroll_bar.maximum() - scroll_bar.pageStep():
+            return
+        self._add_pending_cards(_CARD_BATCH_SIZE)
+        # The new cards may still not fill the viewport, in which case the
+        # scroll range does not change; check again once they are laid out
+        QTimer.singleShot(0, self._load_more_if_needed)
+    
+    def showEvent(self, event):
+        """Fill the list with cards for annotations loaded while hidden."""
+        super().showEvent(event)
+        self._load_more_if_needed()
+    
+    def _remove_all_cards(self):
+        """Drop every annotation and card without refreshing the panel state."""
+        removed_ids = list(self.annotations)
+        for card in self.annotation_cards.values():
+            self._release_card(card)
+        self.annotation_cards.clear()
+        self._pending_annotations.clear()
+        self.annotations.clear()
         self._next_id = 1
+        
+        for annotation_id in removed_ids:
+            self.annotation_deleted.emit(annotation_id)
+        if removed_ids:
+            logger.info(f"Annotations removed: {len(removed_ids)}")
+    
+    def _update_ui_state(self):
+        """Show the empty hint and enable the buttons to match the annotations."""
+        has_annotations = bool(self.annotations)
+        self.empty_label.setVisible(not has_annotations)
+        self.clear_btn.setEnabled(has_annotations)
+        self.collapse_all_btn.setEnabled(has_annotations)
     
     def get_annotations(self) -> List[Annotation]:
         """Get all annotations."""
-        return self.annotations.copy()
+        return list(self.annotations.values())
     
     def get_annotation_by_id(self, annotation_id: int) -> Optional[Annotation]:
         """Get an annotation by ID."""
-        for a in self.annotations:
-            if a.id == annotation_id:
-                return a
-        return None
+        return self.annotations.get(annotation_id)
     
     def load_annotations(self, data: List[dict]):
         """Load annotations from serialized data."""
-        self.clear_all()
-        for item in data:
-            annotation = Annotation.from_dict(item)
-            self.annotations.append(annotation)
-            
-            # Create card
-            card = AnnotationCard(annotation)
-            card.text_changed.connect(self._on_text_changed)
-            card.delete_requested.connect(self._on_delete_requested)
-            card.focus_requested.connect(self._on_focus_requested)
+        # Swap the whole list with updates off and lay it out once at the end
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            self._remove_all_cards()
+            for item in data:
+                annotation = Annotation.from_dict(item)
+                self.annotations[annotation.id] = annotation
+                # Only the first batch gets cards now; the rest are built as
+                # the list is scrolled
+                if len(self.annotation_cards) < _CARD_BATCH_SIZE:
+                    self._add_card(annotation)
+                else:
+                    self._pending_annotations.append(annotation)
+                
+                # Update next ID
+                if annotation.id >= self._next_id:
+                    self._next_id = annotation.id + 1
             
-            self.annotation_cards[annotation.id] = card
-            self.content_layout.addWidget(card)
-            
-            # Update next ID
-            if annotation.id >= self._next_id:
-                self._next_id = annotation.id + 1
-        
-        if self.annotations:
-            self.empty_label.hide()
-            self.clear_btn.setEnabled(True)
-            self.collapse_all_btn.setEnabled(True)
+            self._update_ui_state()
+            self.content_layout.activate()
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
     
     def export_annotations(self) -> List[dict]:
         """Export all annotations as serializable data."""
-        return [a.to_dict() for a in self.annotations]
+        return [a.to_dict() for a in self.annotations.values()]
     
+    @pyqtSlot(int, str)
     def _on_text_changed(self, annotation_id: int, text: str):
         """Handle text change in a card."""
         self.annotation_updated.emit(annotation_id, text)
     
+    @pyqtSlot(int)
     def _on_delete_requested(self, annotation_id: int):
         """Handle delete request from a card."""
         self.remove_annotation(annotation_id)
     
+    @pyqtSlot(int)
     def _on_focus_requested(self, annotation_id: int):
         """Handle focus request from a card."""
         self.focus_annotation.emit(annotation_id)
     
+    @pyqtSlot()
     def _on_clear_all(self):
         """Handle clear all button click."""
         self.clear_all_requested.emit()
     
+    @pyqtSlot(int, bool)
     def _on_read_status_changed(self, annotation_id: int, is_read: bool):
         """Handle read status change from a card."""
         self.annotation_read_changed.emit(annotation_id, is_read)
     
+    @pyqtSlot()
     def _collapse_all(self):
         """Collapse all annotation cards."""
-        for card in self.annotation_cards.values():
-            card.collapse()
+        # Collapse every card with updates off, then report the annotations
+        # that became read in one signal instead of one per card
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            marked_read = [
+                annotation_id for annotation_id, card in self.annotation_cards.items()
+                if card.collapse(notify=False)
+            ]
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+        
+        # Annotations without a card yet are collapsed in place
+        for annotation in self._pending_annotations:
+            annotation.is_expanded = False
+            if not annotation.is_read:
+                annotation.is_read = True
+                marked_read.append(annotation.id)
+        
+        if marked_read:
+            self.annotations_marked_read.emit(marked_read)
@@ -3,28 +3,128 @@ Reusable UI components for the ECTOFORM application.
 """
 from PyQt5.QtWidgets import (
     QFrame, QLabel, QHBoxLayout, QVBoxLayout,
-    QSpacerItem, QSizePolicy, QCheckBox, QWidget
+    QSizePolicy, QCheckBox, QWidget
 )
-from PyQt5.QtCore import Qt, QEvent
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QPainter, QColor
 from ui.styles import default_theme
 
 
-class DimensionRow(QFrame):
-    """A reusable dimension row component with hover effect."""
+# Fonts shared by the row and card components, keyed by (point size, bold)
+_fonts = {}
+
+
+def _get_font(point_size, bold=False):
+    """Return a shared QFont, creating it on first use (after QApplication exists)."""
+    key = (point_size, bold)
+    font = _fonts.get(key)
+    if font is None:
+        font = QFont()
+        font.setPointSize(point_size)
+        font.setBold(bold)
+        _fonts[key] = font
+    return font
+
+
+_LEFT_ACCENT = "border-left: 4px solid {}; border-top: none; border-right: none; border-bottom: none;"
+
+
+def _row_qss(object_name, normal, hovered):
+    """Build the frame stylesheet for a value row, including its hover state.
+
+    Args:
+        object_name: Object name the row frame is selected by.
+        normal: (background, border) pair for the resting state.
+        hovered: (background, border) pair applied under the mouse.
+    """
+    return f"""
+        QFrame#{object_name} {{
+            background-color: {normal[0]};
+            {normal[1]}
+            border-radius: 8px;
+        }}
+        QFrame#{object_name}:hover {{
+            background-color: {hovered[0]};
+            {hovered[1]}
+        }}
+    """
+
+
+# Row frame stylesheets keyed by objectName. The hover state is a :hover rule,
+# so Qt's style engine handles Enter/Leave without a Python event filter.
+_ROW_QSS = {}
+for _name, _normal, _hovered in (
+    ("dimensionRow",
+     (default_theme.row_bg_standard, "border: none;"),
+     (default_theme.row_bg_hover, "border: none;")),
+    ("surfaceRowStandard",
+     (default_theme.row_bg_standard, "border: none;"),
+     (default_theme.row_bg_hover, "border: none;")),
+    ("surfaceRowHighlight",
+     (default_theme.row_bg_highlight, _LEFT_ACCENT.format(default_theme.border_highlight)),
+     (default_theme.row_bg_highlight_hover, _LEFT_ACCENT.format(default_theme.border_highlight))),
+    ("weightRowStandard",
+     (default_theme.row_bg_standard, "border: none;"),
+     (default_theme.row_bg_hover, "border: none;")),
+    ("weightRowHighlight",
+     (default_theme.row_bg_highlight, f"border: 1px solid {default_theme.border_highlight};"),
+     (default_theme.row_bg_highlight_hover, f"border: 1px solid {default_theme.border_highlight};")),
+    ("scaleRowStandard",
+     (default_theme.row_bg_standard, "border: none;"),
+     (default_theme.row_bg_hover, "border: none;")),
+    ("scaleRowHighlight",
+     (default_theme.row_bg_highlight, f"border: 1px solid {default_theme.border_highlight};"),
+     (default_theme.row_bg_highlight_hover, f"border: 1px solid {default_theme.border_highlight};")),
+    ("scaleRowComparison",
+     ("#FFF7ED", _LEFT_ACCENT.format("#FB923C")),
+     ("#FFEDD5", _LEFT_ACCENT.format("#FB923C"))),
+    ("scaleRowVolume",
+     (default_theme.row_bg_standard, f"border: 1px solid {default_theme.border_light};"),
+     (default_theme.row_bg_hover, f"border: 1px solid {default_theme.border_medium};")),
+):
+    _ROW_QSS[_name] = _row_qss(_name, _normal, _hovered)
+del _name, _normal, _hovered
+
+# Row label/value text; transparent so the row frame's background shows through
+_ROW_LABEL_QSS = f"background-color: transparent; color: {default_theme.text_secondary};"
+_ROW_VALUE_QSS = f"background-color: transparent; color: {default_theme.text_primary};"
+
+
+_CHECKBOX_ROW_QSS = f"""
+    QFrame#reportCheckboxRow {{
+        background-color: {default_theme.row_bg_standard};
+        border-radius: 6px;
+        border: none;
+    }}
+    QFrame#reportCheckboxRow:hover {{
+        background-color: {default_theme.row_bg_hover};
+    }}
+"""
+
+_CHECKBOX_ROW_DISABLED_QSS = f"""
+    QFrame#reportCheckboxRow {{
+        background-color: {default_theme.button_default_bg};
+        border-radius: 6px;
+        border: none;
+    }}
+"""
+
+
+class _ValueRow(QFrame):
+    """Fixed-height row showing a label on the left and a value on the right.
+
+    The row frame is styled from _ROW_QSS by object_name; the label and value
+    get the object names <child_prefix>Label and <child_prefix>Value. An
+    optional unit is kept in its own static label after the value, so numeric
+    updates via set_number only replace the digits.
+    """
     
-    def __init__(self, label_text, value_text="--", parent=None):
+    def __init__(self, label_text, value_text, object_name, child_prefix, parent=None, unit=None):
         super().__init__(parent)
-        self.setObjectName("dimensionRow")
+        self.setObjectName(object_name)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         self.setFixedHeight(44)
-        self.setStyleSheet(f"""
-            QFrame#dimensionRow {{
-                background-color: {default_theme.row_bg_standard};
-                border-radius: 8px;
-                border: none;
-            }}
-        """)
+        self.setStyleSheet(_ROW_QSS[object_name])
         
         row_layout = QHBoxLayout(self)
         row_layout.setContentsMargins(14, 8, 14, 8)
@@ -32,285 +132,65 @@ class DimensionRow(QFrame):
         
         # Label
         label = QLabel(label_text)
-        label.setObjectName("dimensionLabel")
-        label.setStyleSheet(f"background-color: transparent; color: {default_theme.text_secondary};")
-        label_font = QFont()
-        label_font.setPointSize(11)
-        label.setFont(label_font)
-        
-        # Spacer
-        spacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
+        label.setObjectName(child_prefix + "Label")
+        label.setStyleSheet(_ROW_LABEL_QSS)
+        label.setFont(_get_font(11))
         
         # Value
         self.value_label = QLabel(value_text)
-        self.value_label.setObjectName("dimensionValue")
-        self.value_label.setStyleSheet(f"background-color: transparent; color: {default_theme.text_primary};")
-        value_font = QFont()
-        value_font.setPointSize(13)
-        value_font.setBold(True)
-        self.value_label.setFont(value_font)
+        self.value_label.setObjectName(child_prefix + "Value")
+        self.value_label.setStyleSheet(_ROW_VALUE_QSS)
+        self.value_label.setFont(_get_font(13, bold=True))
         self.value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         
         row_layout.addWidget(label)
-        row_layout.addItem(spacer)
+        row_layout.addStretch(1)
         row_layout.addWidget(self.value_label)
         
-        # Install event filter for hover effect
-        self.installEventFilter(self)
-    
-    def eventFilter(self, obj, event):
-        """Handle hover events."""
-        if obj == self:
-            if event.type() == QEvent.Enter:
-                self.setStyleSheet(f"""
-                    QFrame#dimensionRow {{
-                        background-color: {default_theme.row_bg_hover};
-                        border-radius: 8px;
-                    }}
-                """)
-            elif event.type() == QEvent.Leave:
-                self.setStyleSheet(f"""
-                    QFrame#dimensionRow {{
-                        background-color: {default_theme.row_bg_standard};
-                        border-radius: 8px;
-                    }}
-                """)
-        return super().eventFilter(obj, event)
+        # Unit, hidden while the value is a placeholder such as "--"
+        self.unit_label = None
+        if unit:
+            self.unit_label = QLabel(" " + unit)
+            self.unit_label.setObjectName(child_prefix + "Value")
+            self.unit_label.setStyleSheet(_ROW_VALUE_QSS)
+            self.unit_label.setFont(_get_font(13, bold=True))
+            self.unit_label.setVisible(False)
+            row_layout.addWidget(self.unit_label)
     
     def set_value(self, text):
-        """Update the value label text."""
+        """Update the value label text, hiding the unit (if any)."""
+        self.value_label.setText(text)
+        if self.unit_label is not None:
+            self.unit_label.setVisible(False)
+    
+    def set_number(self, text):
+        """Update the value label with formatted digits followed by the unit."""
         self.value_label.setText(text)
+        if self.unit_label is not None:
+            self.unit_label.setVisible(True)
 
 
-class SurfaceAreaRow(QFrame):
-    """A reusable surface area row component with hover effect."""
-    
-    def __init__(self, label_text, value_text="--", row_type="standard", parent=None):
-        super().__init__(parent)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.setFixedHeight(44)
-        
-        if row_type == "standard":
-            self.setObjectName("surfaceRowStandard")
-            self.setStyleSheet(f"""
-                QFrame#surfaceRowStandard {{
-                    background-color: {default_theme.row_bg_standard};
-                    border-radius: 8px;
-                    border: none;
-                }}
-            """)
-        elif row_type == "highlight":
-            self.setObjectName("surfaceRowHighlight")
-            self.setStyleSheet(f"""
-                QFrame#surfaceRowHighlight {{
-                    background-color: {default_theme.row_bg_highlight};
-                    border-left: 4px solid {default_theme.border_highlight};
-                    border-top: none;
-                    border-right: none;
-                    border-bottom: none;
-                    border-radius: 8px;
-                }}
-            """)
-        else:
-            self.setObjectName("surfaceRowStandard")
-            self.setStyleSheet(f"""
-                QFrame#surfaceRowStandard {{
-                    background-color: {default_theme.row_bg_standard};
-                    border-radius: 8px;
-                    border: none;
-                }}
-            """)
-        
-        row_layout = QHBoxLayout(self)
-        row_layout.setContentsMargins(14, 8, 14, 8)
-        row_layout.setSpacing(0)
-        
-        # Label
-        label = QLabel(label_text)
-        label.setObjectName("surfaceLabel")
-        label.setStyleSheet(f"background-color: transparent; color: {default_theme.text_secondary};")
-        label_font = QFont()
-        label_font.setPointSize(11)
-        label.setFont(label_font)
-        
-        # Spacer
-        spacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
-        
-        # Value
-        self.value_label = QLabel(value_text)
-        self.value_label.setObjectName("surfaceValue")
-        self.value_label.setStyleSheet(f"background-color: transparent; color: {default_theme.text_primary};")
-        value_font = QFont()
-        value_font.setPointSize(13)
-        value_font.setBold(True)
-        self.value_label.setFont(value_font)
-        self.value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        
-        row_layout.addWidget(label)
-        row_layout.addItem(spacer)
-        row_layout.addWidget(self.value_label)
-        
-        # Install event filter for hover effect
-        self.installEventFilter(self)
+class DimensionRow(_ValueRow):
+    """A reusable dimension row component with hover effect."""
     
-    def eventFilter(self, obj, event):
-        """Handle hover events."""
-        if obj == self:
-            obj_name = self.objectName()
-            if obj_name == "surfaceRowStandard":
-                if event.type() == QEvent.Enter:
-                    self.setStyleSheet(f"""
-                        QFrame#surfaceRowStandard {{
-                            background-color: {default_theme.row_bg_hover};
-                            border-radius: 8px;
-                        }}
-                    """)
-                elif event.type() == QEvent.Leave:
-                    self.setStyleSheet(f"""
-                        QFrame#surfaceRowStandard {{
-                            background-color: {default_theme.row_bg_standard};
-                            border-radius: 8px;
-                        }}
-                    """)
-            elif obj_name == "surfaceRowHighlight":
-                if event.type() == QEvent.Enter:
-                    self.setStyleSheet(f"""
-                        QFrame#surfaceRowHighlight {{
-                            background-color: {default_theme.row_bg_highlight_hover};
-                            border-left: 4px solid {default_theme.border_highlight};
-                            border-top: none;
-                            border-right: none;
-                            border-bottom: none;
-                            border-radius: 8px;
-                        }}
-                    """)
-                elif event.type() == QEvent.Leave:
-                    self.setStyleSheet(f"""
-                        QFrame#surfaceRowHighlight {{
-                            background-color: {default_theme.row_bg_highlight};
-                            border-left: 4px solid {default_theme.border_highlight};
-                            border-top: none;
-                            border-right: none;
-                            border-bottom: none;
-                            border-radius: 8px;
-                        }}
-                    """)
-        return super().eventFilter(obj, event)
+    def __init__(self, label_text, value_text="--", parent=None, unit=None):
+        super().__init__(label_text, value_text, "dimensionRow", "dimension", parent, unit)
+
+
+class SurfaceAreaRow(_ValueRow):
+    """A reusable surface area row component with hover effect."""
     
-    def set_value(self, text):
-        """Update the value label text."""
-        self.value_label.setText(text)
+    def __init__(self, label_text, value_text="--", row_type="standard", parent=None, unit=None):
+        object_name = {"highlight": "surfaceRowHighlight"}.get(row_type, "surfaceRowStandard")
+        super().__init__(label_text, value_text, object_name, "surface", parent, unit)
 
 
-class WeightRow(QFrame):
+class WeightRow(_ValueRow):
     """A reusable weight row component with hover effect."""
     
-    def __init__(self, label_text, value_text="--", row_type="standard", parent=None):
-        super().__init__(parent)
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.setFixedHeight(44)
-        
-        if row_type == "standard":
-            self.setObjectName("weightRowStandard")
-            self.setStyleSheet(f"""
-                QFrame#weightRowStandard {{
-                    background-color: {default_theme.row_bg_standard};
-                    border-radius: 8px;
-                    border: none;
-                }}
-            """)
-        elif row_type == "highlight":
-            self.setObjectName("weightRowHighlight")
-            self.setStyleSheet(f"""
-                QFrame#weightRowHighlight {{
-                    background-color: {default_theme.row_bg_highlight};
-                    border: 1px solid {default_theme.border_highlight};
-                    border-radius: 8px;
-                }}
-            """)
-        else:
-            self.setObjectName("weightRowStandard")
-            self.setStyleSheet(f"""
-                QFrame#weightRowStandard {{
-                    background-color: {default_theme.row_bg_standard};
-                    border-radius: 8px;
-                    border: none;
-                }}
-            """)
-        
-        row_layout = QHBoxLayout(self)
-        row_layout.setContentsMargins(14, 8, 14, 8)
-        row_layout.setSpacing(0)
-        
-        # Label
-        label = QLabel(label_text)
-        label.setObjectName("weightLabel")
-        label.setStyleSheet(f"background-color: transparent; color: {default_theme.text_secondary};")
-        label_font = QFont()
-        label_font.setPointSize(11)
-        label.setFont(label_font)
-        
-        # Spacer
-        spacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
-        
-        # Value
-        self.value_label = QLabel(value_text)
-        self.value_label.setObjectName("weightValue")
-        self.value_label.setStyleSheet(f"background-color: transparent; color: {default_theme.text_primary};")
-        value_font = QFont()
-        value_font.setPointSize(13)
-        value_font.setBold(True)
-        self.value_label.setFont(value_font)
-        self.value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        
-        row_layout.addWidget(label)
-        row_layout.addItem(spacer)
-        row_layout.addWidget(self.value_label)
-        
-        # Install event filter for hover effect
-        self.installEventFilter(self)
-    
-    def eventFilter(self, obj, event):
-        """Handle hover events."""
-        if obj == self:
-            obj_name = self.objectName()
-            if obj_name == "weightRowStandard":
-                if event.type() == QEvent.Enter:
-                    self.setStyleSheet(f"""
-                        QFrame#weightRowStandard {{
-                            background-color: {default_theme.row_bg_hover};
-                            border-radius: 8px;
-                        }}
-                    """)
-                elif event.type() == QEvent.Leave:
-                    self.setStyleSheet(f"""
-                        QFrame#weightRowStandard {{
-                            background-color: {default_theme.row_bg_standard};
-                            border-radius: 8px;
-                        }}
-                    """)
-            elif obj_name == "weightRowHighlight":
-                if event.type() == QEvent.Enter:
-                    self.setStyleSheet(f"""
-                        QFrame#weightRowHighlight {{
-                            background-color: {default_theme.row_bg_highlight_hover};
-                            border: 1px solid {default_theme.border_highlight};
-                            border-radius: 8px;
-                        }}
-                    """)
-                elif event.type() == QEvent.Leave:
-                    self.setStyleSheet(f"""
-                        QFrame#weightRowHighlight {{
-                            background-color: {default_theme.row_bg_highlight};
-                            border: 1px solid {default_theme.border_highlight};
-                            border-radius: 8px;
-                        }}
-                    """)
-        return super().eventFilter(obj, event)
-    
-    def set_value(self, text):
-        """Update the value label text."""
-        self.value_label.setText(text)
+    def __init__(self, label_text, value_text="--", row_type="standard", parent=None, unit=None):
+        object_name = {"highlight": "weightRowHighlight"}.get(row_type, "weightRowStandard")
+        super().__init__(label_text, value_text, object_name, "weight", parent, unit)
 
 
 class InfoCard(QFrame):
@@ -327,10 +207,7 @@ class InfoCard(QFrame):
         
         # Card title
         title_label = QLabel(title)
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_get_font(14, bold=True))
         title_label.setStyleSheet(f"color: {default_theme.text_title}; margin-bottom: 4px;")
         self.card_layout.addWidget(title_label)
     
@@ -351,177 +228,17 @@ class Separator(QFrame):
         self.setStyleSheet(f"background-color: {default_theme.separator}; max-height: 1px; margin: 6px 0;")
 
 
-class ScaleResultRow(QFrame):
+class ScaleResultRow(_ValueRow):
     """A reusable scale result row component with hover effect."""
     
-    def __init__(self, label_text, value_text="--", row_type="standard", parent=None):
-        super().__init__(parent)
+    def __init__(self, label_text, value_text="--", row_type="standard", parent=None, unit=None):
+        object_name = {
+            "highlight": "scaleRowHighlight",
+            "comparison": "scaleRowComparison",
+            "volume": "scaleRowVolume",
+        }.get(row_type, "scaleRowStandard")
+        super().__init__(label_text, value_text, object_name, "scale", parent, unit)
         self.row_type = row_type
-        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.setFixedHeight(44)
-        
-        if row_type == "standard":
-            self.setObjectName("scaleRowStandard")
-            self.setStyleSheet(f"""
-                QFrame#scaleRowStandard {{
-                    background-color: {default_theme.row_bg_standard};
-                    border-radius: 8px;
-                    border: none;
-                }}
-            """)
-        elif row_type == "highlight":
-            self.setObjectName("scaleRowHighlight")
-            self.setStyleSheet(f"""
-                QFrame#scaleRowHighlight {{
-                    background-color: {default_theme.row_bg_highlight};
-                    border: 1px solid {default_theme.border_highlight};
-                    border-radius: 8px;
-                }}
-            """)
-        elif row_type == "comparison":
-            self.setObjectName("scaleRowComparison")
-            self.setStyleSheet(f"""
-                QFrame#scaleRowComparison {{
-                    background-color: #FFF7ED;
-                    border-left: 4px solid #FB923C;
-                    border-top: none;
-                    border-right: none;
-                    border-bottom: none;
-                    border-radius: 8px;
-                }}
-            """)
-        elif row_type == "volume":
-            self.setObjectName("scaleRowVolume")
-            self.setStyleSheet(f"""
-                QFrame#scaleRowVolume {{
-                    background-color: {default_theme.row_bg_standard};
-                    border: 1px solid {default_theme.border_light};
-                    border-radius: 8px;
-                }}
-            """)
-        else:
-            self.setObjectName("scaleRowStandard")
-            self.setStyleSheet(f"""
-                QFrame#scaleRowStandard {{
-                    background-color: {default_theme.row_bg_standard};
-                    border-radius: 8px;
-                    border: none;
-                }}
-            """)
-        
-        row_layout = QHBoxLayout(self)
-        row_layout.setContentsMargins(14, 8, 14, 8)
-        row_layout.setSpacing(0)
-        
-        # Label
-        label = QLabel(label_text)
-        label.setObjectName("scaleLabel")
-        label.setStyleSheet(f"background-color: transparent; color: {default_theme.text_secondary};")
-        label_font = QFont()
-        label_font.setPointSize(11)
-        label.setFont(label_font)
-        
-        # Spacer
-        spacer = QSpacerItem(40, 20, QSizePolicy.Expanding, QSizePolicy.Minimum)
-        
-        # Value
-        self.value_label = QLabel(value_text)
-        self.value_label.setObjectName("scaleValue")
-        self.value_label.setStyleSheet(f"background-color: transparent; color: {default_theme.text_primary};")
-        value_font = QFont()
-        value_font.setPointSize(13)
-        value_font.setBold(True)
-        self.value_label.setFont(value_font)
-        self.value_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        
-        row_layout.addWidget(label)
-        row_layout.addItem(spacer)
-        row_layout.addWidget(self.value_label)
-        
-        # Install event filter for hover effect
-        self.installEventFilter(self)
-    
-    def eventFilter(self, obj, event):
-        """Handle hover events."""
-        if obj == self:
-            obj_name = self.objectName()
-            if obj_name == "scaleRowStandard":
-                if event.type() == QEvent.Enter:
-                    self.setStyleSheet(f"""
-                        QFrame#scaleRowStandard {{
-                            background-color: {default_theme.row_bg_hover};
-                            border-radius: 8px;
-                        }}
-                    """)
-                elif event.type() == QEvent.Leave:
-                    self.setStyleSheet(f"""
-                        QFrame#scaleRowStandard {{
-                            background-color: {default_theme.row_bg_standard};
-                            border-radius: 8px;
-                        }}
-                    """)
-            elif obj_name == "scaleRowVolume":
-                if event.type() == QEvent.Enter:
-                    self.setStyleSheet(f"""
-                        QFrame#scaleRowVolume {{
-                            background-color: {default_theme.row_bg_hover};
-                            border: 1px solid {default_theme.border_medium};
-                            border-radius: 8px;
-                        }}
-                    """)
-                elif event.type() == QEvent.Leave:
-                    self.setStyleSheet(f"""
-                        QFrame#scaleRowVolume {{
-                            background-color: {default_theme.row_bg_standard};
-                            border: 1px solid {default_theme.border_light};
-                            border-radius: 8px;
-                        }}
-                    """)
-            elif obj_name == "scaleRowHighlight":
-                if event.type() == QEvent.Enter:
-                    self.setStyleSheet(f"""
-                        QFrame#scaleRowHighlight {{
-                            background-color: {default_theme.row_bg_highlight_hover};
-                            border: 1px solid {default_theme.border_highlight};
-                            border-radius: 8px;
-                        }}
-                    """)
-                elif event.type() == QEvent.Leave:
-                    self.setStyleSheet(f"""
-                        QFrame#scaleRowHighlight {{
-                            background-color: {default_theme.row_bg_highlight};
-                            border: 1px solid {default_theme.border_highlight};
-                            border-radius: 8px;
-                        }}
-                    """)
-            elif obj_name == "scaleRowComparison":
-                if event.type() == QEvent.Enter:
-                    self.setStyleSheet(f"""
-                        QFrame#scaleRowComparison {{
-                            background-color: #FFEDD5;
-                            border-left: 4px solid #FB923C;
-                            border-top: none;
-                            border-right: none;
-                            border-bottom: none;
-                            border-radius: 8px;
-                        }}
-                    """)
-                elif event.type() == QEvent.Leave:
-                    self.setStyleSheet(f"""
-                        QFrame#scaleRowComparison {{
-                            background-color: #FFF7ED;
-                            border-left: 4px solid #FB923C;
-                            border-top: none;
-                            border-right: none;
-                            border-bottom: none;
-                            border-radius: 8px;
-                        }}
-                    """)
-        return super().eventFilter(obj, event)
-    
-    def set_value(self, text):
-        """Update the value label text."""
-        self.value_label.setText(text)
 
 
 class ReportCheckbox(QFrame):
@@ -614,9 +331,7 @@ class ReportCheckbox(QFrame):
         self.label.setObjectName("reportCheckboxLabel")
         label_color = default_theme.text_secondary if not enabled else default_theme.text_primary
         self.label.setStyleSheet(f"background-color: transparent; color: {label_color};")
-        label_font = QFont()
-        label_font.setPointSize(11)
-        self.label.setFont(label_font)
+        self.label.setFont(_get_font(11))
         
         # Status indicator for disabled items
         self.status_label = QLabel()
@@ -628,42 +343,10 @@ class ReportCheckbox(QFrame):
         row_layout.addWidget(self.label)
         row_layout.addStretch()
         row_layout.addWidget(self.status_label)
-        
-        # Install event filter for hover effect
-        self.installEventFilter(self)
     
     def _update_style(self):
         """Update frame style based on enabled state."""
-        if self._enabled:
-            self.setStyleSheet(f"""
-                QFrame#reportCheckboxRow {{
-                    background-color: {default_theme.row_bg_standard};
-                    border-radius: 6px;
-                    border: none;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QFrame#reportCheckboxRow {{
-                    background-color: {default_theme.button_default_bg};
-                    border-radius: 6px;
-                    border: none;
-                }}
-            """)
-    
-    def eventFilter(self, obj, event):
-        """Handle hover events."""
-        if obj == self and self._enabled:
-            if event.type() == QEvent.Enter:
-                self.setStyleSheet(f"""
-                    QFrame#reportCheckboxRow {{
-                        background-color: {default_theme.row_bg_hover};
-                        border-radius: 6px;
-                    }}
-                """)
-            elif event.type() == QEvent.Leave:
-                self._update_style()
-        return super().eventFilter(obj, event)
+        self.setStyleSheet(_CHECKBOX_ROW_QSS if self._enabled else _CHECKBOX_ROW_DISABLED_QSS)
     
     def is_checked(self):
         """Return whether the checkbox is checked."""
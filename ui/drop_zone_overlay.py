@@ -8,6 +8,52 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QPainter, QColor, QPen
 
 
+# Overlay stylesheets, built once; the primary label swaps between the idle and
+# dragging variants on every drag enter/leave
+_OVERLAY_QSS = """
+    DropZoneOverlay {
+        background-color: #ffffff;
+    }
+"""
+
+_PRIMARY_LABEL_QSS = """
+    QLabel {
+        font-size: 18px;
+        font-weight: 600;
+        color: #1a1a2e;
+        background: transparent;
+    }
+"""
+
+_PRIMARY_LABEL_DRAGGING_QSS = """
+    QLabel {
+        font-size: 18px;
+        font-weight: 600;
+        color: #4299e1;
+        background: transparent;
+    }
+"""
+
+_SECONDARY_LABEL_QSS = """
+    QLabel {
+        font-size: 14px;
+        font-weight: 400;
+        color: #4a5568;
+        background: transparent;
+    }
+"""
+
+_HELPER_LABEL_QSS = """
+    QLabel {
+        font-size: 11px;
+        font-weight: 400;
+        color: #a0aec0;
+        background: transparent;
+        margin-top: 8px;
+    }
+"""
+
+
 class DropZoneOverlay(QWidget):
     """
     A passive drag-and-drop overlay inside the 3D viewer area.
@@ -32,11 +78,7 @@ class DropZoneOverlay(QWidget):
     def _init_ui(self):
         """Initialize the overlay UI."""
         self.setAttribute(Qt.WA_TranslucentBackground, False)
-        self.setStyleSheet("""
-            DropZoneOverlay {
-                background-color: #ffffff;
-            }
-        """)
+        self.setStyleSheet(_OVERLAY_QSS)
         
         # Main layout
         layout = QVBoxLayout(self)
@@ -47,39 +89,17 @@ class DropZoneOverlay(QWidget):
         # Primary text
         self.primary_label = QLabel("Drag & drop your 3D file here")
         self.primary_label.setAlignment(Qt.AlignCenter)
-        self.primary_label.setStyleSheet("""
-            QLabel {
-                font-size: 18px;
-                font-weight: 600;
-                color: #1a1a2e;
-                background: transparent;
-            }
-        """)
+        self.primary_label.setStyleSheet(_PRIMARY_LABEL_QSS)
         
         # Secondary text
         self.secondary_label = QLabel("or click anywhere in this area to upload")
         self.secondary_label.setAlignment(Qt.AlignCenter)
-        self.secondary_label.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                font-weight: 400;
-                color: #4a5568;
-                background: transparent;
-            }
-        """)
+        self.secondary_label.setStyleSheet(_SECONDARY_LABEL_QSS)
         
         # Helper text
         self.helper_label = QLabel("STL, STEP, 3DM, OBJ & IGES files · Max 50 MB")
         self.helper_label.setAlignment(Qt.AlignCenter)
-        self.helper_label.setStyleSheet("""
-            QLabel {
-                font-size: 11px;
-                font-weight: 400;
-                color: #a0aec0;
-                background: transparent;
-                margin-top: 8px;
-            }
-        """)
+        self.helper_label.setStyleSheet(_HELPER_LABEL_QSS)
         
         layout.addStretch()
         layout.addWidget(self.primary_label)
@@ -171,24 +191,10 @@ class DropZoneOverlay(QWidget):
         """Update the text labels based on drag state."""
         if is_dragging:
             self.primary_label.setText("Release to load your file")
-            self.primary_label.setStyleSheet("""
-                QLabel {
-                    font-size: 18px;
-                    font-weight: 600;
-                    color: #4299e1;
-                    background: transparent;
-                }
-            """)
+            self.primary_label.setStyleSheet(_PRIMARY_LABEL_DRAGGING_QSS)
         else:
             self.primary_label.setText("Drag & drop your 3D file here")
-            self.primary_label.setStyleSheet("""
-                QLabel {
-                    font-size: 18px;
-                    font-weight: 600;
-                    color: #1a1a2e;
-                    background: transparent;
-                }
-            """)
+            self.primary_label.setStyleSheet(_PRIMARY_LABEL_QSS)
     
     def setCursor(self, cursor):
         """Override to always show pointer cursor."""
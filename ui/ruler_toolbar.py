@@ -5,12 +5,68 @@ import logging
 from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QLabel, QPushButton, QFrame
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QEvent
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont
 from ui.styles import default_theme
 
 logger = logging.getLogger(__name__)
 
+# Ruler view button stylesheet. The active button carries the dynamic
+# property active=true; only inactive buttons react to :hover.
+_VIEW_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {default_theme.row_bg_standard};
+        color: {default_theme.text_primary};
+        border: 1px solid transparent;
+        border-radius: 6px;
+        padding: 4px 12px;
+        font-size: 11px;
+    }}
+    QPushButton:hover {{
+        background-color: {default_theme.row_bg_hover};
+        border: 1px solid {default_theme.border_light};
+    }}
+    QPushButton[active="true"], QPushButton[active="true"]:hover {{
+        background-color: {default_theme.button_primary};
+        color: {default_theme.text_white};
+        border: none;
+        font-weight: 500;
+    }}
+"""
+
+# Toolbar and label stylesheets, built once at import
+_RULER_TOOLBAR_QSS = f"""
+    QWidget {{
+        background-color: {default_theme.row_bg_highlight};
+        border-bottom: 1px solid {default_theme.border_highlight};
+    }}
+"""
+_MODE_LABEL_QSS = f"""
+    color: {default_theme.text_primary};
+    font-size: 11px;
+    font-weight: bold;
+    background: transparent;
+"""
+_HINT_LABEL_QSS = f"""
+    color: {default_theme.text_secondary};
+    font-size: 10px;
+    background: transparent;
+"""
+_EXIT_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {default_theme.button_default_bg};
+        color: {default_theme.text_primary};
+        border: 1px solid {default_theme.border_light};
+        border-radius: 6px;
+        padding: 4px 12px;
+        font-size: 11px;
+    }}
+    QPushButton:hover {{
+        background-color: {default_theme.row_bg_hover};
+        border: 1px solid {default_theme.border_medium};
+    }}
+"""
+
 
 class RulerViewButton(QPushButton):
     """Styled button for ruler view selection."""
@@ -22,62 +78,18 @@ class RulerViewButton(QPushButton):
         self.setCursor(Qt.PointingHandCursor)
         self.setFixedHeight(26)
         self.setMinimumWidth(60)
-        self._apply_default_style()
-        self.installEventFilter(self)
-    
-    def _apply_default_style(self):
-        """Apply default button style."""
-        if self._is_active:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {default_theme.button_primary};
-                    color: {default_theme.text_white};
-                    border: none;
-                    border-radius: 6px;
-                    padding: 4px 12px;
-                    font-size: 11px;
-                    font-weight: 500;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {default_theme.row_bg_standard};
-                    color: {default_theme.text_primary};
-                    border: 1px solid transparent;
-                    border-radius: 6px;
-                    padding: 4px 12px;
-                    font-size: 11px;
-                }}
-            """)
-    
-    def _apply_hover_style(self):
-        """Apply hover style."""
-        if not self._is_active:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {default_theme.row_bg_hover};
-                    color: {default_theme.text_primary};
-                    border: 1px solid {default_theme.border_light};
-                    border-radius: 6px;
-                    padding: 4px 12px;
-                    font-size: 11px;
-                }}
-            """)
+        self.setProperty("active", False)
+        self.setStyleSheet(_VIEW_BUTTON_QSS)
     
     def set_active(self, active):
         """Set the active state of the button."""
+        if active == self._is_active:
+            return
         self._is_active = active
-        self._apply_default_style()
-    
-    def eventFilter(self, obj, event):
-        """Handle hover events."""
-        if obj == self:
-            if event.type() == QEvent.Enter:
-                self._apply_hover_style()
-            elif event.type() == QEvent.Leave:
-                self._apply_default_style()
-        return super().eventFilter(obj, event)
+        self.setProperty("active", active)
+        # Re-evaluate the [active] selector
+        self.style().unpolish(self)
+        self.style().polish(self)
 
 
 class RulerToolbar(QWidget):
@@ -108,21 +120,11 @@ class RulerToolbar(QWidget):
         layout.setSpacing(8)
         
         # Container frame for styling
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {default_theme.row_bg_highlight};
-                border-bottom: 1px solid {default_theme.border_highlight};
-            }}
-        """)
+        self.setStyleSheet(_RULER_TOOLBAR_QSS)
         
         # Mode indicator
         mode_label = QLabel("📐 Measure Mode")
-        mode_label.setStyleSheet(f"""
-            color: {default_theme.text_primary};
-            font-size: 11px;
-            font-weight: bold;
-            background: transparent;
-        """)
+        mode_label.setStyleSheet(_MODE_LABEL_QSS)
         layout.addWidget(mode_label)
         
         # Separator
@@ -135,11 +137,7 @@ class RulerToolbar(QWidget):
         
         # Instruction label
         instruction_label = QLabel("Click two points to measure")
-        instruction_label.setStyleSheet(f"""
-            color: {default_theme.text_secondary};
-            font-size: 10px;
-            background: transparent;
-        """)
+        instruction_label.setStyleSheet(_HINT_LABEL_QSS)
         layout.addWidget(instruction_label)
         
         # Spacer
@@ -147,11 +145,7 @@ class RulerToolbar(QWidget):
         
         # View buttons
         view_label = QLabel("View:")
-        view_label.setStyleSheet(f"""
-            color: {default_theme.text_secondary};
-            font-size: 10px;
-            background: transparent;
-        """)
+        view_label.setStyleSheet(_HINT_LABEL_QSS)
         layout.addWidget(view_label)
         
         self.front_btn = RulerViewButton("Front")
@@ -196,20 +190,7 @@ class RulerToolbar(QWidget):
         self.exit_btn = QPushButton("✕ Exit")
         self.exit_btn.setCursor(Qt.PointingHandCursor)
         self.exit_btn.setFixedHeight(26)
-        self.exit_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {default_theme.button_default_bg};
-                color: {default_theme.text_primary};
-                border: 1px solid {default_theme.border_light};
-                border-radius: 6px;
-                padding: 4px 12px;
-                font-size: 11px;
-            }}
-            QPushButton:hover {{
-                background-color: {default_theme.row_bg_hover};
-                border: 1px solid {default_theme.border_medium};
-            }}
-        """)
+        self.exit_btn.setStyleSheet(_EXIT_BUTTON_QSS)
         self.exit_btn.clicked.connect(self._on_exit_clicked)
         layout.addWidget(self.exit_btn)
         
@@ -9,14 +9,12 @@ from PyQt5.QtWidgets import (
     QScrollArea, QFrame, QComboBox, QSizePolicy, QGraphicsDropShadowEffect,
     QLineEdit, QFileDialog, QMessageBox, QApplication
 )
-from PyQt5.QtCore import Qt, QEvent, pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QColor, QDoubleValidator
-from ui.components import DimensionRow, SurfaceAreaRow, WeightRow, Separator, ScaleResultRow, ReportCheckbox
-from ui.styles import get_button_style, default_theme
+from ui.components import _get_font, DimensionRow, SurfaceAreaRow, WeightRow, Separator, ScaleResultRow, ReportCheckbox
 
 logger = logging.getLogger(__name__)
 
-
 class SidebarPanel(QWidget):
     """Left sidebar panel with upload controls and information sections."""
     
@@ -55,6 +53,11 @@ class SidebarPanel(QWidget):
         ("Emerald", 2.75),
         ("Quartz", 2.65),
     ]
+    # MATERIALS split into parallel columns: lookups by combo index read these,
+    # and the densities are passed together to compute every weight at once.
+    # Plain tuples keep NumPy out of the import path until a mesh is loaded.
+    MATERIAL_NAMES = tuple(name for name, _ in MATERIALS)
+    MATERIAL_DENSITIES = tuple(density for _, density in MATERIALS)
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -66,7 +69,27 @@ class SidebarPanel(QWidget):
         self.current_stl_filename = ""
         self.has_stl_loaded = False
         self.has_scaled_data = False
+        # Weight in grams of the current volume in each material, and that volume
+        self._material_weights = None
+        self._material_weights_volume = None
+        # (mesh_data, filename) last shown, to skip refreshes that change nothing
+        self._last_mesh_update = None
         self.init_ui()
+        
+        # Rows refreshed from mesh data: (row, mesh_data key, bound formatter).
+        # Units are static labels on the rows, so only the digits are formatted.
+        format_2dp = "{:.2f}".format
+        self._mesh_value_rows = (
+            (self.width_row, 'width', format_2dp),
+            (self.height_row, 'height', format_2dp),
+            (self.depth_row, 'depth', format_2dp),
+            (self.volume_row, 'volume_mm3', format_2dp),
+            (self.surface_total_row, 'surface_area_mm2', format_2dp),
+            (self.surface_cm_row, 'surface_area_cm2', format_2dp),
+            (self.weight_volume_row, 'volume_cm3', "{:.4f}".format),
+        )
+        # Last raw value shown per mesh_data key
+        self._row_values = {}
     
     def _add_card_shadow(self, card):
         """Add a subtle shadow effect to a card."""
@@ -88,22 +111,9 @@ class SidebarPanel(QWidget):
         scroll_area.setFrameShape(QFrame.NoFrame)
         scroll_area.setMinimumWidth(350)
         
-        # Style scroll area
-        scroll_area.setStyleSheet(f"""
-            QScrollArea#sidebarScrollArea {{
-                background-color: {default_theme.background};
-                border: none;
-            }}
-            QScrollArea#sidebarScrollArea > QWidget > QWidget {{
-                background-color: {default_theme.background};
-            }}
-        """)
-        scroll_area.viewport().setStyleSheet(f"background-color: {default_theme.background};")
-        
         # Create content widget
         content_widget = QWidget()
         content_widget.setObjectName("sidebarContent")
-        content_widget.setStyleSheet(f"background-color: {default_theme.background};")
         content_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
         
         layout = QVBoxLayout(content_widget)
@@ -124,7 +134,6 @@ class SidebarPanel(QWidget):
         self.upload_btn = QPushButton("Upload 3D File")
         self.upload_btn.setMinimumHeight(50)
         self.upload_btn.setObjectName("uploadBtn")
-        self.upload_btn.setStyleSheet(get_button_style("uploadBtn"))
         self.upload_btn.setToolTip("Upload STL, STEP, 3DM, OBJ, or IGES file for 3D visualization")
         layout.addWidget(self.upload_btn)
         
@@ -178,17 +187,14 @@ class SidebarPanel(QWidget):
         
         # Card title
         title_label = QLabel("Dimensions")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet(f"color: {default_theme.text_title}; margin-bottom: 4px;")
+        title_label.setFont(_get_font(14, bold=True))
+        title_label.setObjectName("cardTitle")
         card_layout.addWidget(title_label)
         
         # Dimension rows using components
-        self.width_row = DimensionRow("Length (X)", "--", self)
-        self.height_row = DimensionRow("Width (Y)", "--", self)
-        self.depth_row = DimensionRow("Height (Z)", "--", self)
+        self.width_row = DimensionRow("Length (X)", "--", self, unit="mm")
+        self.height_row = DimensionRow("Width (Y)", "--", self, unit="mm")
+        self.depth_row = DimensionRow("Height (Z)", "--", self, unit="mm")
         
         card_layout.addWidget(self.width_row)
         card_layout.addWidget(self.height_row)
@@ -199,7 +205,7 @@ class SidebarPanel(QWidget):
         card_layout.addWidget(separator)
         
         # Volume row
-        self.volume_row = DimensionRow("Volume", "--", self)
+        self.volume_row = DimensionRow("Volume", "--", self, unit="mm³")
         card_layout.addWidget(self.volume_row)
         
         # Add shadow effect
@@ -222,14 +228,11 @@ class SidebarPanel(QWidget):
         header_layout.setSpacing(8)
         
         title_label = QLabel("Total Surface Area")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet(f"color: {default_theme.text_title}; margin-bottom: 4px;")
+        title_label.setFont(_get_font(14, bold=True))
+        title_label.setObjectName("cardTitle")
         
         icon_label = QLabel("⬇")
-        icon_label.setStyleSheet(f"color: {default_theme.icon_blue}; font-size: 16px;")
+        icon_label.setObjectName("cardIcon")
         icon_label.setAlignment(Qt.AlignCenter)
         
         header_layout.addWidget(title_label)
@@ -238,8 +241,8 @@ class SidebarPanel(QWidget):
         card_layout.addLayout(header_layout)
         
         # Surface area rows using components
-        self.surface_total_row = SurfaceAreaRow("Total area", "--", "standard", self)
-        self.surface_cm_row = SurfaceAreaRow("Area (cm²)", "--", "highlight", self)
+        self.surface_total_row = SurfaceAreaRow("Total area", "--", "standard", self, unit="mm²")
+        self.surface_cm_row = SurfaceAreaRow("Area (cm²)", "--", "highlight", self, unit="cm²")
         
         card_layout.addWidget(self.surface_total_row)
         card_layout.addWidget(self.surface_cm_row)
@@ -255,15 +258,13 @@ class SidebarPanel(QWidget):
         footer_layout.setSpacing(8)
         
         info_icon = QLabel("ℹ️")
-        info_icon.setStyleSheet(f"color: {default_theme.icon_info_gray}; font-size: 12px;")
+        info_icon.setObjectName("footerIcon")
         info_icon.setFixedWidth(20)
         info_icon.setAlignment(Qt.AlignTop)
         
         disclaimer = QLabel("Calculated surface area: Sum of the areas of all triangles in the 3D mesh. Useful for estimating galvanizing or surface treatment costs.")
-        disclaimer_font = QFont()
-        disclaimer_font.setPointSize(9)
-        disclaimer.setFont(disclaimer_font)
-        disclaimer.setStyleSheet(f"color: {default_theme.icon_info_gray};")
+        disclaimer.setFont(_get_font(9))
+        disclaimer.setObjectName("footerText")
         disclaimer.setWordWrap(True)
         
         footer_layout.addWidget(info_icon)
@@ -292,14 +293,11 @@ class SidebarPanel(QWidget):
         header_layout.setSpacing(8)
         
         title_label = QLabel("Estimated Weight")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet(f"color: {default_theme.text_title}; margin-bottom: 4px;")
+        title_label.setFont(_get_font(14, bold=True))
+        title_label.setObjectName("cardTitle")
         
         icon_label = QLabel("⚖")
-        icon_label.setStyleSheet(f"color: {default_theme.icon_blue}; font-size: 16px;")
+        icon_label.setObjectName("cardIcon")
         icon_label.setAlignment(Qt.AlignCenter)
         
         header_layout.addWidget(title_label)
@@ -311,13 +309,20 @@ class SidebarPanel(QWidget):
         self.material_combo = QComboBox()
         self.material_combo.setObjectName("materialCombo")
         self.material_combo.setMinimumHeight(40)
-        for material_name, density in self.MATERIALS:
-            self.material_combo.addItem(f"{material_name} ({density} g/cm³)", density)
+        # Insert all entries in one model update, then attach each density
+        self.material_combo.addItems(
+            [f"{material_name} ({density} g/cm³)" for material_name, density in self.MATERIALS]
+        )
+        for index, density in enumerate(self.MATERIAL_DENSITIES):
+            self.material_combo.setItemData(index, density)
+        # Every entry is one line of text, so the popup can size all rows from
+        # the first one instead of asking each item for its size hint
+        self.material_combo.view().setUniformItemSizes(True)
         self.material_combo.currentIndexChanged.connect(self.on_material_changed)
         card_layout.addWidget(self.material_combo)
         
         # Weight rows using components
-        self.weight_volume_row = WeightRow("Volume", "--", "standard", self)
+        self.weight_volume_row = WeightRow("Volume", "--", "standard", self, unit="cm³")
         self.weight_density_row = WeightRow("Density", "--", "standard", self)
         self.weight_result_row = WeightRow("Estimated weight", "--", "highlight", self)
         
@@ -336,15 +341,13 @@ class SidebarPanel(QWidget):
         footer_layout.setSpacing(8)
         
         info_icon = QLabel("ℹ️")
-        info_icon.setStyleSheet(f"color: {default_theme.icon_warning}; font-size: 12px;")
+        info_icon.setObjectName("warningIcon")
         info_icon.setFixedWidth(20)
         info_icon.setAlignment(Qt.AlignTop)
         
         disclaimer = QLabel("Actual Volume Calculated: Weight is estimated by multiplying volume (mm³ → cm³) by material density. Results may vary based on mesh accuracy and material purity.")
-        disclaimer_font = QFont()
-        disclaimer_font.setPointSize(9)
-        disclaimer.setFont(disclaimer_font)
-        disclaimer.setStyleSheet(f"color: {default_theme.icon_warning};")
+        disclaimer.setFont(_get_font(9))
+        disclaimer.setObjectName("warningText")
         disclaimer.setWordWrap(True)
         
         footer_layout.addWidget(info_icon)
@@ -372,14 +375,11 @@ class SidebarPanel(QWidget):
         header_layout.setSpacing(8)
         
         title_label = QLabel("Adjust to Target Weight")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet(f"color: {default_theme.text_title}; margin-bottom: 4px;")
+        title_label.setFont(_get_font(14, bold=True))
+        title_label.setObjectName("cardTitle")
         
         icon_label = QLabel("⚙")
-        icon_label.setStyleSheet(f"color: {default_theme.icon_blue}; font-size: 16px;")
+        icon_label.setObjectName("cardIcon")
         icon_label.setAlignment(Qt.AlignCenter)
         
         header_layout.addWidget(title_label)
@@ -403,7 +403,7 @@ class SidebarPanel(QWidget):
         self.target_weight_input.returnPressed.connect(self.calculate_scale)
         
         unit_label = QLabel("g")
-        unit_label.setStyleSheet(f"color: {default_theme.text_secondary}; font-weight: bold;")
+        unit_label.setObjectName("unitLabel")
         unit_label.setFixedWidth(20)
         
         input_layout.addWidget(self.target_weight_input)
@@ -415,27 +415,6 @@ class SidebarPanel(QWidget):
         self.calculate_scale_btn.setObjectName("calculateScaleBtn")
         self.calculate_scale_btn.setMinimumHeight(40)
         self.calculate_scale_btn.setEnabled(False)
-        self.calculate_scale_btn.setStyleSheet(f"""
-            QPushButton#calculateScaleBtn {{
-                background-color: {default_theme.button_primary};
-                color: {default_theme.text_white};
-                border: none;
-                border-radius: 8px;
-                padding: 10px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton#calculateScaleBtn:hover {{
-                background-color: {default_theme.button_primary_hover};
-            }}
-            QPushButton#calculateScaleBtn:pressed {{
-                background-color: {default_theme.button_primary_pressed};
-            }}
-            QPushButton#calculateScaleBtn:disabled {{
-                background-color: {default_theme.button_default_bg};
-                color: {default_theme.text_primary};
-            }}
-        """)
         self.calculate_scale_btn.clicked.connect(self.calculate_scale)
         card_layout.addWidget(self.calculate_scale_btn)
         
@@ -445,11 +424,8 @@ class SidebarPanel(QWidget):
         
         # Results section title
         results_label = QLabel("Scaled Results")
-        results_font = QFont()
-        results_font.setPointSize(11)
-        results_font.setBold(True)
-        results_label.setFont(results_font)
-        results_label.setStyleSheet(f"color: {default_theme.text_secondary}; margin-top: 4px;")
+        results_label.setFont(_get_font(11, bold=True))
+        results_label.setObjectName("sectionLabel")
         card_layout.addWidget(results_label)
         
         # Scale factor row
@@ -474,8 +450,8 @@ class SidebarPanel(QWidget):
         
         # Weight comparison title
         comparison_label = QLabel("Weight Comparison")
-        comparison_label.setFont(results_font)
-        comparison_label.setStyleSheet(f"color: {default_theme.text_secondary}; margin-top: 4px;")
+        comparison_label.setFont(_get_font(11, bold=True))
+        comparison_label.setObjectName("sectionLabel")
         card_layout.addWidget(comparison_label)
         
         # Weight comparison rows
@@ -489,27 +465,6 @@ class SidebarPanel(QWidget):
         self.export_scaled_btn.setObjectName("exportScaledBtn")
         self.export_scaled_btn.setMinimumHeight(44)
         self.export_scaled_btn.setEnabled(False)
-        self.export_scaled_btn.setStyleSheet(f"""
-            QPushButton#exportScaledBtn {{
-                background-color: #10B981;
-                color: {default_theme.text_white};
-                border: none;
-                border-radius: 8px;
-                padding: 10px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton#exportScaledBtn:hover {{
-                background-color: #059669;
-            }}
-            QPushButton#exportScaledBtn:pressed {{
-                background-color: #047857;
-            }}
-            QPushButton#exportScaledBtn:disabled {{
-                background-color: {default_theme.button_default_bg};
-                color: {default_theme.text_primary};
-            }}
-        """)
         self.export_scaled_btn.clicked.connect(self.export_scaled_stl_file)
         card_layout.addWidget(self.export_scaled_btn)
         
@@ -533,14 +488,11 @@ class SidebarPanel(QWidget):
         header_layout.setSpacing(8)
         
         title_label = QLabel("Export 3D PDF")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        title_label.setStyleSheet(f"color: {default_theme.text_title}; margin-bottom: 4px;")
+        title_label.setFont(_get_font(14, bold=True))
+        title_label.setObjectName("cardTitle")
         
         icon_label = QLabel("📐")
-        icon_label.setStyleSheet(f"color: {default_theme.icon_blue}; font-size: 16px;")
+        icon_label.setObjectName("cardIcon")
         icon_label.setAlignment(Qt.AlignCenter)
         
         header_layout.addWidget(title_label)
@@ -550,10 +502,7 @@ class SidebarPanel(QWidget):
         
         # Description
         desc_label = QLabel("Export interactive 3D PDF for Adobe Acrobat Reader.\nRotate, pan, and zoom the model inside the PDF.")
-        desc_font = QFont()
-        desc_font.setPointSize(11)
-        desc_label.setFont(desc_font)
-        desc_label.setStyleSheet(f"color: {default_theme.text_secondary};")
+        desc_label.setFont(_get_font(11))
         desc_label.setWordWrap(True)
         card_layout.addWidget(desc_label)
         
@@ -562,27 +511,6 @@ class SidebarPanel(QWidget):
         self.export_pdf_btn.setObjectName("exportPdfBtn")
         self.export_pdf_btn.setMinimumHeight(44)
         self.export_pdf_btn.setEnabled(False)
-        self.export_pdf_btn.setStyleSheet(f"""
-            QPushButton#exportPdfBtn {{
-                background-color: {default_theme.button_primary};
-                color: {default_theme.text_white};
-                border: none;
-                border-radius: 8px;
-                padding: 10px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }}
-            QPushButton#exportPdfBtn:hover {{
-                background-color: {default_theme.button_primary_hover};
-            }}
-            QPushButton#exportPdfBtn:pressed {{
-                background-color: {default_theme.button_primary_pressed};
-            }}
-            QPushButton#exportPdfBtn:disabled {{
-                background-color: {default_theme.button_default_bg};
-                color: {default_theme.text_primary};
-            }}
-        """)
         self.export_pdf_btn.clicked.connect(self.export_pdf_report)
         card_layout.addWidget(self.export_pdf_btn)
         
@@ -591,28 +519,19 @@ class SidebarPanel(QWidget):
         footer_frame.setObjectName("pdfReportFooter")
         footer_frame.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
         footer_frame.setMinimumHeight(36)
-        footer_frame.setStyleSheet(f"""
-            QFrame#pdfReportFooter {{
-                background-color: {default_theme.background};
-                border: 1px solid {default_theme.border_standard};
-                border-radius: 6px;
-            }}
-        """)
         
         footer_layout = QHBoxLayout(footer_frame)
         footer_layout.setContentsMargins(10, 6, 10, 6)
         footer_layout.setSpacing(8)
         
         info_icon = QLabel("ℹ️")
-        info_icon.setStyleSheet(f"color: {default_theme.icon_info_gray}; font-size: 11px;")
+        info_icon.setObjectName("footerIcon")
         info_icon.setFixedWidth(18)
         info_icon.setAlignment(Qt.AlignTop)
         
         disclaimer = QLabel("Requires Adobe Acrobat Reader for interactive 3D. Ensure VTK provides vtkU3DExporter (usually via 'pip install -U vtk').")
-        disclaimer_font = QFont()
-        disclaimer_font.setPointSize(9)
-        disclaimer.setFont(disclaimer_font)
-        disclaimer.setStyleSheet(f"color: {default_theme.icon_info_gray};")
+        disclaimer.setFont(_get_font(9))
+        disclaimer.setObjectName("footerText")
         disclaimer.setWordWrap(True)
         
         footer_layout.addWidget(info_icon)
@@ -626,18 +545,13 @@ class SidebarPanel(QWidget):
         
         return card
     
-    def eventFilter(self, obj, event):
-        """Handle hover events for rows."""
-        # Rows handle their own events, but we need to ensure they're installed
-        # The event filter is already installed on each row in create_*_section methods
-        return super().eventFilter(obj, event)
-    
     def on_material_changed(self, index):
         """Handle material selection change."""
-        if index < 0 or index >= len(self.MATERIALS):
+        # The density is stored on the combo item; None means no valid selection
+        density = self.material_combo.itemData(index)
+        if density is None:
             return
         
-        material_name, density = self.MATERIALS[index]
         self.weight_density_row.set_value(f"{density} g/cm³")
         self.calculate_weight()
     
@@ -650,15 +564,23 @@ class SidebarPanel(QWidget):
         
         if density_g_per_cm3 is None:
             index = self.material_combo.currentIndex()
-            if index < 0 or index >= len(self.MATERIALS):
+            if index < 0 or index >= len(self.MATERIAL_NAMES):
                 return
-            _, density_g_per_cm3 = self.MATERIALS[index]
+            # Weigh the volume in every material at once, so switching
+            # material only looks up the precomputed weight
+            if volume_mm3 != self._material_weights_volume:
+                self._material_weights = MeshCalculator.estimate_weights(
+                    volume_mm3, self.MATERIAL_DENSITIES
+                )
+                self._material_weights_volume = volume_mm3
+            weight_grams = float(self._material_weights[index])
+        else:
+            weight_grams = MeshCalculator.estimate_weight(volume_mm3, density_g_per_cm3)['grams']
         
-        result = MeshCalculator.estimate_weight(volume_mm3, density_g_per_cm3)
-        self.weight_result_row.set_value(result['display'])
+        self.weight_result_row.set_value(MeshCalculator.format_weight(weight_grams))
         
         # Store current weight for scaling calculations
-        self.current_weight_grams = result['grams']
+        self.current_weight_grams = weight_grams
         
         # Enable/disable calculate button based on whether we have valid data
         has_valid_weight = self.current_weight_grams > 0
@@ -695,6 +617,24 @@ class SidebarPanel(QWidget):
         scale_factor = scale_result['scale_factor']
         self.calculated_scale_factor = scale_factor
         
+        # Repaint the result rows once rather than after each value
+        self.setUpdatesEnabled(False)
+        try:
+            self._show_scale_results(scale_factor, target_weight)
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # Enable export button
+        self.export_scaled_btn.setEnabled(True)
+        
+        # Update state - scaled data now available
+        self.has_scaled_data = True
+        self.update_pdf_button_state()
+    
+    def _show_scale_results(self, scale_factor, target_weight):
+        """Fill the scale result rows for the given scale factor."""
+        from core.mesh_calculator import MeshCalculator
+        
         # Update scale factor display
         self.scale_factor_row.set_value(f"{scale_factor:.6f}")
         
@@ -727,13 +667,6 @@ class SidebarPanel(QWidget):
         
         self.original_weight_row.set_value(original_display)
         self.target_weight_row.set_value(target_display)
-        
-        # Enable export button
-        self.export_scaled_btn.setEnabled(True)
-        
-        # Update state - scaled data now available
-        self.has_scaled_data = True
-        self.update_pdf_button_state()
     
     def reset_scale_results(self):
         """Reset all scale result displays."""
@@ -774,16 +707,26 @@ class SidebarPanel(QWidget):
     
     def update_dimensions(self, mesh_data, filename=None):
         """Update all dimension displays with mesh data."""
-        from core.mesh_calculator import MeshCalculator
+        update = None if mesh_data is None else (dict(mesh_data), filename)
+        if update is not None and update == self._last_mesh_update:
+            # Same mesh shown again; keep the current weight and scale results
+            return
+        self._last_mesh_update = update
         
+        # The mesh rows, weight result and scale results all change together;
+        # suspend painting so the panel relayouts and repaints once
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_dimensions(mesh_data, filename)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _update_dimensions(self, mesh_data, filename):
+        """Apply mesh data to the panel; called with updates disabled."""
         if mesh_data is None:
-            self.width_row.set_value("--")
-            self.height_row.set_value("--")
-            self.depth_row.set_value("--")
-            self.volume_row.set_value("--")
-            self.surface_total_row.set_value("--")
-            self.surface_cm_row.set_value("--")
-            self.weight_volume_row.set_value("--")
+            for row, _, _ in self._mesh_value_rows:
+                row.set_value("--")
+            self._row_values.clear()
             self.current_volume_mm3 = 0.0
             self.current_dimensions = {'width': 0.0, 'height': 0.0, 'depth': 0.0}
             self.current_surface_area_cm2 = 0.0
@@ -799,11 +742,13 @@ class SidebarPanel(QWidget):
         if filename:
             self.current_stl_filename = os.path.basename(filename)
         
-        # Update dimensions
-        self.width_row.set_value(f"{mesh_data['width']:.2f} mm")
-        self.height_row.set_value(f"{mesh_data['height']:.2f} mm")
-        self.depth_row.set_value(f"{mesh_data['depth']:.2f} mm")
-        self.volume_row.set_value(f"{mesh_data['volume_mm3']:.2f} mm³")
+        # Update dimension, surface area and volume rows
+        # Only reformat and repaint rows whose value actually changed
+        for row, key, format_value in self._mesh_value_rows:
+            value = mesh_data[key]
+            if self._row_values.get(key) != value:
+                self._row_values[key] = value
+                row.set_number(format_value(value))
         
         # Store current dimensions
         self.current_dimensions = {
@@ -812,20 +757,16 @@ class SidebarPanel(QWidget):
             'depth': mesh_data['depth']
         }
         
-        # Update surface area
-        self.surface_total_row.set_value(f"{mesh_data['surface_area_mm2']:.2f} mm²")
-        self.surface_cm_row.set_value(f"{mesh_data['surface_area_cm2']:.2f} cm²")
+        # Store surface area
         self.current_surface_area_cm2 = mesh_data['surface_area_cm2']
         self.has_stl_loaded = True
         
         # Update weight calculator
         self.current_volume_mm3 = mesh_data['volume_mm3']
-        self.weight_volume_row.set_value(f"{mesh_data['volume_cm3']:.4f} cm³")
         
         # Update density display
-        index = self.material_combo.currentIndex()
-        if index >= 0 and index < len(self.MATERIALS):
-            _, density = self.MATERIALS[index]
+        density = self.material_combo.currentData()
+        if density is not None:
             self.weight_density_row.set_value(f"{density} g/cm³")
         
         # Calculate weight
@@ -928,10 +869,5 @@ class SidebarPanel(QWidget):
     
     def _get_current_mesh(self):
         """Get the current mesh from the viewer widget."""
-        # Navigate up to find the main window and get mesh from viewer
-        parent = self.parent()
-        while parent is not None:
-            if hasattr(parent, 'viewer_widget') and hasattr(parent.viewer_widget, 'current_mesh'):
-                return parent.viewer_widget.current_mesh
-            parent = parent.parent()
-        return None
+        # The main window exposes the viewer's mesh; None outside of it
+        return getattr(self.window(), 'current_mesh', None)
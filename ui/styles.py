@@ -81,6 +81,20 @@ def get_global_stylesheet(theme=None):
         QMainWindow {{
             background-color: {theme.background};
         }}
+        QWidget#centralWidget {{
+            background-color: {theme.background};
+        }}
+        QSplitter#mainSplitter {{
+            background-color: {theme.background};
+        }}
+        QScrollArea#sidebarScrollArea {{
+            background-color: {theme.background};
+            border: none;
+        }}
+        QScrollArea#sidebarScrollArea > QWidget#qt_scrollarea_viewport,
+        QWidget#sidebarContent {{
+            background-color: {theme.background};
+        }}
         * {{
             font-family: {FONTS['family']};
         }}
@@ -131,6 +145,37 @@ def get_global_stylesheet(theme=None):
         QLabel#dimensionValue {{
             color: {theme.text_primary};
         }}
+        /* Sidebar card headers, section labels and footer notes */
+        QLabel#cardTitle {{
+            color: {theme.text_title};
+            margin-bottom: 4px;
+        }}
+        QLabel#cardIcon {{
+            color: {theme.icon_blue};
+            font-size: 16px;
+        }}
+        QLabel#sectionLabel {{
+            color: {theme.text_secondary};
+            margin-top: 4px;
+        }}
+        QLabel#unitLabel {{
+            color: {theme.text_secondary};
+            font-weight: bold;
+        }}
+        QLabel#footerIcon {{
+            color: {theme.icon_info_gray};
+            font-size: 12px;
+        }}
+        QLabel#footerText {{
+            color: {theme.icon_info_gray};
+        }}
+        QLabel#warningIcon {{
+            color: {theme.icon_warning};
+            font-size: 12px;
+        }}
+        QLabel#warningText {{
+            color: {theme.icon_warning};
+        }}
         QFrame#dimensionsCard {{
             background-color: {theme.card_background};
             border-radius: 12px;
@@ -140,6 +185,9 @@ def get_global_stylesheet(theme=None):
             background-color: {theme.row_bg_standard};
             border-radius: 8px;
         }}
+        QFrame#dimensionRow:hover {{
+            background-color: {theme.row_bg_hover};
+        }}
         QFrame#surfaceAreaCard {{
             background-color: {theme.card_background};
             border-radius: 12px;
@@ -149,6 +197,9 @@ def get_global_stylesheet(theme=None):
             background-color: {theme.row_bg_standard};
             border-radius: 8px;
         }}
+        QFrame#surfaceRowStandard:hover {{
+            background-color: {theme.row_bg_hover};
+        }}
         QFrame#surfaceRowHighlight {{
             background-color: {theme.row_bg_highlight};
             border-left: 4px solid {theme.border_highlight};
@@ -157,6 +208,9 @@ def get_global_stylesheet(theme=None):
             border-bottom: none;
             border-radius: 8px;
         }}
+        QFrame#surfaceRowHighlight:hover {{
+            background-color: {theme.row_bg_highlight_hover};
+        }}
         QFrame#surfaceFooter {{
             background-color: {theme.background};
             border: 1px solid {theme.border_standard};
@@ -177,11 +231,17 @@ def get_global_stylesheet(theme=None):
             background-color: {theme.row_bg_standard};
             border-radius: 8px;
         }}
+        QFrame#weightRowStandard:hover {{
+            background-color: {theme.row_bg_hover};
+        }}
         QFrame#weightRowHighlight {{
             background-color: {theme.row_bg_highlight};
             border: 1px solid {theme.border_highlight};
             border-radius: 8px;
         }}
+        QFrame#weightRowHighlight:hover {{
+            background-color: {theme.row_bg_highlight_hover};
+        }}
         QFrame#weightFooter {{
             background-color: {theme.footer_warning_bg};
             border: 1px solid {theme.footer_warning_border};
@@ -293,7 +353,7 @@ def get_global_stylesheet(theme=None):
         }}
         QPushButton#calculateScaleBtn:disabled {{
             background-color: {theme.button_default_bg};
-            color: {theme.text_secondary};
+            color: {theme.text_primary};
         }}
         QPushButton#exportScaledBtn {{
             background-color: #10B981;
@@ -312,7 +372,7 @@ def get_global_stylesheet(theme=None):
         }}
         QPushButton#exportScaledBtn:disabled {{
             background-color: {theme.button_default_bg};
-            color: {theme.text_secondary};
+            color: {theme.text_primary};
         }}
         QFrame#pdfReportCard {{
             background-color: {theme.card_background};
@@ -325,7 +385,7 @@ def get_global_stylesheet(theme=None):
             border: none;
         }}
         QPushButton#exportPdfBtn {{
-            background-color: #6366F1;
+            background-color: {theme.button_primary};
             color: {theme.text_white};
             border: none;
             border-radius: 8px;
@@ -334,14 +394,22 @@ def get_global_stylesheet(theme=None):
             font-weight: bold;
         }}
         QPushButton#exportPdfBtn:hover {{
-            background-color: #4F46E5;
+            background-color: {theme.button_primary_hover};
         }}
         QPushButton#exportPdfBtn:pressed {{
-            background-color: #4338CA;
+            background-color: {theme.button_primary_pressed};
         }}
         QPushButton#exportPdfBtn:disabled {{
             background-color: {theme.button_default_bg};
-            color: {theme.text_secondary};
+            color: {theme.text_primary};
+        }}
+        QFrame#pdfReportFooter {{
+            background-color: {theme.background};
+            border: 1px solid {theme.border_standard};
+            border-radius: 6px;
+        }}
+        QFrame#pdfReportFooter QLabel#footerIcon {{
+            font-size: 11px;
         }}
         /* QMessageBox styling - ensure proper colors on Windows and macOS */
         QMessageBox {{
@@ -387,6 +455,11 @@ def get_global_stylesheet(theme=None):
     """
 
 
+# Global stylesheet for the default theme, assembled once at import so it can
+# be installed on the QApplication without rebuilding the string
+GLOBAL_STYLESHEET = get_global_stylesheet()
+
+
 def get_button_style(object_name="uploadBtn", theme=None):
     """Get button-specific stylesheet."""
     if theme is None:
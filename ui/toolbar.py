@@ -4,14 +4,50 @@ Top horizontal toolbar for 3D view controls.
 import logging
 from PyQt5.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QLabel,
-    QSizePolicy, QFrame, QSpacerItem, QApplication
+    QSizePolicy, QFrame, QApplication
 )
-from PyQt5.QtCore import Qt, QEvent, pyqtSignal, QPropertyAnimation, QEasingCurve, QSettings
-from PyQt5.QtGui import QFont, QFontMetrics
+from PyQt5.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QSettings
+from PyQt5.QtGui import QFontMetrics
+from ui.components import _get_font
 from ui.styles import default_theme
 
 logger = logging.getLogger(__name__)
 
+# Gap in pixels between toolbar button groups
+_GROUP_SPACING = 16
+
+# Toolbar button stylesheet covering every state. Active buttons carry the
+# dynamic property active=true; hover and disabled are QSS pseudo-states.
+_TOOLBAR_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {default_theme.row_bg_standard};
+        border: 1px solid transparent;
+        border-radius: 6px;
+    }}
+    QPushButton:enabled:hover {{
+        background-color: {default_theme.row_bg_hover};
+        border: 1px solid {default_theme.border_light};
+    }}
+    QPushButton[active="true"] {{
+        background-color: {default_theme.row_bg_highlight};
+        border: 1px solid {default_theme.border_highlight};
+    }}
+    QPushButton[active="true"]:enabled:hover {{
+        background-color: {default_theme.row_bg_highlight_hover};
+        border: 1px solid {default_theme.border_highlight};
+    }}
+    QPushButton:disabled {{
+        background-color: {default_theme.button_default_bg};
+        border: 1px solid transparent;
+    }}
+"""
+
+_TOOLBAR_CONTAINER_QSS = f"""
+    QFrame#toolbarContainer {{
+        background-color: {default_theme.card_background};
+        border-bottom: 1px solid {default_theme.border_standard};
+    }}
+"""
 
 class ToolbarButton(QPushButton):
     """A styled toolbar button with icon and text."""
@@ -37,9 +73,7 @@ class ToolbarButton(QPushButton):
         # Text label
         self.text_label = QLabel(label_text)
         self.text_label.setStyleSheet(f"color: {default_theme.text_primary}; font-size: 10px; background: transparent;")
-        label_font = QFont()
-        label_font.setPointSize(10)
-        self.text_label.setFont(label_font)
+        self.text_label.setFont(_get_font(10))
         self.text_label.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Fixed)
         self._layout.addWidget(self.text_label)
         
@@ -50,9 +84,9 @@ class ToolbarButton(QPushButton):
         self.setMinimumHeight(28)
         self.setMaximumHeight(28)
         
-        self._apply_default_style()
+        self.setProperty("active", False)
+        self.setStyleSheet(_TOOLBAR_BUTTON_QSS)
         self._update_min_width()
-        self.installEventFilter(self)
 
     def _update_min_width(self):
         """Ensure the button is wide enough to show its full label."""
@@ -80,60 +114,13 @@ class ToolbarButton(QPushButton):
         self.setFixedWidth(min_width)
         self.text_label.setMinimumWidth(label_w)
     
-    def _apply_default_style(self):
-        """Apply the default button style."""
-        if self._is_active:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {default_theme.row_bg_highlight};
-                    border: 1px solid {default_theme.border_highlight};
-                    border-radius: 6px;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {default_theme.row_bg_standard};
-                    border: 1px solid transparent;
-                    border-radius: 6px;
-                }}
-            """)
-    
-    def _apply_hover_style(self):
-        """Apply the hover style."""
-        if self._is_active:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {default_theme.row_bg_highlight_hover};
-                    border: 1px solid {default_theme.border_highlight};
-                    border-radius: 6px;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {default_theme.row_bg_hover};
-                    border: 1px solid {default_theme.border_light};
-                    border-radius: 6px;
-                }}
-            """)
-    
-    def _apply_disabled_style(self):
-        """Apply disabled style."""
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {default_theme.button_default_bg};
-                border: 1px solid transparent;
-                border-radius: 6px;
-            }}
-        """)
-        self.icon_label.setStyleSheet(f"color: {default_theme.text_secondary}; font-size: 14px; background: transparent;")
-        self.text_label.setStyleSheet(f"color: {default_theme.text_secondary}; font-size: 11px; background: transparent;")
-    
     def set_active(self, active):
         """Set the active state of the button."""
         self._is_active = active
-        self._apply_default_style()
+        # Re-polish so the [active="true"] rules are re-evaluated
+        self.setProperty("active", active)
+        self.style().unpolish(self)
+        self.style().polish(self)
     
     def set_label(self, text):
         """Update the button label text."""
@@ -146,26 +133,15 @@ class ToolbarButton(QPushButton):
         self.icon_text = icon_text
         self.icon_label.setText(icon_text)
     
-    def eventFilter(self, obj, event):
-        """Handle hover events."""
-        if obj == self:
-            if not self.isEnabled():
-                return super().eventFilter(obj, event)
-            if event.type() == QEvent.Enter:
-                self._apply_hover_style()
-            elif event.type() == QEvent.Leave:
-                self._apply_default_style()
-        return super().eventFilter(obj, event)
-    
     def setEnabled(self, enabled):
         """Override setEnabled to update styling."""
         super().setEnabled(enabled)
         if enabled:
-            self._apply_default_style()
             self.icon_label.setStyleSheet(f"color: {default_theme.icon_blue}; font-size: 14px; background: transparent;")
             self.text_label.setStyleSheet(f"color: {default_theme.text_primary}; font-size: 11px; background: transparent;")
         else:
-            self._apply_disabled_style()
+            self.icon_label.setStyleSheet(f"color: {default_theme.text_secondary}; font-size: 14px; background: transparent;")
+            self.text_label.setStyleSheet(f"color: {default_theme.text_secondary}; font-size: 11px; background: transparent;")
 
 
 class ViewControlsToolbar(QWidget):
@@ -213,12 +189,7 @@ class ViewControlsToolbar(QWidget):
         # Container frame for styling
         self.container = QFrame()
         self.container.setObjectName("toolbarContainer")
-        self.container.setStyleSheet(f"""
-            QFrame#toolbarContainer {{
-                background-color: {default_theme.card_background};
-                border-bottom: 1px solid {default_theme.border_standard};
-            }}
-        """)
+        self.container.setStyleSheet(_TOOLBAR_CONTAINER_QSS)
         
         container_layout = QVBoxLayout(self.container)
         container_layout.setContentsMargins(0, 0, 0, 0)
@@ -246,7 +217,7 @@ class ViewControlsToolbar(QWidget):
         content_layout.addWidget(self.wireframe_btn)
         
         # Spacer between groups
-        content_layout.addSpacerItem(QSpacerItem(16, 0, QSizePolicy.Fixed, QSizePolicy.Minimum))
+        content_layout.addSpacing(_GROUP_SPACING)
         
         # === View Orientation Controls ===
         self.reset_btn = ToolbarButton("↺", "Reset", "")
@@ -270,7 +241,7 @@ class ViewControlsToolbar(QWidget):
         content_layout.addWidget(self.top_btn)
         
         # Spacer between groups
-        content_layout.addSpacerItem(QSpacerItem(16, 0, QSizePolicy.Fixed, QSizePolicy.Minimum))
+        content_layout.addSpacing(_GROUP_SPACING)
         
         # === Utility Actions ===
         self.ruler_btn = ToolbarButton("📏", "Ruler", "Measure distances on the model")
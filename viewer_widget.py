@@ -1,7 +1,6 @@
 """
 3D Viewer Widget using PyVista for STL file visualization.
 """
-import sys
 import os
 import logging
 import pyvista as pv
@@ -17,21 +16,6 @@ os.environ.setdefault('PYVISTA_USE_PANEL', 'false')
 logger = logging.getLogger(__name__)
 
 
-def safe_flush(stream):
-    """Safely flush a stream, handling None (common in PyInstaller Windows builds)."""
-    if stream is not None:
-        try:
-            stream.flush()
-        except (AttributeError, OSError):
-            pass  # Stream may not support flush or may be closed
-
-
-# Print to stderr for immediate visibility
-def debug_print(msg):
-    print(f"[DEBUG] {msg}", file=sys.stderr)
-    safe_flush(sys.stderr)
-
-
 class STLViewerWidget(QWidget):
     """PyVista-based 3D viewer widget for displaying STL files."""
     
@@ -39,12 +23,12 @@ class STLViewerWidget(QWidget):
     file_dropped = pyqtSignal(str)
     click_to_upload = pyqtSignal()
     drop_error = pyqtSignal(str)
+    # Emitted once plotter initialization has run; True if it succeeded
+    plotter_ready = pyqtSignal(bool)
     
     def __init__(self, parent=None):
-        debug_print("STLViewerWidget: Initializing...")
         logger.info("STLViewerWidget: Initializing...")
         super().__init__(parent)
-        debug_print("STLViewerWidget: Parent initialized")
         logger.info("STLViewerWidget: Parent initialized")
         
         # Set up stacked layout for overlay
@@ -76,8 +60,15 @@ class STLViewerWidget(QWidget):
         self.current_mesh = None
         self.current_actor = None  # Track the mesh actor to remove it specifically
         self._initialized = False
+        self._init_failed = False
         self._model_loaded = False
         
+        # One timer drives the deferred plotter initialization and its retries,
+        # so repeated show events reschedule it instead of stacking callbacks
+        self._init_timer = QTimer(self)
+        self._init_timer.setSingleShot(True)
+        self._init_timer.timeout.connect(self._initialize_plotter)
+        
         # Ruler/measurement mode state
         self.ruler_mode = False
         self.measurement_points = []
@@ -95,190 +86,138 @@ class STLViewerWidget(QWidget):
         self._annotation_picker = None
         self._annotation_callback = None  # Callback when point is picked for annotation
 
-        debug_print("STLViewerWidget: Basic initialization complete, QtInteractor will be created after window is shown")
         logger.info("STLViewerWidget: Basic initialization complete, QtInteractor will be created after window is shown")
     
     def showEvent(self, event):
         """Initialize QtInteractor when widget is first shown."""
         super().showEvent(event)
         
-        if not self._initialized:
-            debug_print("STLViewerWidget: showEvent triggered, scheduling QtInteractor initialization...")
+        # An initialization already scheduled by initialize_soon is kept
+        if self.initialization_pending and not self._init_timer.isActive():
             logger.info("STLViewerWidget: showEvent triggered, scheduling QtInteractor initialization...")
             # Use QTimer with longer delay to ensure window is fully rendered
-            # Process events multiple times to ensure everything is ready
-            QTimer.singleShot(500, self._initialize_plotter)
+            self._init_timer.start(500)
+    
+    def initialize_soon(self):
+        """Initialize the plotter on the next event loop pass, skipping the show delay."""
+        if self.initialization_pending:
+            self._init_timer.start(0)
+    
+    @property
+    def initialization_pending(self):
+        """True until plotter initialization has either succeeded or failed."""
+        return not self._initialized and not self._init_failed
     
     def _initialize_plotter(self):
         """Initialize the PyVista plotter (called after window is shown)."""
         if self._initialized:
             return
         
-        # Process events before starting initialization
-        from PyQt5.QtWidgets import QApplication
-        QApplication.processEvents()
-        
         # Ensure widget is visible and has a window
         if not self.isVisible():
-            debug_print("STLViewerWidget: Widget not visible yet, retrying in 200ms...")
             logger.warning("STLViewerWidget: Widget not visible yet, retrying...")
-            QTimer.singleShot(200, self._initialize_plotter)
+            self._init_timer.start(200)
             return
         
         # Check if widget has a valid window handle
         if not self.window().isVisible():
-            debug_print("STLViewerWidget: Parent window not visible yet, retrying in 200ms...")
             logger.warning("STLViewerWidget: Parent window not visible yet, retrying...")
-            QTimer.singleShot(200, self._initialize_plotter)
+            self._init_timer.start(200)
             return
             
         try:
-            debug_print("STLViewerWidget: Starting plotter initialization...")
             logger.info("STLViewerWidget: Starting plotter initialization...")
-            logger.info(f"STLViewerWidget: PyVista version: {pv.__version__}")
-            debug_print(f"STLViewerWidget: PyVista version: {pv.__version__}")
-            debug_print(f"STLViewerWidget: Widget visible: {self.isVisible()}, Window visible: {self.window().isVisible()}")
-            logger.info(f"STLViewerWidget: Widget visible: {self.isVisible()}, Window visible: {self.window().isVisible()}")
-            safe_flush(sys.stderr)
-            
-            debug_print("STLViewerWidget: Creating QtInteractor (this may take a moment)...")
-            logger.info("STLViewerWidget: Creating QtInteractor (this may take a moment)...")
-            safe_flush(sys.stderr)
+            logger.debug(f"STLViewerWidget: PyVista version: {pv.__version__}")
+            logger.debug(f"STLViewerWidget: Widget visible: {self.isVisible()}, Window visible: {self.window().isVisible()}")
             
-            # Process events multiple times before creating QtInteractor
-            for _ in range(3):
-                QApplication.processEvents()
+            logger.debug("STLViewerWidget: Creating QtInteractor (this may take a moment)...")
             
             # Initialize PyVista plotter with Qt backend
-            # This might block, but we've processed events first
             self.plotter = QtInteractor(self.viewer_container)
             
-            debug_print("STLViewerWidget: QtInteractor created successfully")
-            logger.info("STLViewerWidget: QtInteractor created successfully")
-            safe_flush(sys.stderr)
-            
-            # Process events after QtInteractor creation
-            QApplication.processEvents()
+            logger.debug("STLViewerWidget: QtInteractor created successfully")
             
             # Add plotter to viewer container layout
             self.viewer_layout.addWidget(self.plotter.interactor)
-            QApplication.processEvents()
             
-            debug_print("STLViewerWidget: Configuring plotter settings...")
-            logger.info("STLViewerWidget: Configuring plotter settings...")
-            safe_flush(sys.stderr)
+            logger.debug("STLViewerWidget: Configuring plotter settings...")
             
             # Configure plotter for smooth interaction with large models
             try:
                 self.plotter.enable_anti_aliasing()
-                debug_print("STLViewerWidget: Anti-aliasing enabled")
-                logger.info("STLViewerWidget: Anti-aliasing enabled")
+                logger.debug("STLViewerWidget: Anti-aliasing enabled")
             except Exception as e:
-                debug_print(f"STLViewerWidget: Could not enable anti-aliasing: {e}")
                 logger.warning(f"STLViewerWidget: Could not enable anti-aliasing: {e}")
             
             # Shadows disabled to reduce excessive shadowing while preserving 3D look
             # try:
             #     self.plotter.enable_shadows()
-            #     debug_print("STLViewerWidget: Shadows enabled")
             #     logger.info("STLViewerWidget: Shadows enabled")
             # except Exception as e:
-            #     debug_print(f"STLViewerWidget: Could not enable shadows: {e}")
             #     logger.warning(f"STLViewerWidget: Could not enable shadows: {e}")
             
-            debug_print("STLViewerWidget: Initializing empty scene...")
-            logger.info("STLViewerWidget: Initializing empty scene...")
-            safe_flush(sys.stderr)
+            logger.debug("STLViewerWidget: Initializing empty scene...")
             
             # Initialize with empty scene - do this carefully to avoid hangs
             try:
                 self.plotter.background_color = 'white'
-                QApplication.processEvents()
-                debug_print("STLViewerWidget: Background color set")
-                logger.info("STLViewerWidget: Background color set")
+                logger.debug("STLViewerWidget: Background color set")
             except Exception as e:
-                debug_print(f"STLViewerWidget: Could not set background color: {e}")
                 logger.warning(f"STLViewerWidget: Could not set background color: {e}")
             
-            QApplication.processEvents()
-            
             # Add axes - this can sometimes hang, so do it carefully
             try:
-                debug_print("STLViewerWidget: Adding axes...")
-                logger.info("STLViewerWidget: Adding axes...")
-                safe_flush(sys.stderr)
+                logger.debug("STLViewerWidget: Adding axes...")
                 self.plotter.add_axes()
-                QApplication.processEvents()
-                debug_print("STLViewerWidget: Axes added")
-                logger.info("STLViewerWidget: Axes added")
+                logger.debug("STLViewerWidget: Axes added")
             except Exception as e:
-                debug_print(f"STLViewerWidget: Could not add axes: {e}")
                 logger.warning(f"STLViewerWidget: Could not add axes: {e}")
                 # Continue anyway - axes are optional
             
-            QApplication.processEvents()
-            
             # Don't force render immediately - let it render naturally
             # The render() call can block on macOS
-            debug_print("STLViewerWidget: Scene configured, will render on next event loop")
-            logger.info("STLViewerWidget: Scene configured, will render on next event loop")
+            logger.debug("STLViewerWidget: Scene configured, will render on next event loop")
             
-            debug_print("STLViewerWidget: Empty scene initialized")
-            logger.info("STLViewerWidget: Empty scene initialized")
+            logger.debug("STLViewerWidget: Empty scene initialized")
             
             self._initialized = True
-            debug_print("STLViewerWidget: QtInteractor initialization complete")
             logger.info("STLViewerWidget: QtInteractor initialization complete")
-            safe_flush(sys.stderr)
-            
-            # Final event processing - multiple times to ensure UI updates
-            for _ in range(5):
-                QApplication.processEvents()
             
-            # Update the widget to ensure it's visible
+            # Schedule one repaint; the event loop paints the new scene
             self.update()
-            self.repaint()
-            QApplication.processEvents()
             
-            debug_print("STLViewerWidget: All initialization complete, widget should be functional")
-            logger.info("STLViewerWidget: All initialization complete, widget should be functional")
-            safe_flush(sys.stderr)
+            logger.debug("STLViewerWidget: All initialization complete, widget should be functional")
             
         except Exception as e:
-            debug_print(f"STLViewerWidget: ERROR during plotter initialization: {e}")
             logger.error(f"STLViewerWidget: Error during plotter initialization: {e}", exc_info=True)
             import traceback
             traceback.print_exc()
             # Don't raise - allow the app to continue
+            self._init_failed = True
+        
+        self.plotter_ready.emit(self._initialized)
     
-    def load_stl(self, file_path):
+    def load_stl(self, file_path, mesh=None):
         """
         Load and display an STL or STEP file.
         
         Args:
             file_path (str): Path to the STL or STEP file
+            mesh: Mesh already read from file_path with MeshLoader.load_mesh
+                (e.g. by a background worker); the file is read here if None
             
         Returns:
             bool: True if successful, False otherwise
         """
         logger.info(f"load_stl: Starting to load file: {file_path}")
         
-        # Wait for plotter to be initialized if not ready
+        # Callers wait for plotter_ready before loading into a new viewer
         if not self._initialized or self.plotter is None:
-            logger.warning("load_stl: Plotter not initialized yet, waiting...")
-            # Wait a bit for initialization
-            from PyQt5.QtWidgets import QApplication
-            for _ in range(50):  # Wait up to 5 seconds
-                QApplication.processEvents()
-                if self._initialized and self.plotter is not None:
-                    break
-                import time
-                time.sleep(0.1)
-            
-            if not self._initialized or self.plotter is None:
-                logger.error("load_stl: Plotter failed to initialize")
-                return False
+            logger.error("load_stl: Plotter is not initialized")
+            return False
         
+        # Suspend repaints while the scene is rebuilt; it is rendered once below
+        self.setUpdatesEnabled(False)
         try:
             # Remove previous mesh actor if it exists (instead of clearing everything)
             if self.current_actor is not None:
@@ -303,170 +242,14 @@ class STLViewerWidget(QWidget):
                 # Restore renderer settings after clear
                 self._restore_renderer_settings()
             
-            # Detect file format and load accordingly
-            file_ext = file_path.lower()
-            if file_ext.endswith('.step') or file_ext.endswith('.stp'):
-                logger.info("load_stl: Detected STEP file, loading with StepLoader...")
-                from core.step_loader import StepLoader
-                try:
-                    mesh = StepLoader.load_step(file_path)
-                    logger.info(f"load_stl: STEP file loaded successfully. Mesh info: {mesh}")
-                except Exception as e:
-                    logger.error(f"load_stl: Failed to load STEP file: {e}", exc_info=True)
-                    raise
-            elif file_ext.endswith('.3dm'):
-                logger.info("load_stl: Detected 3DM file, loading with Rhino3dmLoader...")
-                from core.rhino3dm_loader import Rhino3dmLoader
-                try:
-                    mesh = Rhino3dmLoader.load_3dm(file_path)
-                    logger.info(f"load_stl: 3DM file loaded successfully. Mesh info: {mesh}")
-                except Exception as e:
-                    logger.error(f"load_stl: Failed to load 3DM file: {e}", exc_info=True)
-                    raise
-            elif file_ext.endswith('.obj'):
-                logger.info("load_stl: Detected OBJ file, attempting to load...")
-                mesh = None
-                load_error = None
-                
-                # Try PyVista first (fastest)
-                try:
-                    logger.info("load_stl: Trying PyVista OBJ reader...")
-                    mesh = pv.read(file_path)
-                    logger.info(f"load_stl: PyVista read completed. Mesh info: {mesh}")
-                    
-                    # Check if mesh is valid
-                    if mesh is not None and mesh.n_points > 0:
-                        logger.info("load_stl: PyVista successfully loaded OBJ file")
-                    else:
-                        logger.warning("load_stl: PyVista loaded empty mesh, trying meshio fallback...")
-                        mesh = None  # Will trigger fallback
-                except Exception as e:
-                    logger.warning(f"load_stl: PyVista failed to load OBJ: {e}, trying meshio fallback...")
-                    load_error = str(e)
-                    mesh = None
-                
-                # Fallback to meshio if PyVista failed or produced empty mesh
-                meshio_error = None
-                if mesh is None or mesh.n_points == 0:
-                    try:
-                        logger.info("load_stl: Trying meshio OBJ reader...")
-                        import meshio
-                        meshio_mesh = meshio.read(file_path)
-                        logger.info(f"load_stl: meshio read completed. Points: {len(meshio_mesh.points)}, Cells: {len(meshio_mesh.cells)}")
-                        
-                        # Convert meshio mesh to PyVista
-                        if len(meshio_mesh.points) == 0:
-                            raise ValueError("meshio loaded OBJ but found no points")
-                        
-                        points = meshio_mesh.points
-                        
-                        # Find triangle cells (most common for OBJ)
-                        cells = None
-                        cell_type = None
-                        for cell_block in meshio_mesh.cells:
-                            if cell_block.type == "triangle":
-                                cells = cell_block.data
-                                cell_type = "triangle"
-                                break
-                        
-                        # If no triangles, try other cell types
-                        if cells is None:
-                            if len(meshio_mesh.cells) > 0:
-                                cell_block = meshio_mesh.cells[0]
-                                cells = cell_block.data
-                                cell_type = cell_block.type
-                                logger.warning(f"load_stl: Using cell type {cell_type} (not triangles)")
-                            else:
-                                raise ValueError("meshio loaded OBJ but found no cells")
-                        
-                        # Create PyVista mesh
-                        if cell_type == "triangle":
-                            mesh = pv.PolyData(points, cells)
-                        else:
-                            # For other cell types, create UnstructuredGrid and extract surface
-                            unstructured = pv.UnstructuredGrid(cells, cell_type, points)
-                            mesh = unstructured.extract_surface()
-                        
-                        logger.info(f"load_stl: Converted meshio mesh to PyVista. Points: {mesh.n_points}, Cells: {mesh.n_cells}")
-                    except ImportError:
-                        meshio_error = "meshio is not available"
-                        logger.warning(f"load_stl: {meshio_error}, will try custom parser...")
-                    except ValueError as e:
-                        error_str = str(e)
-                        # Check if this is a texture coordinate mismatch error
-                        if "len(points)" in error_str and "point_data" in error_str:
-                            meshio_error = f"meshio texture coordinate mismatch: {error_str}"
-                            logger.warning(f"load_stl: {meshio_error}, will try custom parser...")
-                        else:
-                            # Other ValueError from meshio - re-raise
-                            meshio_error = error_str
-                            raise
-                    except Exception as e:
-                        meshio_error = str(e)
-                        logger.warning(f"load_stl: meshio failed: {meshio_error}, will try custom parser...")
-                
-                # Third fallback: custom OBJ parser for files with texture coordinate mismatches
-                if (mesh is None or mesh.n_points == 0) and meshio_error:
-                    try:
-                        logger.info("load_stl: Trying custom OBJ parser (handles texture coordinate mismatches)...")
-                        from core.obj_loader import ObjLoader
-                        mesh = ObjLoader.load_obj(file_path)
-                        logger.info(f"load_stl: Custom OBJ parser successfully loaded file. Points: {mesh.n_points}, Cells: {mesh.n_cells}")
-                    except ImportError:
-                        error_msg = "OBJ file could not be loaded. All loaders failed (PyVista, meshio, and custom parser unavailable)."
-                        if load_error:
-                            error_msg += f" PyVista error: {load_error}."
-                        if meshio_error:
-                            error_msg += f" meshio error: {meshio_error}."
-                        logger.error(f"load_stl: {error_msg}")
-                        raise ValueError(error_msg)
-                    except Exception as e:
-                        error_msg = "OBJ file could not be loaded with any available method (PyVista, meshio, or custom parser)."
-                        if load_error:
-                            error_msg += f" PyVista error: {load_error}."
-                        if meshio_error:
-                            error_msg += f" meshio error: {meshio_error}."
-                        error_msg += f" Custom parser error: {str(e)}"
-                        logger.error(f"load_stl: {error_msg}")
-                        raise ValueError(error_msg)
-                
-                # Final validation
-                if mesh is None or mesh.n_points == 0:
-                    error_msg = "OBJ file loaded but contains no geometry (zero points). The file may be corrupted or in an unsupported format."
-                    if load_error:
-                        error_msg += f" Reader error: {load_error}"
-                    logger.error(f"load_stl: {error_msg}")
-                    raise ValueError(error_msg)
-            elif file_ext.endswith('.iges') or file_ext.endswith('.igs'):
-                logger.info("load_stl: Detected IGES file, loading with IgesLoader...")
-                from core.iges_loader import IgesLoader
-                try:
-                    mesh = IgesLoader.load_iges(file_path)
-                    logger.info(f"load_stl: IGES file loaded successfully. Mesh info: {mesh}")
-                except Exception as e:
-                    logger.error(f"load_stl: Failed to load IGES file: {e}", exc_info=True)
-                    raise
-            else:
-                logger.info("load_stl: Reading STL file with PyVista...")
-                # Read STL file using PyVista
-                mesh = pv.read(file_path)
-                logger.info(f"load_stl: STL file read successfully. Mesh info: {mesh}")
+            # Read the file unless it was already read by the caller
+            if mesh is None:
+                from core.mesh_loader import MeshLoader
+                mesh = MeshLoader.load_mesh(file_path)
             
             # Check if this is the first mesh load (before we update current_mesh)
             is_first_load = (self.current_mesh is None)
             
-            # Validate mesh is not empty before proceeding
-            if mesh is None:
-                error_msg = "Failed to load mesh: file returned None. The file may be corrupted or in an unsupported format."
-                logger.error(f"load_stl: {error_msg}")
-                raise ValueError(error_msg)
-            
-            if mesh.n_points == 0:
-                error_msg = f"Loaded mesh contains no geometry (zero points). The file may be corrupted, empty, or in an unsupported format."
-                logger.error(f"load_stl: {error_msg}")
-                raise ValueError(error_msg)
-            
-            logger.info(f"load_stl: Mesh validated - {mesh.n_points} points, {mesh.n_cells} cells")
             
             # Store the original mesh BEFORE processing for rendering
             # This ensures volume calculations use the unmodified mesh
@@ -526,11 +309,10 @@ class STLViewerWidget(QWidget):
             logger.info("load_stl: Resetting camera...")
             # Fit view to show entire model
             self.plotter.reset_camera()
+            self.setUpdatesEnabled(True)
             
             # Force renderer update to ensure consistent appearance
             # Explicitly render on Windows to ensure detail is visible
-            from PyQt5.QtWidgets import QApplication
-            import sys
             try:
                 # Force render update, especially important on Windows
                 self.plotter.render()
@@ -538,7 +320,6 @@ class STLViewerWidget(QWidget):
             except Exception as e:
                 logger.warning(f"load_stl: Could not force render: {e}, continuing anyway")
             
-            QApplication.processEvents()
             logger.info("load_stl: STL file loaded successfully")
             
             # Hide overlay when model is loaded
@@ -548,6 +329,7 @@ class STLViewerWidget(QWidget):
             return True
             
         except Exception as e:
+            self.setUpdatesEnabled(True)
             logger.error(f"load_stl: Error loading STL file: {e}", exc_info=True)
             return False
     
@@ -1338,12 +1120,14 @@ class STLViewerWidget(QWidget):
             logger.error(f"add_annotation_marker: Failed: {e}", exc_info=True)
             return None
     
-    def update_annotation_marker_color(self, annotation_id: int, color: str):
+    def update_annotation_marker_color(self, annotation_id: int, color: str, render: bool = True):
         """Update the color of an annotation marker.
         
         Args:
             annotation_id: The annotation ID
             color: New color (hex string)
+            render: Render the scene afterwards; pass False when recoloring
+                several markers and render once at the end
         """
         for ann in self.annotations:
             if ann['id'] == annotation_id:
@@ -1351,7 +1135,8 @@ class STLViewerWidget(QWidget):
                     ann['actor'].GetProperty().SetColor(
                         *self._hex_to_rgb_normalized(color)
                     )
-                    self.plotter.render()
+                    if render:
+                        self.plotter.render()
                     logger.info(f"update_annotation_marker_color: Updated id={annotation_id} to {color}")
                 except Exception as e:
                     logger.warning(f"update_annotation_marker_color: Failed: {e}")
@@ -2,7 +2,6 @@
 Alternative 3D Viewer Widget using PyVista offscreen rendering.
 This is a fallback for when QtInteractor doesn't work on macOS.
 """
-import sys
 import os
 import logging
 import numpy as np
@@ -15,26 +14,10 @@ import io
 logger = logging.getLogger(__name__)
 
 
-def safe_flush(stream):
-    """Safely flush a stream, handling None (common in PyInstaller Windows builds)."""
-    if stream is not None:
-        try:
-            stream.flush()
-        except (AttributeError, OSError):
-            pass  # Stream may not support flush or may be closed
-
-
-# Print to stderr for immediate visibility
-def debug_print(msg):
-    print(f"[DEBUG] {msg}", file=sys.stderr)
-    safe_flush(sys.stderr)
-
-
 class STLViewerWidgetOffscreen(QWidget):
     """PyVista-based 3D viewer widget using offscreen rendering."""
     
     def __init__(self, parent=None):
-        debug_print("STLViewerWidgetOffscreen: Initializing...")
         logger.info("STLViewerWidgetOffscreen: Initializing...")
         super().__init__(parent)
         
@@ -47,7 +30,6 @@ class STLViewerWidgetOffscreen(QWidget):
             except:
                 pass  # xvfb not available (e.g., on macOS), that's okay
         except Exception as e:
-            debug_print(f"STLViewerWidgetOffscreen: Could not set offscreen mode: {e}")
             logger.warning(f"STLViewerWidgetOffscreen: Could not set offscreen mode: {e}")
         
         # Set up layout
@@ -90,30 +72,32 @@ class STLViewerWidgetOffscreen(QWidget):
         self.current_mesh = None
         self.rotation_angle = 0
         
+        # Single-shot timer that coalesces bursts of resize events into one re-render
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(self._render_scene)
+        
         # Initialize plotter
         self._initialize_plotter()
         
-        debug_print("STLViewerWidgetOffscreen: Initialization complete")
         logger.info("STLViewerWidgetOffscreen: Initialization complete")
     
     def _initialize_plotter(self):
         """Initialize the offscreen plotter."""
         try:
-            debug_print("STLViewerWidgetOffscreen: Creating offscreen plotter...")
             logger.info("STLViewerWidgetOffscreen: Creating offscreen plotter...")
             
             # Create offscreen plotter
             self.plotter = pv.Plotter(off_screen=True, window_size=[800, 600])
             self.plotter.background_color = 'white'
             
-            debug_print("STLViewerWidgetOffscreen: Offscreen plotter created")
             logger.info("STLViewerWidgetOffscreen: Offscreen plotter created")
             
             # Render empty scene
             self._render_scene()
             
         except Exception as e:
-            debug_print(f"STLViewerWidgetOffscreen: ERROR during initialization: {e}")
             logger.error(f"STLViewerWidgetOffscreen: Error during initialization: {e}", exc_info=True)
             self.image_label.setText(f"Error initializing 3D viewer: {str(e)}")
     
@@ -142,15 +126,16 @@ class STLViewerWidgetOffscreen(QWidget):
             self.image_label.setText("")  # Clear text
             
         except Exception as e:
-            debug_print(f"STLViewerWidgetOffscreen: Error rendering scene: {e}")
             logger.error(f"STLViewerWidgetOffscreen: Error rendering scene: {e}", exc_info=True)
     
-    def load_stl(self, file_path):
+    def load_stl(self, file_path, mesh=None):
         """
         Load and display an STL or STEP file.
         
         Args:
             file_path (str): Path to the STL or STEP file
+            mesh: Mesh already read from file_path with MeshLoader.load_mesh
+                (e.g. by a background worker); the file is read here if None
             
         Returns:
             bool: True if successful, False otherwise
@@ -161,167 +146,10 @@ class STLViewerWidgetOffscreen(QWidget):
             if self.current_mesh is not None:
                 self.plotter.clear()
             
-            # Detect file format and load accordingly
-            file_ext = file_path.lower()
-            if file_ext.endswith('.step') or file_ext.endswith('.stp'):
-                logger.info("load_stl: Detected STEP file, loading with StepLoader...")
-                from core.step_loader import StepLoader
-                try:
-                    mesh = StepLoader.load_step(file_path)
-                    logger.info(f"load_stl: STEP file loaded successfully. Mesh info: {mesh}")
-                except Exception as e:
-                    logger.error(f"load_stl: Failed to load STEP file: {e}", exc_info=True)
-                    raise
-            elif file_ext.endswith('.3dm'):
-                logger.info("load_stl: Detected 3DM file, loading with Rhino3dmLoader...")
-                from core.rhino3dm_loader import Rhino3dmLoader
-                try:
-                    mesh = Rhino3dmLoader.load_3dm(file_path)
-                    logger.info(f"load_stl: 3DM file loaded successfully. Mesh info: {mesh}")
-                except Exception as e:
-                    logger.error(f"load_stl: Failed to load 3DM file: {e}", exc_info=True)
-                    raise
-            elif file_ext.endswith('.obj'):
-                logger.info("load_stl: Detected OBJ file, attempting to load...")
-                mesh = None
-                load_error = None
-                
-                # Try PyVista first (fastest)
-                try:
-                    logger.info("load_stl: Trying PyVista OBJ reader...")
-                    mesh = pv.read(file_path)
-                    logger.info(f"load_stl: PyVista read completed. Mesh info: {mesh}")
-                    
-                    # Check if mesh is valid
-                    if mesh is not None and mesh.n_points > 0:
-                        logger.info("load_stl: PyVista successfully loaded OBJ file")
-                    else:
-                        logger.warning("load_stl: PyVista loaded empty mesh, trying meshio fallback...")
-                        mesh = None  # Will trigger fallback
-                except Exception as e:
-                    logger.warning(f"load_stl: PyVista failed to load OBJ: {e}, trying meshio fallback...")
-                    load_error = str(e)
-                    mesh = None
-                
-                # Fallback to meshio if PyVista failed or produced empty mesh
-                meshio_error = None
-                if mesh is None or mesh.n_points == 0:
-                    try:
-                        logger.info("load_stl: Trying meshio OBJ reader...")
-                        import meshio
-                        meshio_mesh = meshio.read(file_path)
-                        logger.info(f"load_stl: meshio read completed. Points: {len(meshio_mesh.points)}, Cells: {len(meshio_mesh.cells)}")
-                        
-                        # Convert meshio mesh to PyVista
-                        if len(meshio_mesh.points) == 0:
-                            raise ValueError("meshio loaded OBJ but found no points")
-                        
-                        points = meshio_mesh.points
-                        
-                        # Find triangle cells (most common for OBJ)
-                        cells = None
-                        cell_type = None
-                        for cell_block in meshio_mesh.cells:
-                            if cell_block.type == "triangle":
-                                cells = cell_block.data
-                                cell_type = "triangle"
-                                break
-                        
-                        # If no triangles, try other cell types
-                        if cells is None:
-                            if len(meshio_mesh.cells) > 0:
-                                cell_block = meshio_mesh.cells[0]
-                                cells = cell_block.data
-                                cell_type = cell_block.type
-                                logger.warning(f"load_stl: Using cell type {cell_type} (not triangles)")
-                            else:
-                                raise ValueError("meshio loaded OBJ but found no cells")
-                        
-                        # Create PyVista mesh
-                        if cell_type == "triangle":
-                            mesh = pv.PolyData(points, cells)
-                        else:
-                            # For other cell types, create UnstructuredGrid and extract surface
-                            unstructured = pv.UnstructuredGrid(cells, cell_type, points)
-                            mesh = unstructured.extract_surface()
-                        
-                        logger.info(f"load_stl: Converted meshio mesh to PyVista. Points: {mesh.n_points}, Cells: {mesh.n_cells}")
-                    except ImportError:
-                        meshio_error = "meshio is not available"
-                        logger.warning(f"load_stl: {meshio_error}, will try custom parser...")
-                    except ValueError as e:
-                        error_str = str(e)
-                        # Check if this is a texture coordinate mismatch error
-                        if "len(points)" in error_str and "point_data" in error_str:
-                            meshio_error = f"meshio texture coordinate mismatch: {error_str}"
-                            logger.warning(f"load_stl: {meshio_error}, will try custom parser...")
-                        else:
-                            # Other ValueError from meshio - re-raise
-                            meshio_error = error_str
-                            raise
-                    except Exception as e:
-                        meshio_error = str(e)
-                        logger.warning(f"load_stl: meshio failed: {meshio_error}, will try custom parser...")
-                
-                # Third fallback: custom OBJ parser for files with texture coordinate mismatches
-                if (mesh is None or mesh.n_points == 0) and meshio_error:
-                    try:
-                        logger.info("load_stl: Trying custom OBJ parser (handles texture coordinate mismatches)...")
-                        from core.obj_loader import ObjLoader
-                        mesh = ObjLoader.load_obj(file_path)
-                        logger.info(f"load_stl: Custom OBJ parser successfully loaded file. Points: {mesh.n_points}, Cells: {mesh.n_cells}")
-                    except ImportError:
-                        error_msg = "OBJ file could not be loaded. All loaders failed (PyVista, meshio, and custom parser unavailable)."
-                        if load_error:
-                            error_msg += f" PyVista error: {load_error}."
-                        if meshio_error:
-                            error_msg += f" meshio error: {meshio_error}."
-                        logger.error(f"load_stl: {error_msg}")
-                        raise ValueError(error_msg)
-                    except Exception as e:
-                        error_msg = "OBJ file could not be loaded with any available method (PyVista, meshio, or custom parser)."
-                        if load_error:
-                            error_msg += f" PyVista error: {load_error}."
-                        if meshio_error:
-                            error_msg += f" meshio error: {meshio_error}."
-                        error_msg += f" Custom parser error: {str(e)}"
-                        logger.error(f"load_stl: {error_msg}")
-                        raise ValueError(error_msg)
-                
-                # Final validation
-                if mesh is None or mesh.n_points == 0:
-                    error_msg = "OBJ file loaded but contains no geometry (zero points). The file may be corrupted or in an unsupported format."
-                    if load_error:
-                        error_msg += f" Reader error: {load_error}"
-                    logger.error(f"load_stl: {error_msg}")
-                    raise ValueError(error_msg)
-            elif file_ext.endswith('.iges') or file_ext.endswith('.igs'):
-                logger.info("load_stl: Detected IGES file, loading with IgesLoader...")
-                from core.iges_loader import IgesLoader
-                try:
-                    mesh = IgesLoader.load_iges(file_path)
-                    logger.info(f"load_stl: IGES file loaded successfully. Mesh info: {mesh}")
-                except Exception as e:
-                    logger.error(f"load_stl: Failed to load IGES file: {e}", exc_info=True)
-                    raise
-            else:
-                logger.info("load_stl: Reading STL file with PyVista...")
-                # Read STL file using PyVista
-                mesh = pv.read(file_path)
-                logger.info(f"load_stl: STL file read successfully. Mesh info: {mesh}")
-            
-            # Validate mesh is not empty before proceeding
+            # Read the file unless it was already read by the caller
             if mesh is None:
-                error_msg = "Failed to load mesh: file returned None. The file may be corrupted or in an unsupported format."
-                logger.error(f"load_stl: {error_msg}")
-                raise ValueError(error_msg)
-            
-            if mesh.n_points == 0:
-                error_msg = f"Loaded mesh contains no geometry (zero points). The file may be corrupted, empty, or in an unsupported format."
-                logger.error(f"load_stl: {error_msg}")
-                raise ValueError(error_msg)
-            
-            logger.info(f"load_stl: Mesh validated - {mesh.n_points} points, {mesh.n_cells} cells")
+                from core.mesh_loader import MeshLoader
+                mesh = MeshLoader.load_mesh(file_path)
             
             # Store the original mesh BEFORE processing for rendering
             # This ensures volume calculations use the unmodified mesh
@@ -425,5 +253,6 @@ class STLViewerWidgetOffscreen(QWidget):
         """Handle resize events to update the displayed image."""
         super().resizeEvent(event)
         if self.plotter is not None and self.current_mesh is not None:
-            # Re-render on resize
-            QTimer.singleShot(100, self._render_scene)
+            # Re-render on resize; events arriving while a render is pending are dropped
+            if not self._resize_timer.isActive():
+                self._resize_timer.start()